@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark des scripts LGPD sur des catalogues synthétiques.
+
+Chronomètre, pour chaque taille de catalogue :
+- classify : classify-lgpd.py (extraction des noms + classification + JSON, sans cache de build)
+- apply : apply-lgpd-changes.py puis apply-remaining-lgpd.py
+- descriptions : update_descriptions.py
+
+Les passes apply et descriptions travaillent sur une copie du catalogue.
+Les résultats sont écrits en JSON pour comparer les runs entre eux.
+
+Usage:
+    python3 scripts/benchmark_lgpd.py --sizes 1000 10000 --output benchmark-results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from generate_catalog import write_catalog
+from lgpd_scripts import load_script
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def timed(function, *args) -> float:
+    """Exécute une fonction en silence (stdout capturé) et retourne sa durée en secondes."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        function(*args)
+    return time.perf_counter() - start
+
+
+def benchmark_catalog(catalog: Path, work_dir: Path, repeat: int) -> dict:
+    """Mesure les trois passes sur un catalogue (meilleur temps sur `repeat` essais)."""
+    classify = load_script("classify-lgpd.py")
+    apply_main = load_script("apply-lgpd-changes.py")
+    apply_remaining = load_script("apply-remaining-lgpd.py")
+    descriptions = load_script("update_descriptions.py")
+
+    copy = work_dir / "software-list.ts"
+    timings = {"classify": [], "apply": [], "descriptions": []}
+
+    for _ in range(repeat):
+        timings["classify"].append(timed(classify.process_software_file, catalog, work_dir / "classifications.json", None, False))
+
+        shutil.copyfile(catalog, copy)
+        timings["apply"].append(
+            timed(apply_main.apply_changes, copy) + timed(apply_remaining.apply_changes, copy)
+        )
+
+        shutil.copyfile(catalog, copy)
+        timings["descriptions"].append(timed(descriptions.update_descriptions, copy))
+
+    return {phase: round(min(values), 4) for phase, values in timings.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des scripts LGPD sur catalogues synthétiques")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="tailles de catalogue (ex: 1000 10000 100000 1000000)")
+    parser.add_argument("--repeat", type=int, default=1, help="nombre d'essais par mesure (meilleur temps retenu)")
+    parser.add_argument("--catalogs", type=Path, default=None,
+                        help="dossier des catalogues générés (réutilisés entre runs, temporaire par défaut)")
+    parser.add_argument("--output", type=Path, default=None, help="fichier JSON des résultats (stdout par défaut)")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        catalogs_dir = args.catalogs or Path(tmp) / "catalogs"
+        work_dir = Path(tmp) / "work"
+        work_dir.mkdir()
+
+        for size in args.sizes:
+            catalog = write_catalog(size, catalogs_dir)
+            timings = benchmark_catalog(catalog, work_dir, args.repeat)
+            results.append({"size": size, "bytes": catalog.stat().st_size, "seconds": timings})
+            print(f"✅ {size:>9,} entrées: " + ", ".join(f"{k} {v:.3f}s" for k, v in timings.items()),
+                  file=sys.stderr)
+
+    report = {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+        print(f"Résultats sauvegardés dans: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
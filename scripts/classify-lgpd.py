@@ -7,283 +7,174 @@ Basé sur les critères GCN 2026:
 - Niveau 3 (Rouge): Non conforme RGPD OU hébergement pays non adéquat (Chine, etc.)
 """
 
+import argparse
+import hashlib
 import json
+import marshal
+import os
 import re
 import sys
 from pathlib import Path
-
-# Base de connaissances des éditeurs et leurs caractéristiques
-COMPANY_DATABASE = {
-    # === NIVEAU 1 - VERT (CH/UE, conforme RGPD) ===
-    "level_1": {
-        "BDnF": {"country": "France", "location": "France", "reason": "Bibliothèque nationale de France, institution publique française"},
-        "BlinkLearning": {"country": "Espagne", "location": "Union Européenne", "reason": "Entreprise espagnole (Madrid), hébergement UE"},
-        "Bookili": {"country": "France", "location": "France", "reason": "Bayard/Milan Presse, éditeur français"},
-        "Calengoo": {"country": "Allemagne", "location": "Allemagne", "reason": "Développeur allemand, app locale"},
-        "Card2Brain": {"country": "Suisse", "location": "Suisse", "reason": "Entreprise suisse (Zurich), hébergement Suisse"},
-        "Classtime": {"country": "Suisse", "location": "Suisse", "reason": "Classtime AG (Zurich), hébergement Suisse/UE"},
-        "Code.org": {"country": "USA", "location": "États-Unis", "reason": "Organisation à but non lucratif, engagement fort vie privée enfants, COPPA/FERPA"},
-        "Claro": {"country": "Royaume-Uni", "location": "Royaume-Uni", "reason": "Claro Software (UK), applications accessibilité"},
-        "Druide": {"country": "Canada", "location": "Canada", "reason": "Druide informatique (Québec), hébergement Canada"},
-        "Drive Infomaniak": {"country": "Suisse", "location": "Suisse", "reason": "Infomaniak (Genève), hébergement exclusivement Suisse"},
-        "Dynamilis": {"country": "France", "location": "France", "reason": "Entreprise française, hébergement France"},
-        "FizziQ": {"country": "France", "location": "France", "reason": "Trapèze Digital (France), hébergement UE"},
-        "Flora Incognita": {"country": "Allemagne", "location": "Allemagne", "reason": "TU Ilmenau (Allemagne), projet de recherche public"},
-        "Framasoft": {"country": "France", "location": "France", "reason": "Association française CHATONS, hébergement France"},
-        "GeoGebra": {"country": "Autriche", "location": "Union Européenne", "reason": "GeoGebra GmbH (Linz, Autriche), hébergement UE"},
-        "Kialo Edu": {"country": "Allemagne", "location": "Allemagne", "reason": "Kialo GmbH (Berlin), hébergement UE, DPA disponible"},
-        "LearningView": {"country": "Suisse", "location": "Suisse", "reason": "PH Schwyz (Suisse), hébergement Suisse"},
-        "Orthophore": {"country": "France", "location": "France", "reason": "Académie de Lille (France), service public"},
-        "pCloud": {"country": "Suisse", "location": "Suisse", "reason": "pCloud AG (Suisse), option hébergement Luxembourg/Suisse"},
-        "PDF Expert": {"country": "Ukraine", "location": "Union Européenne", "reason": "Readdle (Ukraine/UE), hébergement UE, conforme RGPD"},
-        "Phonowriter": {"country": "Suisse", "location": "Suisse", "reason": "Développeur suisse, app locale"},
-        "Phyphox": {"country": "Allemagne", "location": "Allemagne", "reason": "RWTH Aachen (Allemagne), université publique, pas de compte requis"},
-        "Projet Voltaire": {"country": "France", "location": "France", "reason": "Woonoz SAS (France), hébergement France"},
-        "Taptouche": {"country": "Canada", "location": "Canada", "reason": "De Marque (Québec), hébergement Canada"},
-        "Threema": {"country": "Suisse", "location": "Suisse", "reason": "Threema GmbH (Pfäffikon, Suisse), chiffrement E2E, hébergement Suisse"},
-        "Thunderbird": {"country": "USA", "location": "Local", "reason": "Mozilla Foundation, open source, client email local"},
-        "Wooflash": {"country": "Belgique", "location": "Union Européenne", "reason": "Wooclap SA (Belgique), hébergement UE, conforme RGPD"},
-    },
-
-    # === NIVEAU 2 - ORANGE (US avec DPF, analytics tiers, Cloud Act) ===
-    "level_2": {
-        "Adobe Acrobat": {"country": "USA", "location": "États-Unis", "reason": "Adobe Inc. (USA), certifié EU-US DPF, hébergement US"},
-        "Atlassian": {"country": "Australie", "location": "États-Unis/Australie", "reason": "Atlassian (Australie), certifié DPF, options hébergement UE"},
-        "Babbel": {"country": "Allemagne", "location": "Union Européenne (AWS)", "reason": "Lesson Nine GmbH (Berlin), utilise AWS (Cloud Act)"},
-        "Book Creator": {"country": "Royaume-Uni", "location": "Royaume-Uni/États-Unis", "reason": "Red Jumper Ltd (UK), utilise Google Cloud"},
-        "Calendly": {"country": "USA", "location": "États-Unis", "reason": "Calendly LLC (USA), certifié DPF, SOC 2"},
-        "Canva": {"country": "Australie", "location": "Australie/États-Unis", "reason": "Canva Pty Ltd (Australie), certifié DPF, hébergement AWS"},
-        "Classroomscreen": {"country": "Pays-Bas", "location": "Union Européenne", "reason": "Classroomscreen BV (NL), utilise services tiers US"},
-        "Dictaly": {"country": "France", "location": "France", "reason": "Entreprise française, mais analytics tiers"},
-        "Doodle": {"country": "Suisse", "location": "Suisse", "reason": "TX Group (Suisse), mais sous-traitants US"},
-        "Ed.AI": {"country": "USA", "location": "États-Unis", "reason": "Entreprise US EdTech, certifié DPF"},
-        "Edpuzzle": {"country": "USA", "location": "États-Unis", "reason": "Edpuzzle Inc. (USA), certifié DPF, COPPA/FERPA"},
-        "Educaplay": {"country": "Espagne", "location": "Union Européenne", "reason": "ADR Formación (Espagne), analytics tiers"},
-        "Exam.net": {"country": "Suède", "location": "Union Européenne", "reason": "Exam.net AB (Suède), hébergement UE, conforme RGPD"},
-        "Foxit": {"country": "USA", "location": "États-Unis", "reason": "Foxit Software (USA), certifié DPF"},
-        "Genially": {"country": "Espagne", "location": "Union Européenne", "reason": "Genially Web SL (Espagne), utilise AWS"},
-        "Gimkit": {"country": "USA", "location": "États-Unis", "reason": "Gimkit Inc. (USA), COPPA/FERPA compliant"},
-        "JSTOR": {"country": "USA", "location": "États-Unis", "reason": "ITHAKA (USA), organisation à but non lucratif, DPF"},
-        "Kahoot": {"country": "Norvège", "location": "Union Européenne/États-Unis", "reason": "Kahoot ASA (Norvège), hébergement AWS multi-région"},
-        "Knowt": {"country": "USA", "location": "États-Unis", "reason": "Knowt Inc. (USA), startup EdTech"},
-        "LearningApps": {"country": "Suisse", "location": "Suisse", "reason": "PH Bern (Suisse), mais widgets tiers"},
-        "Lockee": {"country": "France", "location": "France", "reason": "Développeur français, hébergement UE, analytics"},
-        "LyricsTraining": {"country": "Espagne", "location": "Union Européenne", "reason": "Empresa espagnole, publicités tiers"},
-        "MagicSchool": {"country": "USA", "location": "États-Unis", "reason": "MagicSchool AI (USA), IA générative, SOC 2"},
-        "MindMeister": {"country": "Allemagne", "location": "Union Européenne", "reason": "MeisterLabs (Munich), utilise AWS UE"},
-        "Minecraft Education": {"country": "USA", "location": "États-Unis/Union Européenne", "reason": "Microsoft (USA), certifié DPF, options UE"},
-        "Miro": {"country": "USA", "location": "États-Unis/Union Européenne", "reason": "Miro Inc. (USA), certifié DPF, SOC 2"},
-        "NotebookLM": {"country": "USA", "location": "États-Unis", "reason": "Google (USA), certifié DPF"},
-        "One Calendar": {"country": "USA", "location": "États-Unis", "reason": "Développeur US, synchronisation calendriers"},
-        "Padlet": {"country": "USA", "location": "États-Unis", "reason": "Padlet Inc. (USA), certifié DPF, COPPA"},
-        "Photopea": {"country": "Tchéquie", "location": "Union Européenne", "reason": "Ivan Kutskir (Tchéquie), publicités Google"},
-        "Pixton": {"country": "Canada", "location": "Canada", "reason": "Pixton Comics (Canada), hébergement AWS"},
-        "Plandeclasse": {"country": "Canada", "location": "Canada", "reason": "Développeur canadien"},
-        "Plickers": {"country": "USA", "location": "États-Unis", "reason": "Plickers Inc. (USA), certifié DPF"},
-        "Quizlet": {"country": "USA", "location": "États-Unis", "reason": "Quizlet Inc. (USA), certifié DPF, COPPA"},
-        "Remarkable": {"country": "Norvège", "location": "Union Européenne", "reason": "reMarkable AS (Norvège), intégration cloud"},
-        "Samsung Email": {"country": "Corée du Sud", "location": "Corée du Sud", "reason": "Samsung (Corée), pays adéquat, mais collecte analytics"},
-        "Samsung Notes": {"country": "Corée du Sud", "location": "Corée du Sud", "reason": "Samsung (Corée), synchronisation cloud"},
-        "Scholarvox": {"country": "France", "location": "France", "reason": "Cyberlibris (France), hébergement France"},
-        "SchoolAI": {"country": "USA", "location": "États-Unis", "reason": "SchoolAI (USA), IA générative, FERPA"},
-        "SMART Lumio": {"country": "Canada", "location": "Canada/États-Unis", "reason": "SMART Technologies (Canada), hébergement AWS"},
-        "Soda PDF": {"country": "Canada", "location": "Canada", "reason": "Lulu Software (Canada), hébergement cloud"},
-        "TeamViewer": {"country": "Allemagne", "location": "Allemagne", "reason": "TeamViewer AG (Allemagne), infrastructure mondiale"},
-        "Trimble": {"country": "USA", "location": "États-Unis", "reason": "Trimble Inc. (USA), SketchUp, certifié DPF"},
-        "Vokapi": {"country": "Suisse", "location": "Suisse", "reason": "Développeur suisse, synchronisation externe"},
-        "Wakelet": {"country": "Royaume-Uni", "location": "Royaume-Uni", "reason": "Wakelet Ltd (UK), hébergement cloud"},
-        "Wayground": {"country": "USA", "location": "États-Unis", "reason": "Quizizz Inc. (USA), certifié DPF, COPPA"},
-        "Wooclap": {"country": "Belgique", "location": "Union Européenne", "reason": "Wooclap SA (Belgique), hébergement UE"},
-        "Wordwall": {"country": "Royaume-Uni", "location": "Royaume-Uni", "reason": "Visual Education Ltd (UK), hébergement UK/US"},
-        "Zapier": {"country": "USA", "location": "États-Unis", "reason": "Zapier Inc. (USA), certifié DPF, SOC 2"},
-    },
-
-    # === NIVEAU 3 - ROUGE (non conforme RGPD, Chine, etc.) ===
-    "level_3": {
-        "Azendoo": {"country": "France", "location": "Inconnu", "reason": "Service apparemment discontinué, politique confidentialité insuffisante"},
-        "BlueMail": {"country": "USA", "location": "États-Unis", "reason": "Blix Inc. (USA), controverses collecte données emails, non certifié DPF"},
-        "CapCut": {"country": "Chine", "location": "Chine", "reason": "ByteDance (Chine), amende RGPD 530M€, transfert données vers Chine"},
-        "Classcraft": {"country": "Canada", "location": "États-Unis", "reason": "Classcraft Studios (Canada), acquis par HMH, collecte données comportementales extensive"},
-        "Duolingo": {"country": "USA", "location": "États-Unis", "reason": "Duolingo Inc. (USA), collecte extensive, publicités ciblées version gratuite"},
-        "Edubase Reader": {"country": "Hongrie", "location": "Hongrie", "reason": "Entreprise hongroise, politique confidentialité insuffisante"},
-        "Garmin Connect": {"country": "USA", "location": "États-Unis", "reason": "Garmin Ltd (USA), données santé sensibles, transferts vers pays tiers"},
-        "Glose": {"country": "USA", "location": "États-Unis", "reason": "Glose Education (France acquis USA), politique privacy incertaine"},
-        "JungleAI": {"country": "Inconnu", "location": "Inconnu", "reason": "Startup IA, politique confidentialité insuffisante"},
-        "LingoDeer": {"country": "Chine", "location": "Chine", "reason": "Entreprise chinoise, transfert données vers Chine"},
-        "LinkedIn": {"country": "USA", "location": "États-Unis", "reason": "Microsoft/LinkedIn (USA), collecte extensive, profils professionnels mineurs déconseillés"},
-        "Lucid": {"country": "USA", "location": "États-Unis", "reason": "Lucid Software (USA), collecte analytics extensive"},
-        "Memrise": {"country": "Royaume-Uni", "location": "États-Unis", "reason": "Memrise Ltd (UK), IA controversée, publicités invasives version gratuite"},
-        "Mine": {"country": "Israël", "location": "Israël", "reason": "Mine PrivacyOps (Israël), service découverte données, pays non adéquat UE"},
-        "Mural": {"country": "USA", "location": "États-Unis", "reason": "Mural (USA), acquis par Microsoft, changements politique à venir"},
-        "Prezi": {"country": "USA", "location": "États-Unis", "reason": "Prezi Inc. (USA), collecte analytics extensive, non certifié DPF"},
-        "Soundtrap": {"country": "Suède", "location": "États-Unis", "reason": "Spotify/Soundtrap (Suède), hébergement US, collecte audio"},
-        "Spark": {"country": "Ukraine", "location": "Ukraine", "reason": "Readdle (Ukraine), client email, accès contenu emails côté serveur"},
-        "Suno.AI": {"country": "USA", "location": "États-Unis", "reason": "Suno AI (USA), IA générative, droits auteur incertains, politique privacy floue"},
-    }
-}
-
-# Patterns pour identifier les logiciels par leur nom
-NAME_PATTERNS = {
-    "Adobe": "Adobe Acrobat",
-    "Atlassian": "Atlassian",
-    "Jira": "Atlassian",
-    "Confluence": "Atlassian",
-    "Trello": "Atlassian",
-    "Azendoo": "Azendoo",
-    "Babbel": "Babbel",
-    "BDnF": "BDnF",
-    "BlinkLearning": "BlinkLearning",
-    "BlueMail": "BlueMail",
-    "Book Creator": "Book Creator",
-    "Bookili": "Bookili",
-    "Calendly": "Calendly",
-    "Calengoo": "Calengoo",
-    "Canva": "Canva",
-    "CapCut": "CapCut",
-    "Card2Brain": "Card2Brain",
-    "Claro": "Claro",
-    "Classcraft": "Classcraft",
-    "Classroomscreen": "Classroomscreen",
-    "Classtime": "Classtime",
-    "Code.org": "Code.org",
-    "Dictaly": "Dictaly",
-    "Doodle": "Doodle",
-    "Drive Infomaniak": "Drive Infomaniak",
-    "Druide": "Druide",
-    "Antidote": "Druide",
-    "Duolingo": "Duolingo",
-    "Dynamilis": "Dynamilis",
-    "Ed.AI": "Ed.AI",
-    "Edpuzzle": "Edpuzzle",
-    "Edubase": "Edubase Reader",
-    "Educaplay": "Educaplay",
-    "Exam.net": "Exam.net",
-    "FizziQ": "FizziQ",
-    "Flora Incognita": "Flora Incognita",
-    "Foxit": "Foxit",
-    "Framasoft": "Framasoft",
-    "Garmin": "Garmin Connect",
-    "Genially": "Genially",
-    "GeoGebra": "GeoGebra",
-    "Gimkit": "Gimkit",
-    "Glose": "Glose",
-    "JSTOR": "JSTOR",
-    "JungleAI": "JungleAI",
-    "Kahoot": "Kahoot",
-    "Kialo": "Kialo Edu",
-    "Knowt": "Knowt",
-    "LearningApps": "LearningApps",
-    "LearningView": "LearningView",
-    "LingoDeer": "LingoDeer",
-    "LinkedIn": "LinkedIn",
-    "Lockee": "Lockee",
-    "Lucid": "Lucid",
-    "LyricsTraining": "LyricsTraining",
-    "MagicSchool": "MagicSchool",
-    "Memrise": "Memrise",
-    "MindMeister": "MindMeister",
-    "Mine": "Mine",
-    "Minecraft": "Minecraft Education",
-    "Miro": "Miro",
-    "Mural": "Mural",
-    "NotebookLM": "NotebookLM",
-    "One Calendar": "One Calendar",
-    "Orthophore": "Orthophore",
-    "Padlet": "Padlet",
-    "pCloud": "pCloud",
-    "PDF Expert": "PDF Expert",
-    "Phonowriter": "Phonowriter",
-    "Photopea": "Photopea",
-    "Phyphox": "Phyphox",
-    "Pixton": "Pixton",
-    "Plandeclasse": "Plandeclasse",
-    "Plickers": "Plickers",
-    "Prezi": "Prezi",
-    "Projet Voltaire": "Projet Voltaire",
-    "Voltaire": "Projet Voltaire",
-    "Quizlet": "Quizlet",
-    "Remarkable": "Remarkable",
-    "Samsung Email": "Samsung Email",
-    "Samsung Notes": "Samsung Notes",
-    "Scholarvox": "Scholarvox",
-    "SchoolAI": "SchoolAI",
-    "School AI": "SchoolAI",
-    "SMART": "SMART Lumio",
-    "Lumio": "SMART Lumio",
-    "Soda PDF": "Soda PDF",
-    "Soundtrap": "Soundtrap",
-    "Spark": "Spark",
-    "Suno": "Suno.AI",
-    "Taptouche": "Taptouche",
-    "TeamViewer": "TeamViewer",
-    "Threema": "Threema",
-    "Thunderbird": "Thunderbird",
-    "Trimble": "Trimble",
-    "SketchUp": "Trimble",
-    "Vokapi": "Vokapi",
-    "Wakelet": "Wakelet",
-    "Wayground": "Wayground",
-    "Quizizz": "Wayground",
-    "Wooclap": "Wooclap",
-    "Wooflash": "Wooflash",
-    "Wordwall": "Wordwall",
-    "Zapier": "Zapier",
-}
-
-# Microsoft products - Level 1 (special DPA with education institutions)
-MICROSOFT_PRODUCTS = ["Microsoft Word", "Microsoft Excel", "Microsoft PowerPoint", "Microsoft OneNote",
-                      "Microsoft Teams", "Microsoft Forms", "Microsoft Planner", "Microsoft Whiteboard",
-                      "OneDrive", "SharePoint", "Outlook", "Clipchamp"]
+from functools import cache
+from types import MappingProxyType
+from typing import NamedTuple
+
+from lgpd_fuzzy import resolve
+from lgpd_jurisdictions import parse_location
+from lgpd_knowledge import lazy_attributes, load_section, source_path
+from lgpd_profile import PROFILER, add_profile_arguments, run_profiled
+from lgpd_sources import CSV_PATH, iter_csv_records
+from lgpd_store import ClassificationStore
+
+CATALOG_PATH = Path(__file__).parent.parent / "app" / "data" / "software-list.ts"
+OUTPUT_PATH = Path(__file__).parent / "lgpd-classifications.json"
+
+# Cache de build : sections de la base de connaissances et modules dont dépend le résultat
+BUILD_CACHE_MAGIC = "LGPDBC01"
+CACHE_SECTIONS = ("COMPANY_DATABASE", "NAME_PATTERNS", "MICROSOFT_PRODUCTS", "MICROSOFT_ENTRY")
+CACHE_MODULES = (Path(__file__), Path(__file__).with_name("lgpd_jurisdictions.py"))
+
+# Base de connaissances des éditeurs (COMPANY_DATABASE, NAME_PATTERNS, MICROSOFT_PRODUCTS,
+# MICROSOFT_ENTRY) : scripts/knowledge-base/*.json, chargée à la demande
+
+
+class VendorEntry(NamedTuple):
+    """Entrée de l'index éditeurs : niveau et caractéristiques d'un éditeur."""
+    level: int
+    country: str
+    location: str
+    reason: str
+
+
+@cache
+def build_vendor_index() -> MappingProxyType:
+    """Aplatit COMPANY_DATABASE en un index immuable clé éditeur → VendorEntry.
+
+    Lève ValueError si un éditeur apparaît dans plusieurs niveaux.
+    """
+    index = {"Microsoft": VendorEntry(1, **load_section("MICROSOFT_ENTRY"))}
+    tiers = {"Microsoft": ["MICROSOFT_ENTRY"]}
+
+    for level_key, vendors in load_section("COMPANY_DATABASE").items():
+        level = int(level_key.split("_")[1])
+        for key, data in vendors.items():
+            tiers.setdefault(key, []).append(level_key)
+            index.setdefault(key, VendorEntry(level, data["country"], data["location"], data["reason"]))
+
+    duplicates = {key: found for key, found in tiers.items() if len(found) > 1}
+    if duplicates:
+        details = ", ".join(f"{key} ({' / '.join(found)})" for key, found in sorted(duplicates.items()))
+        raise ValueError(f"Éditeurs présents dans plusieurs niveaux: {details}")
+
+    return MappingProxyType(index)
+
+
+class NameMatcher:
+    """Automate Aho-Corasick : trouve tous les motifs présents dans un nom en un seul parcours.
+
+    Priorité documentée quand plusieurs motifs correspondent :
+    1. le motif le plus long (« Samsung Notes » l'emporte sur « Samsung », « Minecraft » sur « Mine ») ;
+    2. à longueur égale, celui qui commence le plus tôt dans le nom ;
+    3. sinon, l'ordre d'insertion (produits Microsoft, puis NAME_PATTERNS).
+    """
+
+    def __init__(self):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+        self._patterns: list[tuple[str, object]] = []
+
+    def add(self, pattern: str, value) -> None:
+        """Ajoute un motif (insensible à la casse). Un doublon garde la première valeur."""
+        pattern = pattern.lower()
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        if not self._output[node]:
+            self._output[node].append(len(self._patterns))
+            self._patterns.append((pattern, value))
+
+    def build(self) -> "NameMatcher":
+        """Calcule les liens d'échec (parcours en largeur) et fusionne les sorties."""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+                queue.append(child)
+        return self
+
+    def find_all(self, text: str):
+        """Itère sur (début, motif, valeur) pour chaque occurrence dans le texte."""
+        node = 0
+        for position, char in enumerate(text.lower()):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for pattern_id in self._output[node]:
+                pattern, value = self._patterns[pattern_id]
+                yield position - len(pattern) + 1, pattern_id, value
+
+    def best(self, text: str):
+        """Retourne la valeur du motif prioritaire, ou None."""
+        best_rank = None
+        best_value = None
+        for start, pattern_id, value in self.find_all(text):
+            rank = (-len(self._patterns[pattern_id][0]), start, pattern_id)
+            if best_rank is None or rank < best_rank:
+                best_rank, best_value = rank, value
+        return best_value
+
+
+@cache
+def build_name_matcher() -> NameMatcher:
+    """Construit l'automate à partir de MICROSOFT_PRODUCTS et NAME_PATTERNS."""
+    vendor_index = build_vendor_index()
+    matcher = NameMatcher()
+    for ms_product in load_section("MICROSOFT_PRODUCTS"):
+        matcher.add(ms_product, "Microsoft")
+    for pattern, key in load_section("NAME_PATTERNS").items():
+        if key in vendor_index:
+            matcher.add(pattern, key)
+    return matcher.build()
+
+
+# Accès paresseux aux tables et index (construits au premier usage)
+__getattr__ = lazy_attributes(
+    COMPANY_DATABASE=lambda: load_section("COMPANY_DATABASE"),
+    NAME_PATTERNS=lambda: load_section("NAME_PATTERNS"),
+    MICROSOFT_PRODUCTS=lambda: load_section("MICROSOFT_PRODUCTS"),
+    MICROSOFT_ENTRY=lambda: load_section("MICROSOFT_ENTRY"),
+    VENDOR_INDEX=build_vendor_index,
+    NAME_MATCHER=build_name_matcher,
+)
 
 
 def find_software_key(name: str) -> tuple[str, int] | None:
     """Trouve la clé de base de données pour un nom de logiciel."""
-    name_lower = name.lower()
-
-    # Check Microsoft products first
-    for ms_product in MICROSOFT_PRODUCTS:
-        if ms_product.lower() in name_lower:
-            return ("Microsoft", 1)
-
-    # Check patterns
-    for pattern, key in NAME_PATTERNS.items():
-        if pattern.lower() in name_lower:
-            # Find level
-            for level, data in [("level_1", 1), ("level_2", 2), ("level_3", 3)]:
-                if key in COMPANY_DATABASE.get(level, {}):
-                    return (key, level)
-
-    return None
+    key = build_name_matcher().best(name)
+    if key is None:
+        return None
+    return (key, build_vendor_index()[key].level)
 
 
 def get_classification(name: str) -> dict | None:
     """Obtient la classification pour un logiciel."""
-    result = find_software_key(name)
-    if not result:
+    key = build_name_matcher().best(name)
+    if key is None:
         return None
-
-    key, level = result
-
-    # Microsoft special case
-    if key == "Microsoft":
-        return {
-            "level": 1,
-            "country": "USA",
-            "location": "Union Européenne (option)",
-            "reason": "Microsoft (USA), contrat DPA CEJEF, hébergement UE disponible, certifié DPF, ISO 27001"
-        }
-
-    level_key = f"level_{level}" if isinstance(level, int) else level
-    if level_key in COMPANY_DATABASE and key in COMPANY_DATABASE[level_key]:
-        data = COMPANY_DATABASE[level_key][key]
-        return {
-            "level": int(level_key.split("_")[1]),
-            "country": data["country"],
-            "location": data["location"],
-            "reason": data["reason"]
-        }
-
-    return None
+    return {**build_vendor_index()[key]._asdict(), "vendor": key}
 
 
 def generate_usage_notes(level: int, reason: str) -> str:
@@ -296,19 +187,110 @@ def generate_usage_notes(level: int, reason: str) -> str:
         return f"INTERDIT - {reason}"
 
 
-def process_software_file():
-    """Traite le fichier software-list.ts et génère les classifications."""
-    file_path = Path(__file__).parent.parent / "app" / "data" / "software-list.ts"
+def build_modification(name: str, classification: dict) -> dict:
+    """Construit l'entrée de modification (format lgpd-classifications.json) d'un logiciel."""
+    return {
+        "name": name,
+        "certificationLevel": classification["level"],
+        "dataLocation": classification["location"],
+        "jurisdictions": parse_location(classification["location"]),
+        "usageNotes": generate_usage_notes(classification["level"], classification["reason"]),
+        "remarque": f"Niveau {classification['level']} : {classification['reason']}"
+    }
+
+
+def save_to_store(store_path: Path, by_level: dict) -> None:
+    """Enregistre les classifications d'un run dans la base SQLite."""
+    store = ClassificationStore(store_path)
+    store.save_vendors(build_vendor_index())
+    for level in [1, 2, 3]:
+        for sw in by_level[level]:
+            store.record(build_modification(sw["name"], sw), sw)
+    for name in by_level["unknown"]:
+        store.record({"name": name}, None)
+    store.close()
+
 
+def knowledge_key() -> str:
+    """Empreinte de la base de connaissances utilisée et du code de classification."""
+    digest = hashlib.sha256(BUILD_CACHE_MAGIC.encode())
+    for path in [source_path(section) for section in CACHE_SECTIONS] + list(CACHE_MODULES):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def build_cache_path(output_path: Path) -> Path:
+    """Cache de build associé à un fichier de sortie (non versionné)."""
+    return output_path.with_suffix(".cache")
+
+
+def load_build_cache(cache_path: Path, key: str) -> dict | None:
+    """Cache du run précédent, ou None s'il est absent, illisible ou d'une autre base de connaissances.
+
+    Contenu : empreintes du catalogue et de la sortie, et classification par nom.
+    """
+    try:
+        magic, cache_key, catalog, output, results = marshal.loads(cache_path.read_bytes())
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if magic != BUILD_CACHE_MAGIC or cache_key != key:
+        return None
+    return {"catalog": catalog, "output": output, "results": results}
+
+
+def save_build_cache(cache_path: Path, key: str, catalog: str, output: str, results: dict) -> None:
+    """Écrit le cache de build (écriture atomique, erreurs ignorées)."""
+    try:
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        tmp_path.write_bytes(marshal.dumps((BUILD_CACHE_MAGIC, key, catalog, output, results)))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def process_software_file(file_path: Path = CATALOG_PATH, output_path: Path = OUTPUT_PATH,
+                          store_path: Path | None = None, use_cache: bool = True):
+    """Traite le fichier software-list.ts et génère les classifications.
+
+    Avec le cache de build, un catalogue et une base de connaissances
+    inchangés réutilisent la sortie précédente telle quelle ; sinon seuls les
+    noms absents du run précédent sont classifiés.
+    """
     if not file_path.exists():
         print(f"Erreur: Fichier non trouvé: {file_path}")
         sys.exit(1)
 
-    content = file_path.read_text(encoding="utf-8")
+    with PROFILER.phase("lecture"):
+        data = file_path.read_bytes()
+        content = data.decode("utf-8")
+
+    cache_path = build_cache_path(output_path)
+    cached = None
+    if use_cache:
+        with PROFILER.phase("cache de build"):
+            key = knowledge_key()
+            catalog_hash = hashlib.sha256(data).hexdigest()
+            cached = load_build_cache(cache_path, key)
+            previous = output_path.read_bytes() if cached and output_path.exists() else None
+        if (store_path is None and previous is not None and cached["catalog"] == catalog_hash
+                and hashlib.sha256(previous).hexdigest() == cached["output"]):
+            result = json.loads(previous)
+            PROFILER.count("cache.succès")
+            print(f"✅ Cache: catalogue et base de connaissances inchangés, {output_path} conservé")
+            print(f"Total: {result['total']}")
+            print(f"Classifiés: {result['classified']}")
+            print(f"À vérifier manuellement: {len(result['unclassified'])}")
+            return result["modifications"], result["unclassified"]
+    cached_results = cached["results"] if cached else {}
 
     # Extraire tous les noms de logiciels
-    name_pattern = r'name:\s*"([^"]+)"'
-    names = re.findall(name_pattern, content)
+    with PROFILER.phase("extraction des noms (regex)"):
+        name_pattern = r'name:\s*"([^"]+)"'
+        names = re.findall(name_pattern, content)
+    if PROFILER.enabled:
+        PROFILER.count("octets scannés", len(content.encode("utf-8")))
+        PROFILER.count("regex.appels.name")
+        PROFILER.count("regex.correspondances.name", len(names))
 
     print(f"Trouvé {len(names)} logiciels dans le fichier")
     print("=" * 60)
@@ -316,15 +298,25 @@ def process_software_file():
     # Classifications par niveau
     by_level = {1: [], 2: [], 3: [], "unknown": []}
 
-    for name in names:
-        classification = get_classification(name)
-        if classification:
-            by_level[classification["level"]].append({
-                "name": name,
-                **classification
-            })
-        else:
-            by_level["unknown"].append(name)
+    results = {}
+    with PROFILER.phase("classification (automate)"):
+        for name in names:
+            if name in results:
+                classification = results[name]
+            elif name in cached_results:
+                classification = results[name] = cached_results[name]
+            else:
+                classification = results[name] = get_classification(name)
+                PROFILER.count("cache.classifiés")
+            if classification:
+                by_level[classification["level"]].append({
+                    "name": name,
+                    **classification
+                })
+            else:
+                by_level["unknown"].append(name)
+    PROFILER.count("automate.recherches", len(names))
+    PROFILER.count("automate.correspondances", len(names) - len(by_level["unknown"]))
 
     # Afficher les résultats
     print(f"\n=== NIVEAU 1 (VERT) - {len(by_level[1])} logiciels ===")
@@ -340,8 +332,15 @@ def process_software_file():
         print(f"  - {sw['name']}: {sw['reason']}")
 
     print(f"\n=== NON CLASSIFIÉS - {len(by_level['unknown'])} logiciels ===")
-    for name in sorted(by_level["unknown"]):
-        print(f"  - {name}")
+    with PROFILER.phase("suggestions (trigrammes)"):
+        for name in sorted(by_level["unknown"]):
+            candidates = resolve(name, limit=1)
+            hint = ""
+            if candidates:
+                best = candidates[0]
+                close = best.target if best.target is not None else f"société {best.label}"
+                hint = f" (proche: {close}, {best.score:.2f})"
+            print(f"  - {name}{hint}")
 
     # Générer les modifications à appliquer
     print("\n" + "=" * 60)
@@ -351,26 +350,26 @@ def process_software_file():
     modifications = []
     for level in [1, 2, 3]:
         for sw in by_level[level]:
-            usage_notes = generate_usage_notes(sw["level"], sw["reason"])
-            modifications.append({
-                "name": sw["name"],
-                "certificationLevel": sw["level"],
-                "dataLocation": sw["location"],
-                "usageNotes": usage_notes,
-                "remarque": f"Niveau {sw['level']} : {sw['reason']}"
-            })
+            modifications.append(build_modification(sw["name"], sw))
 
     # Sauvegarder les modifications dans un fichier JSON
-    output_path = Path(__file__).parent / "lgpd-classifications.json"
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump({
+    with PROFILER.phase("écriture JSON"):
+        output = json.dumps({
             "total": len(names),
             "classified": len(names) - len(by_level["unknown"]),
             "unclassified": by_level["unknown"],
             "modifications": modifications
-        }, f, ensure_ascii=False, indent=2)
+        }, ensure_ascii=False, indent=2).encode("utf-8")
+        output_path.write_bytes(output)
+    if use_cache:
+        with PROFILER.phase("cache de build"):
+            save_build_cache(cache_path, key, catalog_hash, hashlib.sha256(output).hexdigest(), results)
 
     print(f"\nClassifications sauvegardées dans: {output_path}")
+    if store_path:
+        with PROFILER.phase("écriture SQLite"):
+            save_to_store(store_path, by_level)
+        print(f"Base SQLite mise à jour: {store_path}")
     print(f"Total: {len(names)}")
     print(f"Classifiés: {len(names) - len(by_level['unknown'])}")
     print(f"À vérifier manuellement: {len(by_level['unknown'])}")
@@ -378,5 +377,96 @@ def process_software_file():
     return modifications, by_level["unknown"]
 
 
+def classify_record(record: str | dict) -> tuple[dict, dict | None]:
+    """Classifie un nom ou un enregistrement (objet avec un champ `name`).
+
+    Retourne (enregistrement enrichi, classification). Les champs d'un
+    enregistrement sont conservés ; un logiciel non classifié reçoit
+    `certificationLevel: null`.
+    """
+    if isinstance(record, str):
+        record = {"name": record}
+    if not isinstance(record, dict):
+        raise ValueError("chaîne ou objet JSON attendu")
+    name = record.get("name")
+    if not isinstance(name, str):
+        raise ValueError("champ `name` manquant")
+
+    classification = get_classification(name)
+    if not classification:
+        return {**record, "certificationLevel": None}, None
+    return {**record, **build_modification(name, classification)}, classification
+
+
+def iter_ndjson(source: str):
+    """Itère sur les valeurs JSON d'un flux NDJSON (fichier ou `-` pour stdin), une par ligne."""
+    input_file = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        for line_number, line in enumerate(input_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as error:
+                print(f"⚠️  Ligne {line_number} ignorée: {error}", file=sys.stderr)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+
+
+def stream_classifications(records, store_path: Path | None = None):
+    """Classifie des enregistrements au fil de l'eau et émet une classification NDJSON par ligne sur stdout."""
+    store = ClassificationStore(store_path) if store_path else None
+    if store:
+        store.save_vendors(build_vendor_index())
+    try:
+        for position, record in enumerate(records, start=1):
+            PROFILER.count("enregistrements lus")
+            try:
+                result, classification = classify_record(record)
+            except ValueError as error:
+                print(f"⚠️  Enregistrement {position} ignoré: {error}", file=sys.stderr)
+                continue
+            PROFILER.count("automate.correspondances", classification is not None)
+            if store:
+                store.record(result, classification)
+            sys.stdout.write(json.dumps(result, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+    finally:
+        if store:
+            store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classification LGPD des logiciels CEJEF")
+    parser.add_argument(
+        "--ndjson", nargs="?", const="-", metavar="FICHIER",
+        help="mode streaming : lit des noms ou enregistrements NDJSON (stdin par défaut) "
+             "et écrit une classification NDJSON par ligne"
+    )
+    parser.add_argument(
+        "--csv", nargs="?", const=CSV_PATH, type=Path, metavar="FICHIER",
+        help="mode streaming : lit le CSV de positionnement CEJEF (app/data/logiciel-cejef.csv par défaut) "
+             "et écrit une classification NDJSON par logiciel"
+    )
+    parser.add_argument(
+        "--sqlite", type=Path, metavar="FICHIER",
+        help="enregistre aussi les classifications dans une base SQLite indexée (voir lgpd_store.py)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="reclassifie tout le catalogue sans lire ni mettre à jour le cache de build"
+    )
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if args.ndjson:
+        run_profiled(args, stream_classifications, iter_ndjson(args.ndjson), args.sqlite)
+    elif args.csv:
+        run_profiled(args, stream_classifications, iter_csv_records(args.csv), args.sqlite)
+    else:
+        run_profiled(args, process_software_file, CATALOG_PATH, OUTPUT_PATH, args.sqlite, not args.no_cache)
+
+
 if __name__ == "__main__":
-    process_software_file()
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Exporte un index de recherche inversé statique du catalogue publié.
+
+Source : le miroir Directus local (scripts/lgpd_mirror.py). Les noms,
+descriptions, catégories et activités pédagogiques sont découpés en termes
+normalisés comme normalizeText() (app/utils/search.ts : minuscules, sans
+accents). L'index est écrit sous un nom contenant son empreinte de contenu,
+avec ses variantes précompressées gzip et brotli (si le module `brotli` est
+installé), plus un manifest.json au nom stable qui pointe vers la version
+courante : l'index lui-même peut être mis en cache indéfiniment.
+
+Format de l'index :
+    {"version": 1,
+     "documents": [[id, nom, niveau], ...],
+     "fields": {"name": 1, "description": 2, "category": 4, "activity": 8},
+     "postings": {"terme": [document, champs, document, champs, ...]}}
+
+Usage:
+    python3 scripts/export_search_index.py
+    python3 scripts/export_search_index.py --mirror lgpd-mirror.sqlite --output public/search-index
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+from lgpd_mirror import MIRROR_PATH, iter_mirror_records
+from lgpd_query import record_level
+
+try:
+    import brotli
+except ImportError:  # dépendance optionnelle : seules les variantes gzip sont produites
+    brotli = None
+
+OUTPUT_DIR = Path(__file__).parent.parent / "public" / "search-index"
+INDEX_VERSION = 1
+
+# Champs d'origine d'un terme (bits combinés dans les postings)
+FIELDS = {"name": 1, "description": 2, "category": 4, "activity": 8}
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOP_WORDS = frozenset(
+    "au aux avec ce ces dans de des du en et la le les leur un une ou par pour sur sa son ses "
+    "qui que est sont the and for of to in on with".split()
+)
+
+
+def normalize_text(text: str) -> str:
+    """Minuscules sans accents, comme normalizeText() côté front."""
+    return re.sub(r"[̀-ͯ]", "", unicodedata.normalize("NFD", text.lower()))
+
+
+def tokenize(text: str | None) -> set[str]:
+    """Termes indexables d'un texte (2 caractères minimum, mots vides exclus)."""
+    if not text:
+        return set()
+    return {
+        token for token in TOKEN_PATTERN.findall(normalize_text(text))
+        if len(token) > 1 and token not in STOP_WORDS
+    }
+
+
+def build_search_index(records) -> dict:
+    """Construit l'index inversé des logiciels (documents numérotés dans l'ordre de lecture)."""
+    documents = []
+    postings: dict[str, dict[int, int]] = {}
+
+    for document, record in enumerate(records):
+        documents.append([record["id"], record["name"], record_level(record)])
+        sources = [
+            ("name", [record["name"]]),
+            ("description", [record.get("short_description"), record.get("description")]),
+            ("category", record.get("categories") or []),
+            ("activity", record.get("pedagogical_activities") or []),
+        ]
+        for field, texts in sources:
+            for text in texts:
+                for token in tokenize(text):
+                    fields = postings.setdefault(token, {})
+                    fields[document] = fields.get(document, 0) | FIELDS[field]
+
+    return {
+        "version": INDEX_VERSION,
+        "documents": documents,
+        "fields": FIELDS,
+        "postings": {
+            token: [value for item in sorted(fields.items()) for value in item]
+            for token, fields in sorted(postings.items())
+        },
+    }
+
+
+def content_hash(data: bytes) -> str:
+    """Empreinte courte (SHA-256, 12 caractères hexadécimaux) d'un contenu."""
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Écrit un fichier seulement si son contenu change ; retourne True si écrit."""
+    if path.exists() and path.read_bytes() == data:
+        return False
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+    return True
+
+
+def compressed_variants(data: bytes) -> dict[str, bytes]:
+    """Variantes précompressées d'un contenu (extension → octets)."""
+    # mtime=0 : sortie gzip déterministe, donc identique d'un build à l'autre
+    variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(data, quality=11)
+    return variants
+
+
+def export_search_index(records, output_dir: Path = OUTPUT_DIR) -> dict:
+    """Écrit l'index (et ses variantes) sous un nom à empreinte, puis le manifest ; retourne le manifest."""
+    index = build_search_index(records)
+    data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    file_name = f"index.{content_hash(data)}.json"
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    write_if_changed(output_dir / file_name, data)
+    manifest = {"index": file_name, "documents": len(index["documents"]), "terms": len(index["postings"]),
+                "size": len(data), "encodings": {}}
+    for extension, variant in compressed_variants(data).items():
+        write_if_changed(output_dir / (file_name + extension), variant)
+        manifest["encodings"][extension.lstrip(".")] = {"file": file_name + extension, "size": len(variant)}
+
+    # Les anciennes versions ne sont plus référencées
+    for old in output_dir.glob("index.*.json*"):
+        if not old.name.startswith(file_name):
+            old.unlink()
+    write_if_changed(output_dir / "manifest.json",
+                     (json.dumps(manifest, ensure_ascii=False, indent=2) + "\n").encode("utf-8"))
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporte l'index de recherche statique du catalogue publié")
+    parser.add_argument("--mirror", type=Path, default=MIRROR_PATH, help="miroir SQLite (défaut: scripts/lgpd-mirror.sqlite)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR, help="dossier de sortie (défaut: public/search-index)")
+    args = parser.parse_args()
+
+    if not args.mirror.exists():
+        print(f"Erreur: miroir introuvable: {args.mirror} (lancer d'abord lgpd_mirror.py sync)")
+        sys.exit(1)
+
+    manifest = export_search_index(iter_mirror_records(args.mirror), args.output)
+    print(f"✅ {manifest['documents']} logiciels, {manifest['terms']} termes → {args.output / manifest['index']}")
+    for encoding, variant in manifest["encodings"].items():
+        print(f"   {encoding}: {variant['size']:,} octets (brut: {manifest['size']:,})")
+    if brotli is None:
+        print("⚠️  Module brotli absent : variante .br non générée (pip install brotli)")
+
+
+if __name__ == "__main__":
+    main()
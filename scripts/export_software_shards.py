@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Exporte une fiche JSON précalculée par logiciel publié (détail au format `Software`).
+
+Source : le miroir Directus local (scripts/lgpd_mirror.py). Chaque item est
+converti comme le fait mapSoftware() pour server/api/software/[id].get.ts
+(catégories et activités résolues), les alternatives étant limitées aux
+logiciels publiés. Chaque fiche est écrite sous `<id>.<empreinte>.json` et
+un manifest.json associe chaque id à son fichier : les fiches peuvent être
+mises en cache sans limite par un CDN, seul le manifest change.
+
+Une reconstruction ne réécrit que les fiches dont le contenu a changé et
+supprime celles des logiciels retirés.
+
+Usage:
+    python3 scripts/export_software_shards.py
+    python3 scripts/export_software_shards.py --mirror lgpd-mirror.sqlite --output public/software
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from export_search_index import content_hash, write_if_changed
+from lgpd_directus import map_software
+from lgpd_mirror import MIRROR_PATH, iter_mirror_items
+
+OUTPUT_DIR = Path(__file__).parent.parent / "public" / "software"
+MANIFEST_NAME = "manifest.json"
+
+
+def load_manifest(output_dir: Path) -> dict[str, str]:
+    """Manifest de l'export précédent (id → fichier), vide s'il n'existe pas."""
+    try:
+        return json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))["shards"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def export_shards(items, output_dir: Path = OUTPUT_DIR) -> dict[str, int]:
+    """Écrit les fiches modifiées et le manifest ; retourne les compteurs écrites/inchangées/supprimées."""
+    softwares = [map_software(item) for item in items]
+    published = {software["id"] for software in softwares}
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(output_dir)
+    shards = {}
+    stats = {"écrites": 0, "inchangées": 0, "supprimées": 0}
+
+    for software in softwares:
+        software["alternatives"] = [id for id in software["alternatives"] if id in published]
+        data = json.dumps(software, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        file_name = f"{software['id']}.{content_hash(data)}.json"
+        shards[software["id"]] = file_name
+        # Nom à empreinte : même nom ⇒ même contenu, inutile de relire le fichier
+        if previous.get(software["id"]) == file_name and (output_dir / file_name).exists():
+            stats["inchangées"] += 1
+            continue
+        write_if_changed(output_dir / file_name, data)
+        stats["écrites"] += 1
+
+    current = set(shards.values())
+    for file_name in set(previous.values()) - current:
+        (output_dir / file_name).unlink(missing_ok=True)
+        stats["supprimées"] += 1
+
+    manifest = {"count": len(shards), "shards": dict(sorted(shards.items()))}
+    write_if_changed(output_dir / MANIFEST_NAME,
+                     (json.dumps(manifest, ensure_ascii=False, indent=2) + "\n").encode("utf-8"))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporte une fiche JSON par logiciel publié")
+    parser.add_argument("--mirror", type=Path, default=MIRROR_PATH, help="miroir SQLite (défaut: scripts/lgpd-mirror.sqlite)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR, help="dossier de sortie (défaut: public/software)")
+    args = parser.parse_args()
+
+    if not args.mirror.exists():
+        print(f"Erreur: miroir introuvable: {args.mirror} (lancer d'abord lgpd_mirror.py sync)")
+        sys.exit(1)
+
+    stats = export_shards(iter_mirror_items(args.mirror), args.output)
+    print(f"✅ {stats['écrites']} fiches écrites, {stats['inchangées']} inchangées, "
+          f"{stats['supprimées']} supprimées → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
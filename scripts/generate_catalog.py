@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Générateur de catalogues synthétiques au format software-list.ts.
+
+Les catalogues reprennent la disposition des champs du fichier réel
+(name, shortDescription, certificationLevel, dataLocation, personalData,
+usageNotes, remarque) et mélangent :
+- les noms exacts des tables d'application (pour que les scripts apply trouvent leurs blocs) ;
+- des noms dérivés des motifs éditeurs (classifiables) ;
+- des noms inconnus (non classifiables).
+
+Usage:
+    python3 scripts/generate_catalog.py --sizes 1000 10000 --output /tmp/catalogs
+"""
+
+import argparse
+import random
+from pathlib import Path
+
+from lgpd_knowledge import load_section
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+LOCATIONS = ["Suisse", "Union Européenne", "États-Unis", "France", "Inconnu", "Local/États-Unis"]
+UNKNOWN_WORDS = ["Studio", "Notes", "Board", "Quiz", "Lab", "Cloud", "Desk", "Map", "Flow", "Reader"]
+
+
+def catalog_vocabulary() -> tuple[list[str], list[str]]:
+    """Retourne (noms exacts des tables apply, motifs éditeurs du classifieur)."""
+    exact_names = list(load_section("CLASSIFICATIONS")) + list(load_section("REMAINING_CLASSIFICATIONS"))
+    patterns = list(load_section("NAME_PATTERNS")) + list(load_section("MICROSOFT_PRODUCTS"))
+    return exact_names, patterns
+
+
+def format_block(index: int, name: str, rng: random.Random) -> str:
+    """Formate un bloc logiciel avec la même disposition que software-list.ts."""
+    usage_notes = rng.choice(["null", f'"Notes {index}"'])
+    lines = [
+        "  {",
+        f'    id: "sw-{index}",',
+        f'    name: "{name}",',
+        f'    shortDescription: "Outil pédagogique {index}",',
+        f"    certificationLevel: {rng.randint(1, 3)},",
+        f'    dataLocation: "{rng.choice(LOCATIONS)}",',
+        f"    personalData: {rng.choice(['true', 'false'])},",
+        f"    usageNotes: {usage_notes},",
+    ]
+    if rng.random() < 0.5:
+        lines.append(f'    remarque: "Remarque {index}",')
+    lines.append("  },")
+    return "\n".join(lines)
+
+
+def generate_catalog(size: int, seed: int = 42):
+    """Génère le contenu d'un catalogue de `size` entrées, bloc par bloc."""
+    rng = random.Random(seed)
+    exact_names, patterns = catalog_vocabulary()
+
+    yield "export const softwareList: Software[] = [\n"
+    for index in range(size):
+        if index < len(exact_names):
+            name = exact_names[index]
+        elif rng.random() < 0.8:
+            name = f"{rng.choice(patterns)} {index}"
+        else:
+            name = f"{rng.choice(UNKNOWN_WORDS)} {rng.choice(UNKNOWN_WORDS)} {index}"
+        yield format_block(index, name, rng) + "\n"
+    yield "]\n"
+
+
+def write_catalog(size: int, output_dir: Path, seed: int = 42) -> Path:
+    """Écrit un catalogue `software-list-<size>-<seed>.ts` et retourne son chemin (réutilisé s'il existe)."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"software-list-{size}-{seed}.ts"
+    if not path.exists():
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(generate_catalog(size, seed))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Génère des catalogues software-list.ts synthétiques")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="nombre d'entrées par catalogue")
+    parser.add_argument("--output", type=Path, default=Path("benchmark-catalogs"), help="dossier de sortie")
+    parser.add_argument("--seed", type=int, default=42, help="graine aléatoire (catalogues reproductibles)")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        path = write_catalog(size, args.output, args.seed)
+        print(f"✅ {path} ({path.stat().st_size:,} octets)")
+
+
+if __name__ == "__main__":
+    main()
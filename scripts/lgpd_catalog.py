@@ -0,0 +1,582 @@
+"""
+Moteur de patch partagé pour le fichier software-list.ts.
+
+Le catalogue est tokenisé une seule fois en un index de blocs
+(nom → positions du bloc et des champs LGPD), puis toutes les modifications
+sont calculées sous forme de remplacements (début, fin, texte) et appliquées
+en un lot à une table de morceaux (PieceTable) : le texte d'origine n'est
+jamais copié, le résultat est écrit morceau par morceau à la fin.
+
+Application incrémentale : un fichier d'état à côté du catalogue garde
+l'empreinte de chaque classification appliquée, ainsi que la position et
+l'empreinte de chaque bloc suivi. Tant que le catalogue n'a pas été modifié
+par ailleurs (taille + date), seules les classifications changées sont
+traitées, à partir des positions enregistrées ; sinon le catalogue est
+rescanné et les blocs dont le contenu n'a pas bougé restent ignorés.
+
+En mode aperçu (`dry_run`), les modifications planifiées (bloc, champ,
+positions, ancienne et nouvelle valeur) sont rendues en diff unifié, hunk
+par hunk à partir du fichier d'origine, sans construire le nouveau fichier.
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from bisect import bisect_left
+from dataclasses import astuple, dataclass, field
+from itertools import accumulate
+from pathlib import Path
+from typing import NamedTuple
+
+from lgpd_profile import PROFILER
+
+CATALOG_PATH = Path(__file__).parent.parent / "app" / "data" / "software-list.ts"
+STATE_VERSION = 1
+DIFF_CONTEXT = 3
+WRITE_CHUNK = 1 << 20
+
+# Champs LGPD reconnus dans un bloc et forme de leur valeur
+FIELD_VALUES = {
+    "certificationLevel": r"\d+",
+    "dataLocation": r'"[^"]*"',
+    "personalData": r"true|false",
+    "usageNotes": r'null|"[^"]*"',
+    "remarque": r'"[^"]*"',
+    "toValidate": r"true|false",
+}
+
+# Un seul scanner pour tout le fichier : noms de logiciels + champs LGPD
+TOKEN_PATTERN = re.compile(
+    r'\bname: "(?P<name>[^"]*)"'
+    + "".join(
+        rf"|\b(?P<{key}>{key}:\s*)(?P<{key}_value>{value})"
+        for key, value in FIELD_VALUES.items()
+    )
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Classification:
+    """Classification LGPD compacte d'un logiciel (chaînes internées, partagées entre entrées)."""
+    level: int
+    data_location: str
+    personal_data: bool
+    usage_notes: str
+    remarque: str
+    to_validate: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Classification":
+        """Construit un enregistrement à partir d'une entrée au format des tables CLASSIFICATIONS."""
+        return cls(
+            level=int(data["level"]),
+            data_location=sys.intern(data["dataLocation"]),
+            personal_data=bool(data["personalData"]),
+            usage_notes=sys.intern(data["usageNotes"]),
+            remarque=sys.intern(data["remarque"]),
+            to_validate=bool(data.get("toValidate", False)),
+        )
+
+
+def build_classification_table(entries: dict[str, dict]) -> dict[str, Classification]:
+    """Convertit une table de dicts en enregistrements Classification (noms internés)."""
+    return {sys.intern(name): Classification.from_dict(data) for name, data in entries.items()}
+
+
+@dataclass
+class Block:
+    """Bloc d'un logiciel : de son `name:` jusqu'au `name:` suivant."""
+    name: str
+    start: int
+    end: int
+    # champ → (début, fin) de la valeur dans le fichier
+    fields: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+
+class Edit(NamedTuple):
+    """Remplacement planifié : positions (début, fin) dans le catalogue, nouveau texte, champ concerné."""
+    start: int
+    end: int
+    text: str
+    field: str
+
+
+def index_blocks(content: str, names=None) -> dict[str, list[Block]]:
+    """Tokenise le catalogue en un index nom → blocs (un nom peut apparaître plusieurs fois).
+
+    `names` : si fourni, seuls les blocs de ces noms sont gardés (index réduit
+    aux logiciels classifiés, quelle que soit la taille du catalogue).
+    """
+    index: dict[str, list[Block]] = {}
+    current = None
+
+    for match in TOKEN_PATTERN.finditer(content):
+        name = match.group("name")
+        if name is not None:
+            if current is not None:
+                current.end = match.start()
+            if names is not None and name not in names:
+                current = None
+                continue
+            current = Block(name=name, start=match.start(), end=len(content))
+            index.setdefault(name, []).append(current)
+            continue
+
+        if current is None:
+            continue
+        key = match.lastgroup.removesuffix("_value")
+        # Seule la première occurrence d'un champ dans le bloc compte
+        if key not in current.fields:
+            current.fields[key] = match.span(f"{key}_value")
+
+    return index
+
+
+def plan_block_edits(block: Block, classification: Classification) -> list[Edit]:
+    """Calcule les remplacements d'un bloc pour une classification."""
+    edits = []
+    values = {
+        "certificationLevel": str(classification.level),
+        "dataLocation": f'"{classification.data_location}"',
+        "personalData": "true" if classification.personal_data else "false",
+        "usageNotes": f'"{classification.usage_notes}"',
+    }
+    for key, value in values.items():
+        if key in block.fields:
+            start, end = block.fields[key]
+            edits.append(Edit(start, end, value, key))
+
+    remarque = f'"{classification.remarque}"'
+    to_validate = classification.to_validate and "toValidate" not in block.fields
+
+    if "remarque" in block.fields:
+        start, end = block.fields["remarque"]
+        edits.append(Edit(start, end, remarque, "remarque"))
+    elif "usageNotes" in block.fields:
+        # Ajouter remarque (et toValidate) après usageNotes
+        end = block.fields["usageNotes"][1]
+        edits.append(Edit(end, end, f",\n    remarque: {remarque}", "remarque"))
+    else:
+        return edits
+    if to_validate:
+        edits.append(Edit(end, end, ",\n    toValidate: true", "toValidate"))
+
+    return edits
+
+
+def splice(content: str, edits: list[Edit]) -> str:
+    """Applique des remplacements non chevauchants en une seule concaténation.
+
+    Des insertions à la même position sont gardées dans leur ordre de planification.
+    """
+    pieces = []
+    position = 0
+    for edit in sorted(edits, key=lambda edit: (edit.start, edit.end)):
+        pieces.append(content[position:edit.start])
+        pieces.append(edit.text)
+        position = edit.end
+    pieces.append(content[position:])
+    return "".join(pieces)
+
+
+class PieceTable:
+    """Tampon d'édition d'un texte : suite de morceaux (texte source, début, fin).
+
+    Les morceaux pointent dans le texte d'origine ou dans les textes insérés,
+    sans copie. Les remplacements sont appliqués par lots (positions dans le
+    texte courant) ; `undo()` annule le dernier lot. Le texte n'est
+    matérialisé qu'à l'écriture, par tranches.
+    """
+
+    def __init__(self, original: str):
+        self._pieces: list[tuple[str, int, int]] = [(original, 0, len(original))] if original else []
+        self._previous: tuple[list, list[int]] | None = None  # morceaux et positions avant le dernier lot
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Recalcule les positions de début des morceaux (recherche par bisection)."""
+        self._starts = [0, *accumulate(end - start for _, start, end in self._pieces)]
+
+    def __len__(self) -> int:
+        return self._starts[-1]
+
+    def apply(self, edits: list[Edit]) -> None:
+        """Applique un lot de remplacements non chevauchants, en une passe sur les morceaux."""
+        edits = sorted(edits, key=lambda edit: (edit.start, edit.end))
+        pieces = []
+        index, offset = 0, 0  # morceau courant, position déjà consommée dans ce morceau
+
+        def copy_until(position: int) -> None:
+            nonlocal index, offset
+            while index < len(self._pieces) and self._starts[index + 1] <= position:
+                text, start, end = self._pieces[index]
+                if start + offset < end:
+                    pieces.append((text, start + offset, end))
+                index, offset = index + 1, 0
+            if index < len(self._pieces) and self._starts[index] + offset < position:
+                text, start, _ = self._pieces[index]
+                cut = position - self._starts[index]
+                pieces.append((text, start + offset, start + cut))
+                offset = cut
+
+        def skip_until(position: int) -> None:
+            nonlocal index, offset
+            while index < len(self._pieces) and self._starts[index + 1] <= position:
+                index, offset = index + 1, 0
+            if index < len(self._pieces):
+                offset = max(offset, position - self._starts[index])
+
+        for edit in edits:
+            copy_until(edit.start)
+            if edit.text:
+                pieces.append((edit.text, 0, len(edit.text)))
+            skip_until(edit.end)
+        copy_until(len(self))
+
+        self._previous = (self._pieces, self._starts)
+        self._pieces = pieces
+        self._reindex()
+
+    def undo(self) -> bool:
+        """Annule le dernier lot (un seul niveau) ; retourne False s'il n'y a rien à annuler."""
+        if self._previous is None:
+            return False
+        self._pieces, self._starts = self._previous
+        self._previous = None
+        return True
+
+    def slice(self, start: int, end: int) -> str:
+        """Texte courant entre deux positions (seuls les morceaux concernés sont copiés)."""
+        parts = []
+        index = max(bisect_left(self._starts, start + 1) - 1, 0)
+        while index < len(self._pieces) and self._starts[index] < end:
+            text, piece_start, piece_end = self._pieces[index]
+            low = piece_start + max(start - self._starts[index], 0)
+            high = piece_end - max(self._starts[index + 1] - end, 0)
+            parts.append(text[low:high])
+            index += 1
+        return "".join(parts)
+
+    def write(self, path: Path) -> None:
+        """Écrit le texte courant dans un fichier temporaire voisin, puis le renomme (atomique, droits conservés)."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for text, start, end in self._pieces:
+                    for position in range(start, end, WRITE_CHUNK):
+                        f.write(text[position:min(position + WRITE_CHUNK, end)])
+            if path.exists():
+                shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+def count_index(index: dict[str, list[Block]], content: str) -> None:
+    """Reporte dans le profil le scan (un seul appel regex pour tous les champs) et ses correspondances."""
+    PROFILER.count("octets scannés", len(content.encode("utf-8")))
+    PROFILER.count("regex.appels.catalogue (tous champs)")
+    for blocks in index.values():
+        PROFILER.count("regex.correspondances.name", len(blocks))
+        for block in blocks:
+            for key in block.fields:
+                PROFILER.count(f"regex.correspondances.{key}")
+
+
+def content_digest(text: str) -> str:
+    """Empreinte courte (BLAKE2b, 16 caractères hexadécimaux) d'un texte."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def record_digest(classification: Classification) -> str:
+    """Empreinte d'une classification (tous ses champs)."""
+    return content_digest(repr(astuple(classification)))
+
+
+def state_path_for(file_path: Path) -> Path:
+    """Fichier d'état de l'application incrémentale, à côté du catalogue (non versionné)."""
+    return file_path.with_name(f".{file_path.name}.lgpd-state.json")
+
+
+def file_stamp(path: Path) -> list[int]:
+    """Taille et date de modification d'un fichier."""
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_state(state_path: Path) -> dict | None:
+    """État de la dernière application, ou None s'il est absent ou illisible.
+
+    Format : {"version", "stamp": [taille, mtime_ns] du catalogue,
+    "records": {nom: empreinte de la classification appliquée},
+    "blocks": {nom: [[début, fin, empreinte du bloc], ...]}}.
+    """
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        return None
+    return state
+
+
+def save_state(state_path: Path, state: dict) -> None:
+    """Écrit l'état (écriture atomique)."""
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(state, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, state_path)
+
+
+def block_at(content: str, start: int, end: int, name: str) -> Block | None:
+    """Re-tokenise un seul bloc à partir de positions enregistrées (None s'il n'est plus là)."""
+    blocks = index_blocks(content[start:end]).get(name)
+    if not blocks or len(blocks) != 1 or blocks[0].start != 0:
+        return None
+    fields = {key: (field_start + start, field_end + start) for key, (field_start, field_end) in blocks[0].fields.items()}
+    return Block(name=name, start=start, end=end, fields=fields)
+
+
+def locate_tracked(content: str, names, tracked: dict[str, list]) -> dict[str, list[Block]] | None:
+    """Blocs de `names` aux positions de l'état ; None si une position ou une empreinte ne correspond plus."""
+    located = {}
+    for name in names:
+        blocks = []
+        for start, end, digest in tracked[name]:
+            block = block_at(content, start, end, name)
+            if block is None or content_digest(content[start:end]) != digest:
+                return None
+            blocks.append(block)
+        located[name] = blocks
+    return located
+
+
+def shift_positions(tracked: dict[str, list], edits: list[Edit]) -> None:
+    """Décale les positions suivies après application des remplacements (en place)."""
+    edits = sorted(edits, key=lambda edit: (edit.start, edit.end))
+    starts = [edit.start for edit in edits]
+    deltas = [0, *accumulate(len(edit.text) - (edit.end - edit.start) for edit in edits)]
+
+    def shift(position: int) -> int:
+        return position + deltas[bisect_left(starts, position)]
+
+    for blocks in tracked.values():
+        for block in blocks:
+            block[0], block[1] = shift(block[0]), shift(block[1])
+
+
+@dataclass
+class Plan:
+    """Modifications planifiées par l'application incrémentale, et état résultant."""
+    edits: list[tuple[Block, Edit]]
+    updated: list[str]
+    missing: list[str]
+    skipped: int
+    records: dict[str, str]
+    tracked: dict[str, list]
+
+
+def plan_incremental(content: str, classifications: dict[str, Classification], digests: dict[str, str],
+                     state: dict | None, trusted: bool) -> Plan:
+    """Planifie les classifications changées depuis l'état, sans modifier le contenu.
+
+    `trusted` : le catalogue n'a pas été modifié depuis l'état, ses positions
+    sont utilisables.
+    """
+    records = dict(state["records"]) if state else {}
+    tracked = {name: [list(block) for block in blocks] for name, blocks in state["blocks"].items()} if state else {}
+
+    changed = [name for name in classifications if records.get(name) != digests[name]]
+    located = None
+    if trusted and all(name in tracked for name in changed):
+        with PROFILER.phase("relecture des blocs suivis"):
+            located = locate_tracked(content, changed, tracked)
+    if located is None:
+        with PROFILER.phase("indexation des blocs"):
+            index = index_blocks(content, set(tracked) | set(classifications))
+        if PROFILER.enabled:
+            count_index(index, content)
+        # Positions rafraîchies pour tous les noms suivis ; un bloc modifié par ailleurs est réappliqué
+        for name in set(tracked) | set(classifications):
+            current = [[block.start, block.end, content_digest(content[block.start:block.end])]
+                       for block in index.get(name, [])]
+            if [digest for *_, digest in current] != [digest for *_, digest in tracked.get(name, [])]:
+                records.pop(name, None)
+            tracked[name] = current
+        changed = [name for name in classifications if records.get(name) != digests[name]]
+        located = {name: index.get(name, []) for name in changed}
+
+    edits = []
+    updated = []
+    missing = [name for name in classifications if name not in located and not tracked.get(name)]
+    with PROFILER.phase("calcul des modifications"):
+        for name in changed:
+            records[name] = digests[name]
+            if not located[name]:
+                missing.append(name)
+                continue
+            for block in located[name]:
+                edits.extend((block, edit) for edit in plan_block_edits(block, classifications[name]))
+            updated.append(name)
+    PROFILER.count("modifications", len(edits))
+    PROFILER.count("logiciels inchangés (état)", len(classifications) - len(changed))
+    return Plan(edits, updated, missing, len(classifications) - len(changed), records, tracked)
+
+
+def patch_catalog_incremental(content: str, plan: Plan) -> tuple[PieceTable, int, dict]:
+    """Applique un plan à un tampon ; retourne (tampon, modifications effectives, nouvel état sans `stamp`)."""
+    # Les remplacements par une valeur identique ne produisent pas de morceau
+    edits = [edit for _, edit in plan.edits if content[edit.start:edit.end] != edit.text]
+    tracked = plan.tracked
+    with PROFILER.phase("assemblage"):
+        buffer = PieceTable(content)
+        buffer.apply(edits)
+        shift_positions(tracked, edits)
+        for name in plan.updated:
+            tracked[name] = [[start, end, content_digest(buffer.slice(start, end))] for start, end, _ in tracked[name]]
+    return buffer, len(edits), {"version": STATE_VERSION, "records": plan.records, "blocks": tracked}
+
+
+def edit_log(content: str, edits: list[tuple[Block, Edit]]) -> list[dict]:
+    """Journal des modifications effectives (valeur réellement changée), dans l'ordre du fichier."""
+    entries = []
+    line, position = 1, 0
+    for block, edit in sorted(edits, key=lambda item: (item[1].start, item[1].end)):
+        old = content[edit.start:edit.end]
+        if old == edit.text:
+            continue
+        line += content.count("\n", position, edit.start)
+        position = edit.start
+        entries.append({
+            "name": block.name,
+            "block": [block.start, block.end],
+            "field": edit.field,
+            "line": line,
+            "span": [edit.start, edit.end],
+            "old": old,
+            "new": edit.text,
+        })
+    return entries
+
+
+def render_diff(content: str, entries: list[dict], label: str, context: int = DIFF_CONTEXT):
+    """Diff unifié du journal, calculé hunk par hunk sur les seules lignes touchées (sans nouveau fichier)."""
+    yield f"--- a/{label}"
+    yield f"+++ b/{label}"
+
+    # Modifications regroupées en hunks quand leurs contextes se touchent
+    hunks = []
+    for entry in entries:
+        start, end = entry["span"]
+        last_line = entry["line"] + content.count("\n", start, end)
+        if hunks and entry["line"] - context <= hunks[-1][1] + context + 1:
+            hunks[-1][1] = max(hunks[-1][1], last_line)
+            hunks[-1][2].append(entry)
+        else:
+            hunks.append([entry["line"], last_line, [entry]])
+
+    header = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@$")
+    line_delta = 0
+    for first_line, last_line, hunk_entries in hunks:
+        # Lignes [first_line - context, last_line + context] du fichier d'origine
+        region_start = content.rfind("\n", 0, hunk_entries[0]["span"][0]) + 1
+        region_line = first_line
+        while region_line > max(1, first_line - context):
+            region_start = content.rfind("\n", 0, region_start - 1) + 1
+            region_line -= 1
+        region_end = hunk_entries[-1]["span"][1]
+        for _ in range(context + 1):
+            newline = content.find("\n", region_end)
+            if newline == -1:
+                region_end = len(content)
+                break
+            region_end = newline + 1
+
+        region = content[region_start:region_end]
+        edits = [Edit(entry["span"][0] - region_start, entry["span"][1] - region_start, entry["new"], entry["field"])
+                 for entry in hunk_entries]
+        old_lines = region.splitlines(keepends=True)
+        new_lines = splice(region, edits).splitlines(keepends=True)
+        offset = region_line - 1
+        for line in list(difflib.unified_diff(old_lines, new_lines, n=context))[2:]:
+            match = header.match(line.rstrip("\n"))
+            if match:
+                old_start, old_count, new_start, new_count = match.groups()
+                line = (f"@@ -{int(old_start) + offset}{old_count or ''} "
+                        f"+{int(new_start) + offset + line_delta}{new_count or ''} @@")
+            yield line.rstrip("\n")
+        line_delta += len(new_lines) - len(old_lines)
+
+
+def write_edit_log(path: Path, file_path: Path, entries: list[dict]) -> None:
+    """Écrit le journal JSON des modifications (vide si rien ne change)."""
+    log = {"catalog": str(file_path), "software": len({entry["name"] for entry in entries}), "edits": entries}
+    path.write_text(json.dumps(log, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(f"Journal des modifications: {path}")
+
+
+def apply_classifications(classifications: dict[str, Classification], file_path: Path = CATALOG_PATH,
+                          full: bool = False, dry_run: bool = False, edit_log_path: Path | None = None):
+    """Applique les classifications au fichier software-list.ts (une lecture, une écriture).
+
+    Seules les classifications changées depuis la dernière application sont
+    traitées ; `full` ignore l'état et retraite tout le catalogue. `dry_run`
+    affiche le diff unifié sans rien écrire ; `edit_log_path` reçoit le
+    journal JSON des modifications (champ, ancienne valeur, nouvelle valeur).
+    """
+    if not file_path.exists():
+        print(f"Erreur: Fichier non trouvé: {file_path}")
+        sys.exit(1)
+
+    state_path = state_path_for(file_path)
+    state = None if full else load_state(state_path)
+    digests = {name: record_digest(classification) for name, classification in classifications.items()}
+    trusted = state is not None and state["stamp"] == file_stamp(file_path)
+
+    if trusted and all(state["records"].get(name) == digest for name, digest in digests.items()):
+        # Ni le catalogue ni les classifications n'ont changé : rien à relire
+        for name in classifications:
+            if not state["blocks"].get(name):
+                print(f"⚠️  Non trouvé: {name}")
+        if edit_log_path:
+            write_edit_log(edit_log_path, file_path, [])
+        print(f"\n⚠️  Aucune modification effectuée ({len(classifications)} classifications inchangées)")
+        return
+
+    with PROFILER.phase("lecture"):
+        content = file_path.read_text(encoding="utf-8")
+    plan = plan_incremental(content, classifications, digests, state, trusted)
+
+    for software_name in plan.missing:
+        print(f"⚠️  Non trouvé: {software_name}")
+
+    if dry_run or edit_log_path:
+        with PROFILER.phase("journal des modifications"):
+            entries = edit_log(content, plan.edits)
+        if edit_log_path:
+            write_edit_log(edit_log_path, file_path, entries)
+    if dry_run:
+        for line in render_diff(content, entries, file_path.name):
+            print(line)
+        print(f"\n(DRY RUN) {len(entries)} modifications sur {len({entry['name'] for entry in entries})} logiciels, "
+              f"{file_path} non modifié")
+        return
+
+    buffer, changes, new_state = patch_catalog_incremental(content, plan)
+    for software_name in plan.updated:
+        print(f"✅ {software_name}: Niveau {classifications[software_name].level}")
+    if plan.skipped:
+        print(f"   {plan.skipped} classifications inchangées depuis la dernière application")
+
+    if changes:
+        with PROFILER.phase("écriture"):
+            buffer.write(file_path)
+        print(f"\n{'=' * 60}")
+        print(f"✅ {len(plan.updated)} logiciels mis à jour")
+        print(f"Fichier sauvegardé: {file_path}")
+    else:
+        print("\n⚠️  Aucune modification effectuée")
+    save_state(state_path, {**new_state, "stamp": file_stamp(file_path)})
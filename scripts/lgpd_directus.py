@@ -0,0 +1,217 @@
+"""
+Client HTTP Directus minimal pour les scripts Python (bibliothèque standard).
+
+- connexions keep-alive réutilisées via un pool borné (une par requête en vol)
+- nouvelles tentatives avec backoff exponentiel sur erreurs réseau, 429 et 5xx
+- lecture paginée des collections et mise à jour par lots (PATCH /items/<collection>)
+- map_software() : même conversion vers le format `Software` que server/utils/directus.ts
+
+Configuration : DIRECTUS_URL et DIRECTUS_TOKEN (variables d'environnement ou
+fichier .env à la racine, comme les scripts de migration TypeScript). Le
+token est optionnel en lecture (permissions publiques).
+"""
+
+import http.client
+import json
+import os
+import queue
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import quote, urlencode, urlsplit
+
+ENV_PATH = Path(__file__).parent.parent / ".env"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class DirectusError(Exception):
+    """Erreur renvoyée par Directus (statut HTTP non récupérable ou tentatives épuisées)."""
+
+
+def load_env(path: Path = ENV_PATH) -> dict[str, str]:
+    """Lit DIRECTUS_URL et DIRECTUS_TOKEN depuis l'environnement, puis depuis .env."""
+    values = {}
+    if path.exists():
+        for line in path.read_text(encoding="utf-8").splitlines():
+            key, separator, value = line.partition("=")
+            if separator and key.strip() in ("DIRECTUS_URL", "DIRECTUS_TOKEN"):
+                values[key.strip()] = value.strip().strip("'\"")
+    for key in ("DIRECTUS_URL", "DIRECTUS_TOKEN"):
+        if os.environ.get(key):
+            values[key] = os.environ[key]
+    return values
+
+
+class DirectusClient:
+    """Client REST Directus avec pool de connexions keep-alive et nouvelles tentatives."""
+
+    def __init__(self, url: str, token: str | None = None, pool_size: int = 4,
+                 retries: int = 3, timeout: float = 30.0, backoff: float = 0.5):
+        parts = urlsplit(url.rstrip("/"))
+        self.scheme = parts.scheme or "http"
+        self.netloc = parts.netloc
+        self.base_path = parts.path
+        self.token = token
+        self.retries = retries
+        self.timeout = timeout
+        self.backoff = backoff
+        self.pool: queue.LifoQueue = queue.LifoQueue()
+        for _ in range(pool_size):
+            self.pool.put(None)  # connexions créées à la demande
+
+    def _connect(self) -> http.client.HTTPConnection:
+        connection_class = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return connection_class(self.netloc, timeout=self.timeout)
+
+    def _headers(self) -> dict[str, str]:
+        headers = {"Content-Type": "application/json", "Accept": "application/json", "Connection": "keep-alive"}
+        if self.token:
+            headers["Authorization"] = self.token if self.token.startswith("Bearer ") else f"Bearer {self.token}"
+        return headers
+
+    def request(self, method: str, path: str, body=None):
+        """Envoie une requête et retourne le champ `data` de la réponse JSON."""
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else None
+        connection = self.pool.get()  # bloque si toutes les connexions sont occupées
+        try:
+            for attempt in range(self.retries + 1):
+                if connection is None:
+                    connection = self._connect()
+                try:
+                    connection.request(method, self.base_path + path, body=payload, headers=self._headers())
+                    response = connection.getresponse()
+                    raw = response.read()
+                except (OSError, http.client.HTTPException) as error:
+                    connection.close()
+                    connection = None
+                    if attempt == self.retries:
+                        raise DirectusError(f"{method} {path} → {error}") from error
+                else:
+                    if response.status < 400:
+                        return json.loads(raw)["data"] if raw else None
+                    if response.status not in RETRY_STATUSES or attempt == self.retries:
+                        raise DirectusError(f"{method} {path} → {response.status}: {raw.decode('utf-8', 'replace')}")
+                time.sleep(self.backoff * 2 ** attempt)
+        finally:
+            self.pool.put(connection)
+
+    def read_items(self, collection: str, fields: list[str], filter: dict | None = None,
+                   sort: str | None = None, page_size: int = 500):
+        """Itère sur les items d'une collection, page par page (jamais `limit=-1`)."""
+        page = 1
+        while True:
+            params = {"fields": ",".join(fields), "limit": page_size, "page": page}
+            if filter:
+                params["filter"] = json.dumps(filter)
+            if sort:
+                params["sort"] = sort
+            items = self.request("GET", f"/items/{quote(collection)}?{urlencode(params)}")
+            yield from items
+            if len(items) < page_size:
+                return
+            page += 1
+
+    def update_items(self, collection: str, items: list[dict]):
+        """Met à jour plusieurs items en une requête (chaque item porte sa clé `id`)."""
+        return self.request("PATCH", f"/items/{quote(collection)}", items)
+
+    def close(self) -> None:
+        """Ferme les connexions ouvertes du pool."""
+        while not self.pool.empty():
+            connection = self.pool.get_nowait()
+            if connection is not None:
+                connection.close()
+
+
+# Mêmes champs que SOFTWARE_FIELDS (server/utils/directus.ts)
+SOFTWARE_FIELDS = [
+    "*",
+    "categories.category_id.id",
+    "categories.category_id.name",
+    "categories.category_id.icon",
+    "pedagogical_activities.pedagogical_activity_id.id",
+    "pedagogical_activities.pedagogical_activity_id.name",
+    "pedagogical_activities.pedagogical_activity_id.icon",
+    "alternatives.alternative_id.id",
+]
+
+# Libellés de data_location, comme mapDataLocationLabel() (us_dpf / us_no_dpf : dépréciés V1.4)
+DATA_LOCATION_LABELS = {
+    "switzerland": "Suisse",
+    "eu_eea": "Union européenne / EEE",
+    "adequate": "Pays adéquat (UK, Canada, Japon, Corée du Sud…)",
+    "united_states": "États-Unis",
+    "us_dpf": "États-Unis",
+    "us_no_dpf": "États-Unis",
+    "multi_or_partial": "Hébergement multi-régions / réparti",
+    "other": "Autre / non adéquat / inconnu",
+}
+CONTRACTUAL_SAFEGUARDS = ("dpa", "eu_data_boundary", "scc", "dpf", "independent_audit", "guaranteed_hosting")
+
+
+def certification_level(hosting: int | None, rgpd: int | None, data_collection: int | None) -> int:
+    """Niveau global : 0 si un axe n'est pas évalué (null compris), sinon le max des 3 axes."""
+    values = [value or 0 for value in (hosting, rgpd, data_collection)]
+    return 0 if 0 in values else max(values)
+
+
+def timestamp_ms(value: str | None) -> int | None:
+    """Date ISO Directus → millisecondes depuis l'epoch (comme `new Date(value).getTime()`)."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+def map_software(item: dict) -> dict:
+    """Logiciel Directus → format `Software` du frontend, comme mapSoftware() en TS."""
+    hosting, rgpd, data_collection = (item.get(field) or 0 for field in
+                                      ("lgpd_hosting", "lgpd_rgpd", "lgpd_data_collection"))
+    categories = [ref["category_id"] for ref in item.get("categories") or [] if ref.get("category_id")]
+    activities = [ref["pedagogical_activity_id"] for ref in item.get("pedagogical_activities") or []
+                  if ref.get("pedagogical_activity_id")]
+    software = {
+        "id": item["id"],
+        "name": item["name"],
+        "icon": item.get("icon"),
+        "shortDescription": item.get("short_description"),
+        "description": item.get("description"),
+        "lgpd": {"hosting": hosting, "rgpd": rgpd, "dataCollection": data_collection},
+        "certificationLevel": certification_level(hosting, rgpd, data_collection),
+        "dataLocation": DATA_LOCATION_LABELS.get(item.get("data_location"), "Non renseigné"),
+        "requiresEduAccount": item.get("requires_edu_account"),
+        "requiresEdulog": item.get("requires_edulog"),
+        "approvedBySEN": item.get("approved_by_sen"),
+        "approvedBySFP": item.get("approved_by_sfp"),
+        "cost": item.get("cost") or "Gratuit",
+        "fundedBySFP": item.get("funded_by_sfp") or False,
+        "fundedBySEN": item.get("funded_by_sen") or False,
+        "contractualSafeguards": [value for value in item.get("contractual_safeguards") or []
+                                  if value in CONTRACTUAL_SAFEGUARDS],
+        "toolUrl": item.get("tool_url"),
+        "documentation": item.get("doc_url"),
+        "targetAudience": item.get("target_audience"),
+        "requiresParentalConsent": item.get("requires_parental_consent"),
+        "usageNotes": item.get("notes"),
+        "categories": [{"name": ref["name"], "icon": ref.get("icon")} for ref in categories],
+        "pedagogicalActivities": [{"name": ref["name"], "icon": ref.get("icon")} for ref in activities],
+        "alternatives": [ref["alternative_id"]["id"] for ref in item.get("alternatives") or []
+                         if (ref.get("alternative_id") or {}).get("id")],
+    }
+    # Champs `undefined` en TS : absents du JSON
+    for key, field in (("createdAt", "date_created"), ("updatedAt", "date_updated")):
+        value = timestamp_ms(item.get(field))
+        if value is not None:
+            software[key] = value
+    return software
+
+
+def client_from_env(url: str | None = None, **options) -> DirectusClient:
+    """Crée un client depuis DIRECTUS_URL/DIRECTUS_TOKEN (l'URL peut être forcée, ex: serveur de test)."""
+    env = load_env()
+    url = url or env.get("DIRECTUS_URL")
+    if not url:
+        raise DirectusError("DIRECTUS_URL requis (variable d'environnement ou .env)")
+    return DirectusClient(url, env.get("DIRECTUS_TOKEN"), **options)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Résolution approximative des noms de logiciels non classifiés.
+
+Un index inversé de trigrammes couvre les noms connus de la base de
+connaissances : clés éditeurs et alias (NAME_PATTERNS, produits Microsoft,
+société nommée en tête de la raison d'un éditeur : « Canva Pty Ltd (Australie), … »).
+Une société n'a une cible que si elle désigne l'éditeur lui-même (un seul
+éditeur la cite, et c'est son nom) ; sinon (« Google » cité par NotebookLM,
+« Readdle » par PDF Expert et Spark) elle est proposée comme simple indice
+de société, sans produit cible.
+Les noms des tables de classification n'y figurent pas : ils contiennent
+les noms non classifiés eux-mêmes, qui se retrouveraient à 1.00 au lieu de
+mener à un éditeur. Chaque mot est complété d'espaces comme dans pg_trgm
+(« chrome » → «   c», «  ch», « chr», …, « me »). Pour un nom recherché,
+seules les entrées qui partagent au moins un trigramme sont visitées ; la
+similarité est le coefficient de Jaccard des deux ensembles de trigrammes.
+
+Une faute de frappe (« ORTHOHPHORE ») ou un nom absent des motifs exacts
+(« Google Chrome ») retrouve ainsi son éditeur ou sa société.
+
+Usage:
+    python3 scripts/lgpd_fuzzy.py
+    python3 scripts/lgpd_fuzzy.py "Gogle Chrome" ORTHOHPHORE --limit 3
+"""
+
+import argparse
+import json
+import re
+import sys
+import unicodedata
+from functools import cache
+from pathlib import Path
+from typing import NamedTuple
+
+from lgpd_knowledge import load_section
+
+CLASSIFICATIONS_PATH = Path(__file__).parent / "lgpd-classifications.json"
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+# Société en tête de la raison d'un éditeur : « Wooclap SA (Belgique), … », « Microsoft/LinkedIn (USA) »
+COMPANY_PATTERN = re.compile(r"^(?!Entreprise\b)([^(,]+?)\s*\(")
+
+# Origine d'une entrée de l'index, par ordre de préférence à score égal
+SOURCES = ("éditeur", "alias", "société")
+
+
+class Candidate(NamedTuple):
+    """Candidat proposé pour un nom : libellé indexé, clé éditeur cible (None pour un indice de société), score."""
+    label: str
+    target: str | None
+    source: str
+    score: float
+
+
+def words(text: str) -> list[str]:
+    """Mots d'un texte normalisé (minuscules, sans accents)."""
+    text = "".join(char for char in unicodedata.normalize("NFD", text.lower()) if not unicodedata.combining(char))
+    return WORD_PATTERN.findall(text)
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Trigrammes d'un texte normalisé (minuscules, sans accents), mot par mot."""
+    grams = set()
+    for word in words(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class TrigramIndex:
+    """Index inversé trigramme → entrées ; la recherche ne visite que les listes des trigrammes du nom."""
+
+    def __init__(self):
+        self._entries: list[tuple[str, str, str]] = []
+        self._sizes: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        self._seen: set[tuple[str, str, str]] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, label: str, target: str | None, source: str) -> None:
+        """Indexe un libellé menant à `target`. Un doublon exact est ignoré."""
+        entry = (label, target, source)
+        grams = trigrams(label)
+        if entry in self._seen or not grams:
+            return
+        self._seen.add(entry)
+        entry_id = len(self._entries)
+        self._entries.append(entry)
+        self._sizes.append(len(grams))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(entry_id)
+
+    def search(self, name: str, limit: int = 5, threshold: float = 0.3) -> list[Candidate]:
+        """Candidats classés par similarité décroissante (le meilleur libellé de chaque cible ou indice)."""
+        grams = trigrams(name)
+        shared: dict[int, int] = {}
+        for gram in grams:
+            for entry_id in self._postings.get(gram, ()):
+                shared[entry_id] = shared.get(entry_id, 0) + 1
+
+        best: dict[tuple, Candidate] = {}
+        for entry_id, count in shared.items():
+            score = count / (len(grams) + self._sizes[entry_id] - count)
+            if score < threshold:
+                continue
+            label, target, source = self._entries[entry_id]
+            candidate = Candidate(label, target, source, round(score, 3))
+            key = (target,) if target is not None else (None, label)
+            if key not in best or self._rank(candidate) < self._rank(best[key]):
+                best[key] = candidate
+        return sorted(best.values(), key=self._rank)[:limit]
+
+    @staticmethod
+    def _rank(candidate: Candidate) -> tuple:
+        """Clé de tri : score décroissant, puis origine (SOURCES), puis libellé."""
+        return -candidate.score, SOURCES.index(candidate.source), candidate.label
+
+
+@cache
+def build_fuzzy_index() -> TrigramIndex:
+    """Index des clés éditeurs et des alias de la base de connaissances."""
+    index = TrigramIndex()
+    vendors = {"Microsoft": None}
+    for level_vendors in load_section("COMPANY_DATABASE").values():
+        vendors.update(level_vendors)
+    for key in vendors:
+        index.add(key, key, "éditeur")
+    # Société → éditeurs qui la citent ; une société qui est elle-même un éditeur (Microsoft) est ignorée
+    known = {key.casefold() for key in vendors}
+    citing: dict[str, list[str]] = {}
+    for key, vendor in vendors.items():
+        company = COMPANY_PATTERN.match(vendor["reason"]) if vendor else None
+        for label in company.group(1).split("/") if company else ():
+            if label.casefold() not in known:
+                citing.setdefault(label, []).append(key)
+    for label, keys in citing.items():
+        # « Canva Pty Ltd » → Canva ; « Google » (NotebookLM) ou « Wooclap SA » (deux éditeurs) : indice seul
+        same_entry = len(keys) == 1 and set(words(keys[0])) <= set(words(label))
+        index.add(label, keys[0] if same_entry else None, "société")
+    for ms_product in load_section("MICROSOFT_PRODUCTS"):
+        index.add(ms_product, "Microsoft", "alias")
+    for pattern, key in load_section("NAME_PATTERNS").items():
+        index.add(pattern, key, "alias")
+    return index
+
+
+def resolve(name: str, limit: int = 5, threshold: float = 0.3) -> list[Candidate]:
+    """Candidats de la base de connaissances pour un nom non classifié."""
+    return build_fuzzy_index().search(name, limit, threshold)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Résolution approximative des noms de logiciels non classifiés")
+    parser.add_argument("names", nargs="*",
+                        help="noms à résoudre (défaut: non classifiés de scripts/lgpd-classifications.json)")
+    parser.add_argument("--limit", type=int, default=3, help="candidats par nom (défaut: 3)")
+    parser.add_argument("--threshold", type=float, default=0.3, help="similarité minimale (défaut: 0.3)")
+    args = parser.parse_args()
+
+    names = args.names
+    if not names:
+        if not CLASSIFICATIONS_PATH.exists():
+            print(f"Erreur: Fichier non trouvé: {CLASSIFICATIONS_PATH} (lancer d'abord classify-lgpd.py)")
+            sys.exit(1)
+        names = json.loads(CLASSIFICATIONS_PATH.read_text(encoding="utf-8"))["unclassified"]
+
+    index = build_fuzzy_index()
+    print(f"Index: {len(index)} noms connus")
+    unresolved = 0
+    for name in names:
+        candidates = index.search(name, args.limit, args.threshold)
+        if not candidates:
+            unresolved += 1
+            print(f"\n⚠️  {name}: aucun candidat")
+            continue
+        print(f"\n{name}")
+        for candidate in candidates:
+            if candidate.target is None:
+                print(f"  {candidate.score:.2f}  {candidate.label} ({candidate.source}, sans produit)")
+                continue
+            target = "" if candidate.target == candidate.label else f" → {candidate.target}"
+            print(f"  {candidate.score:.2f}  {candidate.label}{target} ({candidate.source})")
+    print(f"\n✅ {len(names) - unresolved}/{len(names)} noms avec au moins un candidat")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Juridictions d'une localisation de données sous forme de masque de bits.
+
+Les valeurs `dataLocation` sont du texte libre (« États-Unis/Australie »,
+« Union Européenne (AWS) », « États-Unis (option UE/CH) », « Local/États-Unis »).
+Chaque localisation est analysée une seule fois en un entier combinant les
+drapeaux de `Jurisdictions`, stocké avec la classification (champ
+`jurisdictions`). Un filtre comme « tout ce qui peut toucher des serveurs
+US » devient un ET bit à bit sur tout le catalogue.
+
+Usage:
+    python3 scripts/lgpd_jurisdictions.py "États-Unis (option UE/CH)" "Local/États-Unis"
+"""
+
+import argparse
+import re
+from enum import IntFlag
+from functools import cache
+
+
+class Jurisdictions(IntFlag):
+    """Juridictions pouvant héberger les données d'un logiciel."""
+    CH = 1 << 0
+    EU = 1 << 1
+    UK = 1 << 2
+    US = 1 << 3
+    CA = 1 << 4
+    CN = 1 << 5
+    OPTION_EU = 1 << 6   # hébergement UE/CH disponible en option
+    LOCAL = 1 << 7       # données stockées sur l'appareil
+    OTHER = 1 << 8       # pays identifié hors de la liste ci-dessus (Australie, Corée du Sud...)
+    UNKNOWN = 1 << 9     # localisation inconnue ou absente
+
+
+# Motifs de la localisation (texte en minuscules) → drapeau, testés sur chaque segment
+SEGMENT_PATTERNS = [
+    (Jurisdictions.UNKNOWN, re.compile(r"inconnu|unknown|\?")),
+    (Jurisdictions.LOCAL, re.compile(r"\blocal")),
+    (Jurisdictions.CH, re.compile(r"suisse|\bch\b|switzerland")),
+    (Jurisdictions.US, re.compile(r"états-unis|etats-unis|\busa?\b|united states")),
+    (Jurisdictions.UK, re.compile(r"royaume-uni|\buk\b|united kingdom")),
+    (Jurisdictions.CA, re.compile(r"canada|québec")),
+    (Jurisdictions.CN, re.compile(r"chine|china")),
+    (Jurisdictions.EU, re.compile(r"union européenne|\bue\b|\beu\b|europe|france|allemagne|autriche|belgique"
+                                  r"|espagne|hongrie|irlande|italie|luxembourg|pays-bas|portugal|suède|tchéquie"
+                                  r"|norvège|finlande|danemark")),
+    (Jurisdictions.OTHER, re.compile(r"australie|corée|japon|israël|ukraine|inde|russie|singapour|brésil")),
+    # Infrastructure mondiale : les données peuvent transiter partout, États-Unis compris
+    (Jurisdictions.US | Jurisdictions.OTHER, re.compile(r"global|mondial|multi")),
+]
+# Catégories `data_location` de Directus (voir lgpd_sources.map_location)
+DATA_LOCATION_CATEGORIES = {
+    "switzerland": Jurisdictions.CH,
+    "eu_eea": Jurisdictions.EU,
+    "adequate": Jurisdictions.OTHER,
+    "united_states": Jurisdictions.US,
+    "us_dpf": Jurisdictions.US,
+    "us_no_dpf": Jurisdictions.US,
+    "multi_or_partial": Jurisdictions.US | Jurisdictions.OTHER,
+    "other": Jurisdictions.UNKNOWN,
+}
+HORS_UE_PATTERN = re.compile(r"hors (ue|union)")
+# Parenthèse décrivant un hébergement européen optionnel : « (option UE/CH) », « (UE Enterprise) »...
+OPTION_PATTERN = re.compile(r"\(([^)]*(option|disponible|configurable|enterprise)[^)]*)\)")
+
+
+def _segment_flags(segment: str) -> Jurisdictions:
+    """Drapeaux d'un segment de localisation (parenthèses déjà retirées)."""
+    if HORS_UE_PATTERN.search(segment):
+        return Jurisdictions.OTHER
+    flags = Jurisdictions(0)
+    for flag, pattern in SEGMENT_PATTERNS:
+        if pattern.search(segment):
+            flags |= flag
+    return flags
+
+
+@cache
+def parse_location(location: str | None) -> int:
+    """Analyse une localisation texte (ou catégorie Directus) en masque de juridictions, mis en cache par valeur."""
+    text = (location or "").strip().lower()
+    if not text:
+        return int(Jurisdictions.UNKNOWN)
+    if text in DATA_LOCATION_CATEGORIES:
+        return int(DATA_LOCATION_CATEGORIES[text])
+
+    mask = Jurisdictions(0)
+    # « (option UE/CH) », « (option) » : hébergement européen possible, pas garanti
+    if OPTION_PATTERN.search(text):
+        mask |= Jurisdictions.OPTION_EU
+    # Les autres parenthèses (« (AWS) », « (SCCs UE) ») précisent l'infrastructure
+    # ou les garanties, pas la juridiction
+    text = re.sub(r"\([^)]*\)", " ", text)
+
+    for segment in re.split(r"[/,+]| et ", text):
+        mask |= _segment_flags(segment)
+    if not mask & ~Jurisdictions.OPTION_EU:
+        mask |= Jurisdictions.UNKNOWN
+    return int(mask)
+
+
+def parse_flags(names: list[str]) -> int:
+    """Noms de drapeaux (« US », « option_eu ») → masque ; ValueError si un nom est inconnu."""
+    mask = 0
+    for name in names:
+        try:
+            mask |= Jurisdictions[name.upper().replace("-", "_")]
+        except KeyError:
+            raise ValueError(f"Juridiction inconnue: {name} (valeurs: {', '.join(j.name for j in Jurisdictions)})")
+    return mask
+
+
+def flag_names(mask: int) -> list[str]:
+    """Masque → noms des drapeaux actifs."""
+    return [flag.name for flag in Jurisdictions if mask & flag]
+
+
+def select(masks, any_of: int = 0, none_of: int = 0) -> list[int]:
+    """Indices des masques contenant au moins un drapeau de `any_of` et aucun de `none_of`."""
+    return [
+        index for index, mask in enumerate(masks)
+        if (not any_of or mask & any_of) and not mask & none_of
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyse des localisations en masques de juridictions")
+    parser.add_argument("locations", nargs="+", help="valeurs dataLocation à analyser")
+    args = parser.parse_args()
+
+    for location in args.locations:
+        mask = parse_location(location)
+        print(f"  {location}: {mask:#06x} {' | '.join(flag_names(mask))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Base de connaissances LGPD externalisée (scripts/knowledge-base/*.json).
+
+Chaque section (COMPANY_DATABASE, NAME_PATTERNS, CLASSIFICATIONS...) est un
+fichier JSON versionné `{"version": N, "data": ...}`, chargé uniquement
+quand un script en a besoin. Au premier chargement, la section est compilée
+dans un cache binaire (marshal) sous knowledge-base/.cache/ ; les runs
+suivants lisent ce cache via mmap tant que le JSON source n'a pas changé
+(taille + date de modification).
+"""
+
+import json
+import marshal
+import mmap
+import os
+import struct
+from functools import cache
+from pathlib import Path
+
+KNOWLEDGE_BASE_DIR = Path(__file__).parent / "knowledge-base"
+CACHE_DIR = KNOWLEDGE_BASE_DIR / ".cache"
+SUPPORTED_VERSION = 1
+
+# Nom de la section → fichier JSON
+SECTIONS = {
+    "COMPANY_DATABASE": "company-database.json",
+    "NAME_PATTERNS": "name-patterns.json",
+    "MICROSOFT_PRODUCTS": "microsoft-products.json",
+    "MICROSOFT_ENTRY": "microsoft-entry.json",
+    "CLASSIFICATIONS": "classifications.json",
+    "REMAINING_CLASSIFICATIONS": "remaining-classifications.json",
+    "DESCRIPTIONS": "descriptions.json",
+}
+
+# En-tête du cache : magic, version du format, taille et mtime du JSON source
+CACHE_HEADER = struct.Struct("<8sIqq")
+CACHE_MAGIC = b"LGPDKB01"
+
+
+def source_path(section: str) -> Path:
+    """Chemin du fichier JSON d'une section."""
+    if section not in SECTIONS:
+        raise KeyError(f"Section inconnue de la base de connaissances: {section}")
+    return KNOWLEDGE_BASE_DIR / SECTIONS[section]
+
+
+def read_cache(cache_path: Path, stat: os.stat_result):
+    """Lit une section depuis son cache binaire (mmap), ou None si absent ou périmé."""
+    try:
+        with open(cache_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if len(mapped) < CACHE_HEADER.size:
+                return None
+            magic, version, size, mtime_ns = CACHE_HEADER.unpack_from(mapped)
+            if (magic, version, size, mtime_ns) != (CACHE_MAGIC, SUPPORTED_VERSION, stat.st_size, stat.st_mtime_ns):
+                return None
+            with memoryview(mapped) as view:
+                return marshal.loads(view[CACHE_HEADER.size:])
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+
+
+def write_cache(cache_path: Path, stat: os.stat_result, data) -> None:
+    """Écrit le cache binaire d'une section (écriture atomique, erreurs ignorées)."""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(CACHE_HEADER.pack(CACHE_MAGIC, SUPPORTED_VERSION, stat.st_size, stat.st_mtime_ns))
+            f.write(marshal.dumps(data))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+@cache
+def load_section(section: str):
+    """Charge une section de la base de connaissances (cache binaire si à jour, sinon JSON)."""
+    path = source_path(section)
+    stat = path.stat()
+    cache_path = CACHE_DIR / f"{path.stem}.marshal"
+
+    data = read_cache(cache_path, stat)
+    if data is not None:
+        return data
+
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if document.get("version") != SUPPORTED_VERSION:
+        raise ValueError(
+            f"{path.name}: version {document.get('version')} non supportée (attendu {SUPPORTED_VERSION})"
+        )
+    data = document["data"]
+    write_cache(cache_path, stat, data)
+    return data
+
+
+def lazy_attributes(**factories):
+    """Retourne un `__getattr__` de module qui construit chaque attribut au premier accès.
+
+    Exemple: `__getattr__ = lazy_attributes(NAME_PATTERNS=lambda: load_section("NAME_PATTERNS"))`
+    """
+    cached_factories = {name: cache(factory) for name, factory in factories.items()}
+
+    def __getattr__(name: str):
+        if name in cached_factories:
+            return cached_factories[name]()
+        raise AttributeError(name)
+
+    return __getattr__
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Miroir local SQLite de la collection Directus `software`.
+
+La première synchronisation récupère toute la collection (paginée) ; les
+suivantes ne demandent que les lignes dont `date_updated` (ou
+`date_created` pour les lignes jamais modifiées) est postérieure au dernier
+point de reprise enregistré dans la base. Les suppressions ne sont pas
+visibles en incrémental : `--full` relit tout et retire les lignes disparues.
+
+Les scripts peuvent ensuite travailler hors ligne sur une copie à jour :
+
+    python3 scripts/lgpd_mirror.py sync lgpd-mirror.sqlite
+    python3 scripts/lgpd_mirror.py export lgpd-mirror.sqlite | python3 scripts/classify-lgpd.py --ndjson
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+from lgpd_directus import SOFTWARE_FIELDS, DirectusError, client_from_env
+from lgpd_profile import PROFILER, add_profile_arguments, run_profiled
+
+MIRROR_PATH = Path(__file__).parent / "lgpd-mirror.sqlite"
+
+# Champs scalaires copiés en colonnes ; les relations sont gardées en JSON, et
+# l'item Directus complet (SOFTWARE_FIELDS) dans la colonne `item`
+SCALAR_FIELDS = [
+    "id", "status", "name", "short_description", "description",
+    "lgpd_hosting", "lgpd_rgpd", "lgpd_data_collection", "data_location", "notes",
+    "date_created", "date_updated",
+]
+RELATION_COLUMNS = ["categories", "pedagogical_activities", "alternatives"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS software (
+    id TEXT PRIMARY KEY,
+    status TEXT,
+    name TEXT NOT NULL,
+    short_description TEXT,
+    description TEXT,
+    lgpd_hosting INTEGER,
+    lgpd_rgpd INTEGER,
+    lgpd_data_collection INTEGER,
+    data_location TEXT,
+    notes TEXT,
+    date_created TEXT,
+    date_updated TEXT,
+    categories TEXT NOT NULL DEFAULT '[]',
+    pedagogical_activities TEXT NOT NULL DEFAULT '[]',
+    alternatives TEXT NOT NULL DEFAULT '[]',
+    item TEXT NOT NULL DEFAULT '{}'
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_mirror_status ON software(status);
+CREATE INDEX IF NOT EXISTS idx_mirror_name ON software(name);
+CREATE INDEX IF NOT EXISTS idx_mirror_data_location ON software(data_location);
+"""
+
+# Colonnes ajoutées après coup : un miroir plus ancien est complété puis entièrement resynchronisé
+ADDED_COLUMNS = {
+    "pedagogical_activities": "TEXT NOT NULL DEFAULT '[]'",
+    "item": "TEXT NOT NULL DEFAULT '{}'",
+}
+
+
+def open_mirror(path: Path) -> sqlite3.Connection:
+    """Ouvre (et crée si besoin) la base miroir."""
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(software)")}
+    missing = [column for column in ADDED_COLUMNS if column not in columns]
+    for column in missing:
+        connection.execute(f"ALTER TABLE software ADD COLUMN {column} {ADDED_COLUMNS[column]}")
+    if missing:
+        connection.execute("DELETE FROM sync_state WHERE key = 'checkpoint'")
+        connection.commit()
+    return connection
+
+
+def get_checkpoint(connection: sqlite3.Connection) -> str | None:
+    """Dernier horodatage synchronisé (None si le miroir est vide)."""
+    row = connection.execute("SELECT value FROM sync_state WHERE key = 'checkpoint'").fetchone()
+    return row[0] if row else None
+
+
+def changed_since(checkpoint: str) -> dict:
+    """Filtre Directus des lignes modifiées (ou créées sans modification) depuis `checkpoint`.
+
+    `_gte` plutôt que `_gt` : une ligne modifiée dans la même seconde que le
+    point de reprise est relue, l'upsert la rend idempotente.
+    """
+    return {"_or": [
+        {"date_updated": {"_gte": checkpoint}},
+        {"_and": [{"date_updated": {"_null": True}}, {"date_created": {"_gte": checkpoint}}]},
+    ]}
+
+
+def item_row(item: dict) -> tuple:
+    """Ligne SQLite d'un item Directus (relations aplaties en listes JSON)."""
+    categories = [ref["category_id"]["name"] for ref in item.get("categories") or [] if ref.get("category_id")]
+    activities = [
+        ref["pedagogical_activity_id"]["name"]
+        for ref in item.get("pedagogical_activities") or [] if ref.get("pedagogical_activity_id")
+    ]
+    alternatives = [ref["alternative_id"]["id"] for ref in item.get("alternatives") or [] if ref.get("alternative_id")]
+    return (
+        *(item.get(field) for field in SCALAR_FIELDS),
+        json.dumps(categories, ensure_ascii=False),
+        json.dumps(activities, ensure_ascii=False),
+        json.dumps(alternatives),
+        json.dumps(item, ensure_ascii=False),
+    )
+
+
+def sync_mirror(client, path: Path = MIRROR_PATH, full: bool = False, page_size: int = 500) -> tuple[int, int]:
+    """Synchronise le miroir ; retourne (lignes reçues, lignes supprimées)."""
+    connection = open_mirror(path)
+    try:
+        checkpoint = None if full else get_checkpoint(connection)
+        filter = changed_since(checkpoint) if checkpoint else None
+        columns = SCALAR_FIELDS + RELATION_COLUMNS + ["item"]
+        upsert = (
+            f"INSERT INTO software ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT(id) DO UPDATE SET "
+            + ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+        )
+
+        received = 0
+        latest = checkpoint
+        seen_ids = []
+        with PROFILER.phase("lecture Directus (paginée)"):
+            items = client.read_items("software", SOFTWARE_FIELDS, filter=filter, sort="id", page_size=page_size)
+            for item in items:
+                connection.execute(upsert, item_row(item))
+                stamp = item.get("date_updated") or item.get("date_created")
+                if stamp and (latest is None or stamp > latest):
+                    latest = stamp
+                if full:
+                    seen_ids.append(item["id"])
+                received += 1
+
+        removed = 0
+        if full:
+            with PROFILER.phase("suppression des lignes disparues"):
+                connection.execute("CREATE TEMP TABLE seen (id TEXT PRIMARY KEY)")
+                connection.executemany("INSERT OR IGNORE INTO seen VALUES (?)", ((id,) for id in seen_ids))
+                removed = connection.execute("DELETE FROM software WHERE id NOT IN (SELECT id FROM seen)").rowcount
+
+        if latest:
+            connection.execute(
+                "INSERT INTO sync_state (key, value) VALUES ('checkpoint', ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (latest,),
+            )
+        connection.commit()
+        PROFILER.count("lignes reçues", received)
+        return received, removed
+    finally:
+        connection.close()
+
+
+def _select(path: Path, columns: list[str], status: str | None):
+    """Itère sur les lignes (dict) du miroir, filtrées par statut, triées par nom."""
+    connection = open_mirror(path)
+    connection.row_factory = sqlite3.Row
+    try:
+        sql = f"SELECT {', '.join(columns)} FROM software"
+        parameters = []
+        if status:
+            sql += " WHERE status = ?"
+            parameters.append(status)
+        for row in connection.execute(sql + " ORDER BY name, id", parameters):
+            yield dict(row)
+    finally:
+        connection.close()
+
+
+def iter_mirror_records(path: Path = MIRROR_PATH, status: str | None = "published"):
+    """Itère sur les logiciels du miroir (publiés par défaut), un objet par ligne."""
+    for record in _select(path, SCALAR_FIELDS + RELATION_COLUMNS, status):
+        for column in RELATION_COLUMNS:
+            record[column] = json.loads(record[column])
+        yield record
+
+
+def iter_mirror_items(path: Path = MIRROR_PATH, status: str | None = "published"):
+    """Itère sur les items Directus complets du miroir (format SOFTWARE_FIELDS)."""
+    for record in _select(path, ["item"], status):
+        yield json.loads(record["item"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Miroir local SQLite de la collection Directus software")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sync_parser = subparsers.add_parser("sync", help="synchronise le miroir (incrémental par défaut)")
+    sync_parser.add_argument("database", type=Path, nargs="?", default=MIRROR_PATH)
+    sync_parser.add_argument("--url", help="URL Directus (défaut: DIRECTUS_URL de l'environnement ou de .env)")
+    sync_parser.add_argument("--full", action="store_true", help="relit toute la collection et retire les lignes supprimées")
+    sync_parser.add_argument("--page-size", type=int, default=500, help="items par page")
+    add_profile_arguments(sync_parser)
+
+    export_parser = subparsers.add_parser("export", help="exporte le miroir en NDJSON sur stdout")
+    export_parser.add_argument("database", type=Path, nargs="?", default=MIRROR_PATH)
+    export_parser.add_argument("--status", default="published", help="statut à exporter (vide = tous)")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        if not args.database.exists():
+            print(f"Erreur: miroir introuvable: {args.database}")
+            sys.exit(1)
+        for record in iter_mirror_records(args.database, args.status or None):
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return
+
+    try:
+        client = client_from_env(args.url, pool_size=1)
+        try:
+            received, removed = run_profiled(args, sync_mirror, client, args.database, args.full, args.page_size)
+        finally:
+            client.close()
+    except DirectusError as error:
+        print(f"Erreur: {error}")
+        sys.exit(1)
+    print(f"✅ {received} lignes synchronisées" + (f", {removed} supprimées" if removed else ""))
+
+
+if __name__ == "__main__":
+    main()
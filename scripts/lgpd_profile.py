@@ -0,0 +1,85 @@
+"""
+Profilage par phase et compteurs des scripts LGPD (option --profile).
+
+Chaque script découpe son travail en phases (lecture, scan, classification,
+écriture...) et incrémente des compteurs (appels regex par champ, octets
+scannés, correspondances). Le rapport est écrit sur stderr à la fin du run ;
+`--profile-output` enregistre en plus un fichier cProfile (lisible avec pstats
+ou snakeviz).
+"""
+
+import cProfile
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+
+class Profiler:
+    """Collecte les durées par phase et les compteurs d'un run."""
+
+    def __init__(self):
+        self.enabled = False
+        self.phases: dict[str, float] = {}
+        self.counters: Counter = Counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Chronomètre une phase (les durées d'une même phase s'additionnent)."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def count(self, key: str, amount: int = 1) -> None:
+        """Incrémente un compteur (ignoré si le profilage est désactivé)."""
+        if self.enabled:
+            self.counters[key] += amount
+
+    def report(self, file=sys.stderr) -> None:
+        """Affiche le rapport des phases et compteurs."""
+        print(f"\n{'=' * 60}", file=file)
+        print("PROFIL", file=file)
+        print("=" * 60, file=file)
+        total = sum(self.phases.values())
+        for name, seconds in self.phases.items():
+            share = seconds / total * 100 if total else 0
+            print(f"  {name:<44} {seconds:>10.4f} s  {share:5.1f} %", file=file)
+        print(f"  {'total':<44} {total:>10.4f} s", file=file)
+        if self.counters:
+            print("\nCompteurs", file=file)
+            for key, value in sorted(self.counters.items()):
+                print(f"  {key:<44} {value:>12,}", file=file)
+
+
+PROFILER = Profiler()
+
+
+def add_profile_arguments(parser) -> None:
+    """Ajoute --profile et --profile-output à un parser argparse."""
+    parser.add_argument("--profile", action="store_true",
+                        help="affiche la durée de chaque phase et les compteurs (regex, octets, correspondances)")
+    parser.add_argument("--profile-output", metavar="FICHIER",
+                        help="enregistre aussi un profil cProfile dans FICHIER (implique --profile)")
+
+
+def run_profiled(args, function, *function_args):
+    """Exécute `function` en appliquant les options de profilage de `args`."""
+    if not (args.profile or args.profile_output):
+        return function(*function_args)
+
+    PROFILER.enabled = True
+    profile = cProfile.Profile() if args.profile_output else None
+    try:
+        if profile:
+            return profile.runcall(function, *function_args)
+        return function(*function_args)
+    finally:
+        PROFILER.report()
+        if profile:
+            profile.dump_stats(args.profile_output)
+            print(f"\nProfil cProfile sauvegardé dans: {args.profile_output}", file=sys.stderr)
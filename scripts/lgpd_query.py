@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Requêtes sur le catalogue classifié via des index bitmap.
+
+Chaque logiciel reçoit un numéro de ligne ; chaque valeur indexée (niveau,
+données personnelles, à valider, juridiction, catégorie, activité
+pédagogique) est un bitmap (entier Python, un bit par ligne). Un filtre
+composé comme « niveau ≤ 2 ET sans données personnelles ET catégorie quiz »
+est l'intersection (ET bit à bit) de quelques bitmaps.
+
+Sources : le miroir Directus (scripts/lgpd_mirror.py, par défaut) ou un flux
+NDJSON (sortie de classify-lgpd.py / lgpd_scoring.py). `personalData` et
+`toValidate` n'existent pas dans Directus : ils sont repris des tables de
+classification de la base de connaissances quand l'enregistrement ne les
+porte pas. L'index construit peut être conservé (`--index FICHIER`) et
+n'est reconstruit que si la source change.
+
+Usage:
+    python3 scripts/lgpd_query.py --max-level 2 --personal-data non --category Quiz
+    python3 scripts/lgpd_query.py --ndjson classifications.ndjson --jurisdiction US --count
+"""
+
+import argparse
+import json
+import marshal
+import sys
+import time
+from pathlib import Path
+
+from lgpd_directus import certification_level
+from lgpd_jurisdictions import Jurisdictions, parse_flags, parse_location
+from lgpd_knowledge import load_section
+from lgpd_mirror import MIRROR_PATH, iter_mirror_records
+
+INDEX_MAGIC = "LGPDQI01"
+
+
+def record_level(record: dict) -> int | None:
+    """Niveau global d'un enregistrement : certificationLevel, sinon règle de mapSoftware() sur les 3 axes."""
+    if "certificationLevel" in record:
+        return record["certificationLevel"]
+    axes = [record.get(field) for field in ("lgpd_hosting", "lgpd_rgpd", "lgpd_data_collection")]
+    if all(axis is None for axis in axes):
+        return None
+    return certification_level(*axes)
+
+
+def record_jurisdictions(record: dict) -> int:
+    """Masque de juridictions : champ précalculé, sinon analyse de la localisation."""
+    if record.get("jurisdictions") is not None:
+        return record["jurisdictions"]
+    return parse_location(record.get("dataLocation") or record.get("data_location"))
+
+
+def relation_names(values) -> list[str]:
+    """Noms d'une relation (liste de noms ou d'objets `{name}`), en minuscules."""
+    names = []
+    for value in values or []:
+        name = value.get("name") if isinstance(value, dict) else value
+        if name:
+            names.append(name.casefold())
+    return names
+
+
+class BitmapIndex:
+    """Index bitmap : (champ, valeur) → entier dont le bit i indique la ligne i."""
+
+    def __init__(self, names: list[str], bitmaps: dict[str, dict]):
+        self.names = names
+        self.bitmaps = bitmaps
+        self.all = (1 << len(names)) - 1
+
+    @classmethod
+    def build(cls, records) -> "BitmapIndex":
+        """Construit l'index à partir d'un itérable d'enregistrements."""
+        tables = {**load_section("CLASSIFICATIONS"), **load_section("REMAINING_CLASSIFICATIONS")}
+        names = []
+        rows = {field: {} for field in ("level", "personalData", "toValidate", "jurisdiction",
+                                        "category", "activity")}
+
+        def add(field, value, row):
+            rows[field].setdefault(value, []).append(row)
+
+        for row, record in enumerate(records):
+            name = record["name"]
+            known = tables.get(name, {})
+            names.append(name)
+            level = record_level(record)
+            add("level", level, row)
+            personal_data = record.get("personalData", known.get("personalData"))
+            if personal_data is not None:
+                add("personalData", bool(personal_data), row)
+            add("toValidate", bool(record.get("toValidate", known.get("toValidate", level is None))), row)
+            mask = record_jurisdictions(record)
+            for flag in Jurisdictions:
+                if mask & flag:
+                    add("jurisdiction", flag.name, row)
+            for category in relation_names(record.get("categories")):
+                add("category", category, row)
+            activities = record.get("pedagogical_activities", record.get("pedagogicalActivities"))
+            for activity in relation_names(activities):
+                add("activity", activity, row)
+
+        # Listes de lignes → bitmaps (une conversion par valeur, via une chaîne binaire)
+        bitmaps = {}
+        for field, values in rows.items():
+            bitmaps[field] = {}
+            for value, value_rows in values.items():
+                bits = bytearray(b"0" * len(names))
+                for row in value_rows:
+                    bits[len(names) - 1 - row] = ord("1")
+                bitmaps[field][value] = int(bits, 2)
+        return cls(names, bitmaps)
+
+    def save(self, path: Path, source_stamp: tuple) -> None:
+        """Sauvegarde l'index (marshal) avec l'empreinte de sa source."""
+        path.write_bytes(marshal.dumps((INDEX_MAGIC, source_stamp, self.names, self.bitmaps)))
+
+    @classmethod
+    def load(cls, path: Path, source_stamp: tuple) -> "BitmapIndex | None":
+        """Charge un index sauvegardé, ou None s'il est absent ou périmé."""
+        try:
+            magic, stamp, names, bitmaps = marshal.loads(path.read_bytes())
+        except (OSError, ValueError, EOFError, TypeError):
+            return None
+        if magic != INDEX_MAGIC or stamp != source_stamp:
+            return None
+        return cls(names, bitmaps)
+
+    def get(self, field: str, value) -> int:
+        """Bitmap d'une valeur (0 si absente)."""
+        return self.bitmaps[field].get(value, 0)
+
+    def any_of(self, field: str, values) -> int:
+        """Union des bitmaps de plusieurs valeurs d'un champ."""
+        result = 0
+        for value in values:
+            result |= self.get(field, value)
+        return result
+
+    def rows(self, bitmap: int) -> list[int]:
+        """Numéros de ligne des bits à 1 d'un bitmap."""
+        bits = bin(bitmap)[:1:-1]
+        rows = []
+        row = bits.find("1")
+        while row != -1:
+            rows.append(row)
+            row = bits.find("1", row + 1)
+        return rows
+
+
+def query(index: BitmapIndex, levels=None, max_level=None, personal_data=None, to_validate=None,
+          jurisdictions: int = 0, exclude_jurisdictions: int = 0, categories=None, activities=None) -> int:
+    """Intersection des filtres ; retourne le bitmap des logiciels correspondants.
+
+    Au sein d'un filtre, les valeurs sont combinées en OU ; les filtres entre eux en ET.
+    """
+    result = index.all
+    if levels:
+        result &= index.any_of("level", levels)
+    if max_level is not None:
+        # Niveau 0 (« Non évaluée ») exclu : un logiciel non évalué ne doit jamais paraître sûr
+        result &= index.any_of("level", range(1, max_level + 1))
+    if personal_data is not None:
+        result &= index.get("personalData", personal_data)
+    if to_validate is not None:
+        result &= index.get("toValidate", to_validate)
+    if jurisdictions:
+        result &= index.any_of("jurisdiction", (flag.name for flag in Jurisdictions if jurisdictions & flag))
+    if exclude_jurisdictions:
+        result &= ~index.any_of("jurisdiction", (flag.name for flag in Jurisdictions if exclude_jurisdictions & flag))
+    if categories:
+        result &= index.any_of("category", (category.casefold() for category in categories))
+    if activities:
+        result &= index.any_of("activity", (activity.casefold() for activity in activities))
+    return result
+
+
+def source_records(args):
+    """Enregistrements de la source choisie, et empreinte de cette source (taille, mtime)."""
+    path = Path(args.ndjson) if args.ndjson else args.mirror
+    if not path.exists():
+        print(f"Erreur: source introuvable: {path}")
+        sys.exit(1)
+    stat = path.stat()
+    stamp = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    if args.ndjson:
+        def records():
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        return records(), stamp
+    return iter_mirror_records(path), stamp
+
+
+def yes_no(value: str) -> bool:
+    """Argument oui/non → booléen."""
+    if value.lower() in ("oui", "yes", "true", "1"):
+        return True
+    if value.lower() in ("non", "no", "false", "0"):
+        return False
+    raise argparse.ArgumentTypeError(f"oui ou non attendu: {value}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Requêtes sur le catalogue classifié (index bitmap)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--mirror", type=Path, default=MIRROR_PATH, help="miroir SQLite (défaut: scripts/lgpd-mirror.sqlite)")
+    source.add_argument("--ndjson", metavar="FICHIER", help="flux NDJSON classifié")
+    parser.add_argument("--index", type=Path, metavar="FICHIER", help="index sauvegardé (reconstruit si la source change)")
+    parser.add_argument("--level", type=int, nargs="+", choices=[0, 1, 2, 3], help="niveaux acceptés")
+    parser.add_argument("--max-level", type=int, choices=[1, 2, 3],
+                        help="niveau maximal (les logiciels non évalués, niveau 0, sont exclus)")
+    parser.add_argument("--personal-data", type=yes_no, metavar="oui|non", help="données personnelles")
+    parser.add_argument("--to-validate", type=yes_no, metavar="oui|non", help="à valider manuellement")
+    parser.add_argument("--jurisdiction", nargs="+", default=[], help="au moins une de ces juridictions (ex: US CN)")
+    parser.add_argument("--exclude-jurisdiction", nargs="+", default=[], help="aucune de ces juridictions")
+    parser.add_argument("--category", nargs="+", help="catégories (au moins une)")
+    parser.add_argument("--activity", nargs="+", help="activités pédagogiques (au moins une)")
+    parser.add_argument("--count", action="store_true", help="affiche seulement le nombre de résultats")
+    args = parser.parse_args()
+
+    try:
+        jurisdictions = parse_flags(args.jurisdiction)
+        exclude_jurisdictions = parse_flags(args.exclude_jurisdiction)
+    except ValueError as error:
+        print(f"Erreur: {error}")
+        sys.exit(1)
+
+    records, stamp = source_records(args)
+    start = time.perf_counter()
+    index = BitmapIndex.load(args.index, stamp) if args.index else None
+    if index is None:
+        index = BitmapIndex.build(records)
+        if args.index:
+            index.save(args.index, stamp)
+    loaded = time.perf_counter()
+
+    result = query(index, args.level, args.max_level, args.personal_data, args.to_validate,
+                   jurisdictions, exclude_jurisdictions, args.category, args.activity)
+    elapsed = time.perf_counter() - loaded
+
+    if not args.count:
+        for row in index.rows(result):
+            print(f"  - {index.names[row]}")
+    print(f"\n{result.bit_count()} logiciels sur {len(index.names)} "
+          f"(index {1000 * (loaded - start):.1f} ms, requête {1000 * elapsed:.3f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Score LGPD à trois axes (hébergement, RGPD, collecte de données) calculé par règles.
+
+Chaque éditeur est encodé une fois en attributs (pays, juridiction
+d'hébergement, certification DPF, contrat DPA, trackers, collecte
+extensive, exposition Cloud Act, problème RGPD) à partir de la base de
+connaissances. Le catalogue devient une colonne d'octets par axe (juridiction
+et indicateurs de chaque ligne), et chaque axe est une table de correspondance
+de 256 entrées appliquée à toute la colonne d'un coup (`bytes.translate`,
+`int` pour le OU bit à bit du niveau global) : quand une règle change, seules
+les tables sont recalculées, puis le catalogue entier est re-scoré en une passe.
+
+Le niveau global suit mapSoftware() (server/utils/directus.ts) : le max des trois axes.
+
+Usage:
+    python3 scripts/lgpd_scoring.py                 # éditeurs : score calculé vs niveau attribué
+    python3 scripts/lgpd_scoring.py --ndjson FICHIER  # logiciels (un nom ou objet par ligne) → NDJSON
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass
+from enum import IntEnum
+
+from lgpd_profile import PROFILER, add_profile_arguments, run_profiled
+from lgpd_scripts import load_script
+
+AXES = ("hosting", "rgpd", "dataCollection")
+
+
+class Jurisdiction(IntEnum):
+    """Juridiction d'un pays ou d'un hébergement, du plus sûr au moins sûr."""
+    CH = 0
+    EU = 1
+    ADEQUATE = 2
+    US = 3
+    OTHER = 4
+
+
+# Pays / localisations → juridiction (règles d'adéquation, modifiables)
+JURISDICTIONS = {
+    "Suisse": Jurisdiction.CH,
+    "Local": Jurisdiction.CH,
+    "France": Jurisdiction.EU,
+    "Allemagne": Jurisdiction.EU,
+    "Autriche": Jurisdiction.EU,
+    "Belgique": Jurisdiction.EU,
+    "Espagne": Jurisdiction.EU,
+    "Hongrie": Jurisdiction.EU,
+    "Pays-Bas": Jurisdiction.EU,
+    "Suède": Jurisdiction.EU,
+    "Tchéquie": Jurisdiction.EU,
+    "Norvège": Jurisdiction.EU,
+    "Union Européenne": Jurisdiction.EU,
+    "Royaume-Uni": Jurisdiction.ADEQUATE,
+    "Canada": Jurisdiction.ADEQUATE,
+    "Corée du Sud": Jurisdiction.ADEQUATE,
+    "Japon": Jurisdiction.ADEQUATE,
+    "USA": Jurisdiction.US,
+    "États-Unis": Jurisdiction.US,
+}
+
+# Indices tirés de la raison de classification
+DPA_PATTERN = re.compile(r"contrat DPA")
+DPF_PATTERN = re.compile(r"\bDPF\b")
+NO_DPF_PATTERN = re.compile(r"non certifié DPF")
+CLOUD_ACT_PATTERN = re.compile(r"AWS|Google Cloud|Azure|Cloud Act|sous-traitants US|services tiers US")
+TRACKERS_PATTERN = re.compile(r"analytics|publicit|widgets tiers|tracking", re.IGNORECASE)
+EXTENSIVE_PATTERN = re.compile(r"collecte[^,]* extensive|collecte extensive|collecte (audio|données)|données santé"
+                               r"|accès contenu", re.IGNORECASE)
+RGPD_ISSUE_PATTERN = re.compile(r"amende RGPD|non adéquat|discontinué|non certifié DPF|transferts? (de )?données vers"
+                                r"|transferts vers pays tiers|politique (de )?(confidentialité|privacy) "
+                                r"(insuffisante|incertaine|floue)|privacy (incertaine|floue)", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class VendorAttributes:
+    """Attributs d'un éditeur utilisés par les règles."""
+    country: str
+    location: str
+    dpa: bool
+    dpf: bool
+    cloud_act: bool
+    trackers: bool
+    extensive_collection: bool
+    rgpd_issue: bool
+
+    @classmethod
+    def from_entry(cls, country: str, location: str, reason: str) -> "VendorAttributes":
+        """Déduit les attributs d'une entrée de la base de connaissances (pays, localisation, raison)."""
+        return cls(
+            country=country,
+            location=location,
+            dpa=bool(DPA_PATTERN.search(reason)),
+            dpf=bool(DPF_PATTERN.search(reason)) and not NO_DPF_PATTERN.search(reason),
+            cloud_act=bool(CLOUD_ACT_PATTERN.search(reason) or CLOUD_ACT_PATTERN.search(location)),
+            trackers=bool(TRACKERS_PATTERN.search(reason)),
+            extensive_collection=bool(EXTENSIVE_PATTERN.search(reason)),
+            rgpd_issue=bool(RGPD_ISSUE_PATTERN.search(reason)),
+        )
+
+
+def jurisdiction(value: str) -> Jurisdiction:
+    """Juridiction la moins sûre d'une localisation (« États-Unis/Australie » → OTHER)."""
+    parts = [re.sub(r"\s*\(.*?\)", "", part).strip() for part in value.split("/")]
+    return max((JURISDICTIONS.get(part, Jurisdiction.OTHER) for part in parts if part), default=Jurisdiction.OTHER)
+
+
+# --- Règles par axe : code d'attributs (8 bits) → score 1..3 ---
+#
+# Hébergement : bits 0-2 juridiction d'hébergement, bit 3 DPF, bit 4 Cloud Act, bit 5 contrat DPA
+# RGPD        : bits 0-2 juridiction du pays,       bit 3 DPF, bit 4 problème RGPD, bit 5 contrat DPA
+# Collecte    : bit 0 trackers, bit 1 collecte extensive
+
+def hosting_rule(code: int) -> int:
+    """Hébergement : CH/UE/adéquat = 1 (2 si Cloud Act), États-Unis = 2, autres = 3 ; un DPA ramène à 1."""
+    hosting, cloud_act, dpa = code & 7, code >> 4 & 1, code >> 5 & 1
+    if dpa:
+        return 1
+    if hosting >= Jurisdiction.OTHER:
+        return 3
+    if hosting == Jurisdiction.US or cloud_act:
+        return 2
+    return 1
+
+
+def rgpd_rule(code: int) -> int:
+    """RGPD : problème avéré = 3, pays non adéquat sans DPF = 3, États-Unis ou non adéquat avec DPF = 2.
+
+    Un contrat DPA institutionnel ramène à 1.
+    """
+    country, dpf, issue, dpa = code & 7, code >> 3 & 1, code >> 4 & 1, code >> 5 & 1
+    if dpa:
+        return 1
+    if issue:
+        return 3
+    if country >= Jurisdiction.OTHER:
+        return 2 if dpf else 3
+    if country == Jurisdiction.US:
+        return 2
+    return 1
+
+
+def collection_rule(code: int) -> int:
+    """Collecte de données : extensive = 3, trackers / analytics tiers = 2, sinon 1."""
+    trackers, extensive = code & 1, code >> 1 & 1
+    if extensive:
+        return 3
+    return 2 if trackers else 1
+
+
+RULES = {"hosting": hosting_rule, "rgpd": rgpd_rule, "dataCollection": collection_rule}
+
+# Niveaux 1..3 ↔ thermomètre (1 → 0b001, 2 → 0b011, 3 → 0b111) : le OU de thermomètres donne le max
+TO_THERMOMETER = bytes([0, 1, 3, 7] + [0] * 252)
+FROM_THERMOMETER = bytes([0, 1, 0, 2, 0, 0, 0, 3] + [0] * 248)
+
+
+def rule_table(rule) -> bytes:
+    """Table de correspondance 256 octets d'une règle."""
+    return bytes(rule(code) for code in range(256))
+
+
+def bitwise_or(*columns: bytes) -> bytes:
+    """OU bit à bit de colonnes d'octets de même longueur, en une opération sur entiers."""
+    size = len(columns[0])
+    result = 0
+    for column in columns:
+        result |= int.from_bytes(column, "little")
+    return result.to_bytes(size, "little")
+
+
+class ScoringColumns:
+    """Catalogue encodé en colonnes d'octets (une ligne par logiciel), prêt à être scoré."""
+
+    def __init__(self, attributes: list[VendorAttributes]):
+        self.size = len(attributes)
+        # Juridiction de chaque ligne (bits 0-2), calculée une fois par pays / localisation distincts
+        jurisdictions: dict[str, int] = {}
+
+        def code(value: str) -> int:
+            if value not in jurisdictions:
+                jurisdictions[value] = jurisdiction(value)
+            return jurisdictions[value]
+
+        self.codes = {
+            "hosting": bytes(code(a.location) | a.dpf << 3 | a.cloud_act << 4 | a.dpa << 5 for a in attributes),
+            "rgpd": bytes(code(a.country) | a.dpf << 3 | a.rgpd_issue << 4 | a.dpa << 5 for a in attributes),
+            "dataCollection": bytes(a.trackers | a.extensive_collection << 1 for a in attributes),
+        }
+
+    def score(self) -> dict[str, bytes]:
+        """Calcule les trois axes et le niveau global de tout le catalogue en une passe."""
+        scores = {axis: self.codes[axis].translate(rule_table(RULES[axis])) for axis in AXES}
+        if not self.size:
+            return {**scores, "level": b""}
+        thermometers = [scores[axis].translate(TO_THERMOMETER) for axis in AXES]
+        scores["level"] = bitwise_or(*thermometers).translate(FROM_THERMOMETER)
+        return scores
+
+
+def score_vendors(vendor_index) -> dict[str, dict]:
+    """Scores des éditeurs d'un index clé → VendorEntry ({axes..., level})."""
+    keys = list(vendor_index)
+    columns = ScoringColumns([
+        VendorAttributes.from_entry(entry.country, entry.location, entry.reason) for entry in vendor_index.values()
+    ])
+    scores = columns.score()
+    return {key: {axis: scores[axis][row] for axis in (*AXES, "level")} for row, key in enumerate(keys)}
+
+
+def report_vendors(classify) -> None:
+    """Affiche les éditeurs dont le score calculé diffère du niveau attribué à la main."""
+    vendor_index = classify.build_vendor_index()
+    with PROFILER.phase("score des éditeurs"):
+        scores = score_vendors(vendor_index)
+    PROFILER.count("éditeurs scorés", len(scores))
+
+    differences = [(key, vendor_index[key].level, score) for key, score in scores.items()
+                   if score["level"] != vendor_index[key].level]
+    for key, level, score in sorted(differences, key=lambda item: item[0].lower()):
+        axes = ", ".join(f"{axis} {score[axis]}" for axis in AXES)
+        print(f"  - {key}: attribué {level}, calculé {score['level']} ({axes})")
+    print(f"\n{len(scores) - len(differences)}/{len(scores)} éditeurs identiques au niveau attribué")
+
+
+def score_records(classify, source: str) -> None:
+    """Score un flux NDJSON de logiciels et écrit une ligne enrichie par logiciel sur stdout."""
+    with PROFILER.phase("lecture et attribution des éditeurs"):
+        records = [record if isinstance(record, dict) else {"name": record} for record in classify.iter_ndjson(source)]
+        vendor_index = classify.build_vendor_index()
+        matcher = classify.build_name_matcher()
+        vendors = [matcher.best(record.get("name", "")) for record in records]
+        rows = [index for index, vendor in enumerate(vendors) if vendor]
+        attributes = [
+            VendorAttributes.from_entry(entry.country, entry.location, entry.reason)
+            for entry in (vendor_index[vendors[index]] for index in rows)
+        ]
+    with PROFILER.phase("score (passe unique)"):
+        scores = ScoringColumns(attributes).score()
+    PROFILER.count("logiciels scorés", len(rows))
+
+    with PROFILER.phase("écriture NDJSON"):
+        scored = dict(zip(rows, range(len(rows))))
+        for index, record in enumerate(records):
+            row = scored.get(index)
+            if row is None:
+                record = {**record, "lgpdScores": None, "certificationLevel": None}
+            else:
+                record = {
+                    **record,
+                    "lgpdScores": {axis: scores[axis][row] for axis in AXES},
+                    "certificationLevel": scores["level"][row],
+                }
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score LGPD à trois axes calculé par règles")
+    parser.add_argument("--ndjson", nargs="?", const="-", metavar="FICHIER",
+                        help="score les logiciels d'un flux NDJSON (stdin par défaut)")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    classify = load_script("classify-lgpd.py")
+    if args.ndjson:
+        run_profiled(args, score_records, classify, args.ndjson)
+    else:
+        run_profiled(args, report_vendors, classify)
+
+
+if __name__ == "__main__":
+    main()
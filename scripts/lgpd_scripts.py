@@ -0,0 +1,22 @@
+"""
+Chargement des scripts du dossier scripts/ comme modules.
+
+Les scripts au nom avec tiret (classify-lgpd.py, apply-lgpd-changes.py,
+sync-lgpd-directus.py...) ne peuvent pas être importés directement ; les
+outils qui réutilisent leurs fonctions (scoring, benchmark, tests) les
+chargent par leur chemin.
+"""
+
+import importlib.util
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+
+
+def load_script(file_name: str):
+    """Charge un script du dossier scripts/ (noms avec tirets) comme module."""
+    path = SCRIPTS_DIR / file_name
+    spec = importlib.util.spec_from_file_location(path.stem.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
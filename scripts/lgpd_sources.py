@@ -0,0 +1,318 @@
+"""
+Lecture en streaming des sources « positionnement CEIJ » pour le classifieur.
+
+Le CSV app/data/logiciel-cejef.csv (séparateur `;`, BOM, cellules multi-lignes
+entre guillemets) est lu ligne par ligne et chaque logiciel est normalisé en
+un enregistrement :
+
+    {"name", "signal", "signalLevel", "conditional", "lgpd", "location",
+     "locationCategory", "privacyPolicy", "termsOfUse", "remarks",
+     "statusChange", "m365Status", "updatedAt"}
+
+La feuille « liste en étude » de data/positionnement-ceij.xlsx (mêmes
+colonnes) est lue de la même façon, en streaming et en lecture seule, avec
+la bibliothèque standard (zipfile + iterparse) : pas besoin de Node ni
+d'openpyxl.
+
+Les mappings reprennent ceux de scripts/migrate-from-xlsx.ts : feu V/O/R
+(V → 1, O → 2, R/?/vide/hésitation → 3) appliqué aux 3 axes LGPD, et
+localisation → catégorie data_location Directus.
+
+Usage (conversion en NDJSON):
+    python3 scripts/lgpd_sources.py --xlsx > positionnement.ndjson
+    python3 scripts/lgpd_sources.py --xlsx | python3 scripts/classify-lgpd.py --ndjson
+"""
+
+import argparse
+import csv
+import json
+import re
+import sys
+import zipfile
+from pathlib import Path
+from xml.etree import ElementTree
+
+CSV_PATH = Path(__file__).parent.parent / "app" / "data" / "logiciel-cejef.csv"
+
+# Libellé d'en-tête (espaces normalisés) → clé de l'enregistrement
+COLUMNS = {
+    "Plateforme": "name",
+    "Proposition de feu signalétique": "signal",
+    "Localisation": "location",
+    "Données recueillies et Politique de confidentialité": "privacyPolicy",
+    "Conditions d'utilisation": "termsOfUse",
+    "Remarques ou alternatives": "remarks",
+    "Changement de statut": "statusChange",
+    "Statut M365": "m365Status",
+    "Mis à jour le": "updatedAt",
+}
+
+# Localisation texte libre → catégorie data_location Directus (ordre significatif)
+LOCATION_CATEGORIES = [
+    ("united_states", re.compile(r"(usa|états-unis|united states|america)")),
+    ("switzerland", re.compile(r"(suisse|swiss|switzerland|zurich|bern|geneva|genève)")),
+    ("eu_eea", re.compile(r"(france|allemagne|germany|pays-bas|netherlands|irlande|ireland|espagne|spain|italie|italy"
+                          r"|belgique|belgium|portugal|autriche|austria|hongrie|hungary|sachsen|deutschland)")),
+    ("eu_eea", re.compile(r"(union européenne|union europ|\bue\b|\beu\b|eea|eee|europe)")),
+    ("adequate", re.compile(r"(royaume-uni|\buk\b|united kingdom|canada|japon|japan|corée|korea|israël|israel)")),
+    ("multi_or_partial", re.compile(r"(multi|global|worldwide)")),
+]
+
+
+def clean(value) -> str | None:
+    """Normalise une cellule : texte sans espaces superflus, None si vide."""
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def map_signal(raw) -> int:
+    """V/O/R → score LGPD (1=OK, 2=Attention, 3=Interdit), comme mapClassification() en TS.
+
+    Valeur inconnue, vide ou hésitante (« V (sous conditions) ») → 3 (le pire).
+    """
+    value = (clean(raw) or "").upper()
+    if value == "V":
+        return 1
+    if value.startswith("O"):
+        return 2  # "O", "O (sous conditions)"
+    return 3  # "R", "?" ou autre
+
+
+def map_location(raw) -> str:
+    """Localisation texte libre → catégorie data_location Directus, comme mapLocation() en TS.
+
+    Les États-Unis donnent `united_states` (`us_dpf` est déprécié depuis la grille V1.4).
+    Pas d'info → `other` (le pire).
+    """
+    value = (clean(raw) or "").lower()
+    for category, pattern in LOCATION_CATEGORIES:
+        if pattern.search(value):
+            return category
+    return "other"
+
+
+# Anciennes valeurs `dataLocation` (software-list.ts, base de connaissances) → catégorie data_location,
+# comme MAPPING dans scripts/data-location-mapping.ts. Les États-Unis donnent `united_states`
+# (`us_dpf` du fichier TS est déprécié depuis la grille V1.4).
+DATA_LOCATION_MAPPING = {
+    # Niveau 1 — Suisse
+    "Suisse": "switzerland",
+    "Suisse/Luxembourg": "switzerland",
+    "Local": "switzerland",
+    "CEJEF": "switzerland",
+    # Niveau 1 — UE/EEE
+    "France": "eu_eea",
+    "France/Union Européenne": "eu_eea",
+    "Allemagne": "eu_eea",
+    "Union Européenne": "eu_eea",
+    "Union Européenne (AWS)": "eu_eea",
+    "Union Européenne (option)": "eu_eea",
+    "Union Européenne (configurable)": "eu_eea",
+    "Hongrie": "eu_eea",
+    # Niveau 1 — Pays adéquats
+    "Royaume-Uni": "adequate",
+    "Canada": "adequate",
+    "Corée du Sud": "adequate",
+    "Israël": "adequate",
+    # Niveau 2 — États-Unis
+    "États-Unis": "united_states",
+    "États-Unis (option UE)": "united_states",
+    "États-Unis (option UE Enterprise)": "united_states",
+    "États-Unis (option UE/CH)": "united_states",
+    "États-Unis (centres UE disponibles)": "united_states",
+    "États-Unis (UE Enterprise)": "united_states",
+    "États-Unis (SCCs UE)": "united_states",
+    # Niveau 2 — Multi-régions
+    "Union Européenne/États-Unis": "multi_or_partial",
+    "Union Européenne/Global": "multi_or_partial",
+    "Royaume-Uni/États-Unis": "multi_or_partial",
+    "Canada/États-Unis": "multi_or_partial",
+    "Local/États-Unis": "multi_or_partial",
+    "États-Unis/Australie": "multi_or_partial",
+    "États-Unis/Global": "multi_or_partial",
+    "Australie/États-Unis": "multi_or_partial",
+    # Niveau 3 — Autres / non adéquat / inconnu
+    "Chine": "other",
+    "Canada/Chine": "other",
+    "Ukraine": "other",
+    "Hors UE": "other",
+    "Inconnu": "other",
+}
+
+
+def map_data_location(value) -> str | None:
+    """Valeur `dataLocation` du classifieur → catégorie data_location (correspondance exacte).
+
+    None si la valeur n'est pas dans la table : contrairement à map_location()
+    (texte libre de la feuille xlsx), rien n'est deviné.
+    """
+    return DATA_LOCATION_MAPPING.get(value)
+
+
+def normalize_row(row: dict) -> dict | None:
+    """Construit l'enregistrement normalisé d'une ligne (None si la ligne n'a pas de nom)."""
+    record = {key: clean(row.get(key)) for key in COLUMNS.values()}
+    if not record["name"]:
+        return None
+    signal = record["signal"]
+    record["signal"] = signal[0].upper() if signal and signal[0].upper() in "VOR" else None
+    record["signalLevel"] = map_signal(signal)
+    record["conditional"] = bool(signal and "sous conditions" in signal.lower())
+    # Score identique pour les 3 axes LGPD (même stratégie que migrate-from-xlsx.ts)
+    score = record["signalLevel"]
+    record["lgpd"] = {"hosting": score, "rgpd": score, "dataCollection": score}
+    record["locationCategory"] = map_location(record["location"])
+    return record
+
+
+def header_keys(header: list[str]) -> list[str | None]:
+    """Associe chaque colonne d'en-tête à sa clé (None pour les colonnes ignorées)."""
+    return [COLUMNS.get(re.sub(r"\s+", " ", label).strip()) for label in header]
+
+
+def iter_csv_records(path: Path = CSV_PATH):
+    """Itère sur les logiciels du CSV, un enregistrement normalisé à la fois."""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f, delimiter=";")
+        keys = header_keys(next(reader, []))
+        if "name" not in keys:
+            raise ValueError(f"{path}: colonne « Plateforme » introuvable dans l'en-tête")
+        for row in reader:
+            record = normalize_row({key: value for key, value in zip(keys, row) if key})
+            if record:
+                yield record
+
+
+# --- XLSX (lecture en streaming, sans dépendance) ---
+
+SHEET_NAME = "liste en étude"
+XLSX_PATH = Path(__file__).parent.parent / "data" / "positionnement-ceij.xlsx"
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def column_index(reference: str) -> int:
+    """Référence de cellule (ex: "C12") → index de colonne (0 pour A)."""
+    index = 0
+    for char in reference:
+        if not char.isalpha():
+            break
+        index = index * 26 + ord(char.upper()) - ord("A") + 1
+    return index - 1
+
+
+def text_content(element) -> str:
+    """Concatène les textes <t> d'un élément (chaînes riches comprises)."""
+    return "".join(node.text or "" for node in element.iter(f"{MAIN_NS}t"))
+
+
+def sheet_path(archive: zipfile.ZipFile, sheet_name: str) -> str:
+    """Chemin de la feuille `sheet_name` dans l'archive (via workbook.xml et ses relations)."""
+    workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    relations = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    targets = {rel.get("Id"): rel.get("Target") for rel in relations.iter(f"{PACKAGE_REL_NS}Relationship")}
+
+    names = []
+    for sheet in workbook.iter(f"{MAIN_NS}sheet"):
+        names.append(sheet.get("name"))
+        if sheet.get("name") == sheet_name:
+            target = targets[sheet.get(f"{REL_NS}id")]
+            return target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+    raise ValueError(f"Feuille « {sheet_name} » introuvable. Feuilles disponibles: {', '.join(names)}")
+
+
+def iter_shared_strings(archive: zipfile.ZipFile):
+    """Itère sur la table des chaînes partagées (lue en streaming)."""
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return
+    with archive.open("xl/sharedStrings.xml") as f:
+        for _, element in ElementTree.iterparse(f):
+            if element.tag == f"{MAIN_NS}si":
+                yield text_content(element)
+                element.clear()
+
+
+def iter_xlsx_rows(path: Path = XLSX_PATH, sheet_name: str = SHEET_NAME):
+    """Itère sur les lignes d'une feuille (listes de valeurs), en lecture seule et en streaming.
+
+    Seule la table des chaînes partagées est gardée en mémoire ; les lignes
+    de la feuille sont libérées au fur et à mesure.
+    """
+    with zipfile.ZipFile(path) as archive:
+        shared_strings = list(iter_shared_strings(archive))
+        with archive.open(sheet_path(archive, sheet_name)) as f:
+            sheet_data = None
+            for event, element in ElementTree.iterparse(f, events=("start", "end")):
+                if event == "start":
+                    if element.tag == f"{MAIN_NS}sheetData":
+                        sheet_data = element
+                    continue
+                if element.tag != f"{MAIN_NS}row":
+                    continue
+                row = []
+                for cell in element.iter(f"{MAIN_NS}c"):
+                    index = column_index(cell.get("r", "")) if cell.get("r") else len(row)
+                    row.extend([None] * (index + 1 - len(row)))
+                    row[index] = cell_value(cell, shared_strings)
+                yield row
+                # Libère les lignes déjà lues (elles restent sinon attachées à <sheetData>)
+                sheet_data.clear()
+
+
+def cell_value(cell, shared_strings: list[str]):
+    """Valeur d'une cellule selon son type (chaîne partagée, texte inline, booléen, nombre)."""
+    cell_type = cell.get("t")
+    if cell_type == "inlineStr":
+        return text_content(cell)
+    value = cell.find(f"{MAIN_NS}v")
+    if value is None or value.text is None:
+        return None
+    if cell_type == "s":
+        return shared_strings[int(value.text)]
+    if cell_type == "b":
+        return value.text == "1"
+    return value.text
+
+
+def iter_xlsx_records(path: Path = XLSX_PATH, sheet_name: str = SHEET_NAME):
+    """Itère sur les logiciels de la feuille de positionnement, un enregistrement normalisé à la fois."""
+    rows = iter_xlsx_rows(path, sheet_name)
+    keys = header_keys([str(value or "") for value in next(rows, [])])
+    if "name" not in keys:
+        raise ValueError(f"{path}: colonne « Plateforme » introuvable dans l'en-tête")
+    for row in rows:
+        record = normalize_row({key: value for key, value in zip(keys, row) if key})
+        if record:
+            yield record
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convertit les sources de positionnement CEIJ en NDJSON normalisé")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--xlsx", nargs="?", const=XLSX_PATH, type=Path, metavar="FICHIER",
+                        help="classeur de positionnement (data/positionnement-ceij.xlsx par défaut)")
+    source.add_argument("--csv", nargs="?", const=CSV_PATH, type=Path, metavar="FICHIER",
+                        help="export CSV (app/data/logiciel-cejef.csv par défaut)")
+    parser.add_argument("--sheet", default=SHEET_NAME, help=f"feuille du classeur (défaut: {SHEET_NAME})")
+    parser.add_argument("--output", type=Path, help="fichier NDJSON de sortie (stdout par défaut)")
+    args = parser.parse_args()
+
+    records = iter_xlsx_records(args.xlsx, args.sheet) if args.xlsx else iter_csv_records(args.csv)
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    count = 0
+    try:
+        for record in records:
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(f"✅ {count} logiciels convertis", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Stockage SQLite des classifications LGPD (option --sqlite de classify-lgpd.py).
+
+Tables :
+- vendor : éditeurs de la base de connaissances (niveau, pays, localisation, raison)
+- software : dernière classification connue de chaque logiciel
+- classification_history : une ligne par changement de classification
+
+Index sur level, country, data_location et to_validate : les questions
+courantes (« niveau 3 hébergés en Chine », « tout ce qui reste à valider »)
+se résolvent sans relire lgpd-classifications.json. La colonne
+`jurisdictions` (masque de lgpd_jurisdictions.py) répond à « peut toucher
+des serveurs US » par un ET bit à bit.
+
+Usage (requêtes):
+    python3 scripts/lgpd_store.py lgpd.sqlite --level 3 --location Chine
+    python3 scripts/lgpd_store.py lgpd.sqlite --to-validate
+    python3 scripts/lgpd_store.py lgpd.sqlite --jurisdiction US CN
+"""
+
+import argparse
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from lgpd_jurisdictions import parse_flags, parse_location
+from lgpd_knowledge import load_section
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vendor (
+    key TEXT PRIMARY KEY,
+    level INTEGER NOT NULL,
+    country TEXT NOT NULL,
+    location TEXT NOT NULL,
+    reason TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS software (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    vendor_key TEXT REFERENCES vendor(key),
+    level INTEGER,
+    country TEXT,
+    data_location TEXT,
+    jurisdictions INTEGER NOT NULL DEFAULT 0,
+    usage_notes TEXT,
+    remarque TEXT,
+    to_validate INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS classification_history (
+    id INTEGER PRIMARY KEY,
+    software_id INTEGER NOT NULL REFERENCES software(id),
+    classified_at TEXT NOT NULL,
+    vendor_key TEXT,
+    level INTEGER,
+    data_location TEXT,
+    remarque TEXT,
+    to_validate INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_software_level ON software(level);
+CREATE INDEX IF NOT EXISTS idx_software_country ON software(country);
+CREATE INDEX IF NOT EXISTS idx_software_data_location ON software(data_location);
+CREATE INDEX IF NOT EXISTS idx_software_to_validate ON software(to_validate);
+CREATE INDEX IF NOT EXISTS idx_vendor_level ON vendor(level);
+CREATE INDEX IF NOT EXISTS idx_vendor_country ON vendor(country);
+CREATE INDEX IF NOT EXISTS idx_history_software ON classification_history(software_id);
+"""
+
+
+class ClassificationStore:
+    """Écrit les classifications d'un run dans une base SQLite (une transaction par lot)."""
+
+    def __init__(self, path: Path, batch_size: int = 1000):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(software)")}
+        if "jurisdictions" not in columns:  # base créée avant l'ajout de la colonne
+            self.connection.execute("ALTER TABLE software ADD COLUMN jurisdictions INTEGER NOT NULL DEFAULT 0")
+        self.classified_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.batch_size = batch_size
+        self.pending = 0
+        # Drapeaux `toValidate` des tables de classification (même règle que lgpd_query.py)
+        self.known_to_validate = {
+            name: bool(entry["toValidate"])
+            for section in ("CLASSIFICATIONS", "REMAINING_CLASSIFICATIONS")
+            for name, entry in load_section(section).items() if "toValidate" in entry
+        }
+
+    def save_vendors(self, vendor_index) -> None:
+        """Enregistre (ou met à jour) les éditeurs de l'index."""
+        self.connection.executemany(
+            """INSERT INTO vendor (key, level, country, location, reason) VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(key) DO UPDATE SET level = excluded.level, country = excluded.country,
+                   location = excluded.location, reason = excluded.reason""",
+            ((key, *entry) for key, entry in vendor_index.items()),
+        )
+
+    def record(self, modification: dict, classification: dict | None) -> None:
+        """Enregistre la classification d'un logiciel ; l'historique ne reçoit que les changements.
+
+        Un logiciel non classifié est stocké sans niveau. `to_validate` vient du
+        champ `toValidate` de l'enregistrement, sinon des tables de
+        classification, sinon vaut 1 pour un logiciel non classifié.
+        """
+        name = modification["name"]
+        to_validate = modification.get("toValidate", self.known_to_validate.get(name, classification is None))
+        values = (
+            classification["vendor"] if classification else None,
+            modification.get("certificationLevel"),
+            classification["country"] if classification else None,
+            modification.get("dataLocation"),
+            modification.get("jurisdictions", parse_location(modification.get("dataLocation"))),
+            modification.get("usageNotes"),
+            modification.get("remarque"),
+            int(bool(to_validate)),
+        )
+        row = self.connection.execute(
+            """SELECT id, vendor_key, level, country, data_location, jurisdictions, usage_notes, remarque,
+                   to_validate FROM software WHERE name = ?""",
+            (name,),
+        ).fetchone()
+
+        if row is None:
+            software_id = self.connection.execute(
+                """INSERT INTO software (name, vendor_key, level, country, data_location, jurisdictions,
+                       usage_notes, remarque, to_validate, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (name, *values, self.classified_at),
+            ).lastrowid
+        elif tuple(row[1:]) != values:
+            software_id = row[0]
+            self.connection.execute(
+                """UPDATE software SET vendor_key = ?, level = ?, country = ?, data_location = ?,
+                       jurisdictions = ?, usage_notes = ?, remarque = ?, to_validate = ?, updated_at = ?
+                   WHERE id = ?""",
+                (*values, self.classified_at, software_id),
+            )
+        else:
+            return
+
+        vendor_key, level, _, data_location, _, _, remarque, to_validate = values
+        self.connection.execute(
+            """INSERT INTO classification_history (software_id, classified_at, vendor_key, level,
+                   data_location, remarque, to_validate) VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            (software_id, self.classified_at, vendor_key, level, data_location, remarque, to_validate),
+        )
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.connection.commit()
+            self.pending = 0
+
+    def close(self) -> None:
+        """Valide la transaction en cours et ferme la base."""
+        self.connection.commit()
+        self.connection.close()
+
+
+def query_software(path: Path, level: int | None = None, country: str | None = None,
+                   location: str | None = None, to_validate: bool = False, jurisdictions: int = 0) -> list[tuple]:
+    """Retourne (nom, niveau, pays, localisation) des logiciels correspondant aux filtres.
+
+    `jurisdictions` : masque de juridictions, au moins une doit être présente.
+    """
+    conditions = []
+    parameters = []
+    if level is not None:
+        conditions.append("level = ?")
+        parameters.append(level)
+    if country:
+        conditions.append("country = ?")
+        parameters.append(country)
+    if location:
+        conditions.append("data_location = ?")
+        parameters.append(location)
+    if to_validate:
+        conditions.append("to_validate = 1")
+    if jurisdictions:
+        conditions.append("jurisdictions & ? != 0")
+        parameters.append(jurisdictions)
+
+    sql = "SELECT name, level, country, data_location FROM software"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    with sqlite3.connect(path) as connection:
+        return connection.execute(sql + " ORDER BY name", parameters).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Interroge la base SQLite des classifications LGPD")
+    parser.add_argument("database", type=Path, help="fichier SQLite écrit par classify-lgpd.py --sqlite")
+    parser.add_argument("--level", type=int, choices=[1, 2, 3], help="niveau de certification")
+    parser.add_argument("--country", help="pays de l'éditeur (ex: Chine, USA)")
+    parser.add_argument("--location", help="localisation des données (ex: Chine, États-Unis)")
+    parser.add_argument("--to-validate", action="store_true", help="uniquement les logiciels à valider")
+    parser.add_argument("--jurisdiction", nargs="+", default=[], metavar="JURIDICTION",
+                        help="au moins une de ces juridictions d'hébergement (ex: US CN OTHER)")
+    args = parser.parse_args()
+
+    try:
+        jurisdictions = parse_flags(args.jurisdiction)
+    except ValueError as error:
+        print(f"Erreur: {error}")
+        sys.exit(1)
+    rows = query_software(args.database, args.level, args.country, args.location, args.to_validate, jurisdictions)
+    for name, level, country, location in rows:
+        print(f"  - {name}: niveau {level if level is not None else '?'}, {country or '?'}, {location or '?'}")
+    print(f"\n{len(rows)} logiciels")
+
+
+if __name__ == "__main__":
+    main()
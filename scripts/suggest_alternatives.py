@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Suggère des alternatives de niveau 1 aux logiciels de niveau 2 et 3.
+
+Le catalogue publié (miroir Directus, scripts/lgpd_mirror.py) est vu comme
+une matrice creuse logiciels × (catégories ∪ activités pédagogiques). Chaque
+caractéristique est pondérée par sa rareté (idf : partager « Quiz » compte
+plus que partager une catégorie présente partout), et le produit creux
+cibles × candidats est calculé par listes inversées : seules les paires qui
+partagent au moins une caractéristique sont visitées. Le score est un
+cosinus, les k meilleurs candidats de niveau 1 sont retenus. Les logiciels
+aux caractéristiques identiques partagent un même profil, calculé une fois.
+
+Les suggestions sont écrites dans un fichier JSON. `--push` les enregistre
+dans la relation `alternatives` de Directus, uniquement pour les logiciels
+dont la liste (saisie à la main) est vide — relue dans Directus juste avant
+chaque lot, le miroir pouvant dater.
+
+Usage:
+    python3 scripts/suggest_alternatives.py
+    python3 scripts/suggest_alternatives.py --top 5 --push --dry-run
+"""
+
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+
+from lgpd_directus import DirectusError, certification_level, client_from_env
+from lgpd_mirror import MIRROR_PATH, iter_mirror_items
+from lgpd_profile import PROFILER, add_profile_arguments, run_profiled
+
+OUTPUT_PATH = Path(__file__).parent / "alternatives-suggestions.json"
+
+# Poids relatifs des deux familles de caractéristiques
+CATEGORY_WEIGHT = 1.0
+ACTIVITY_WEIGHT = 0.5
+
+
+def item_features(item: dict) -> set[str]:
+    """Caractéristiques d'un item Directus : catégories et activités (préfixées pour ne pas se confondre)."""
+    features = {f"category:{ref['category_id']['id']}" for ref in item.get("categories") or []
+                if ref.get("category_id")}
+    features |= {f"activity:{ref['pedagogical_activity_id']['id']}"
+                 for ref in item.get("pedagogical_activities") or [] if ref.get("pedagogical_activity_id")}
+    return features
+
+
+def feature_weights(rows: list[set[str]]) -> dict[str, float]:
+    """Poids idf de chaque caractéristique, multiplié par le poids de sa famille."""
+    counts = {}
+    for features in rows:
+        for feature in features:
+            counts[feature] = counts.get(feature, 0) + 1
+    total = len(rows)
+    return {
+        feature: math.log(1 + total / count) * (CATEGORY_WEIGHT if feature.startswith("category:") else ACTIVITY_WEIGHT)
+        for feature, count in counts.items()
+    }
+
+
+def suggest(items: list[dict], top: int = 3) -> dict[str, list[tuple[str, float]]]:
+    """Pour chaque logiciel de niveau 2 ou 3, les `top` alternatives de niveau 1 (id, score).
+
+    Les lignes ayant les mêmes caractéristiques ont les mêmes scores : le
+    produit creux est calculé entre profils distincts (ensembles de
+    caractéristiques), puis redistribué aux logiciels.
+    """
+    levels = [certification_level(item.get("lgpd_hosting"), item.get("lgpd_rgpd"), item.get("lgpd_data_collection"))
+              for item in items]
+    rows = [frozenset(item_features(item)) for item in items]
+    weights = feature_weights(rows)
+
+    # Profils candidats (niveau 1) : ensemble de caractéristiques → lignes, dans l'ordre du catalogue
+    candidates: dict[frozenset, list[int]] = {}
+    for row, features in enumerate(rows):
+        if levels[row] == 1 and features:
+            candidates.setdefault(features, []).append(row)
+    profiles = list(candidates)
+    # Norme de chaque profil pondéré (le vecteur porte `w` par caractéristique)
+    norms = [math.sqrt(sum(weights[feature] ** 2 for feature in profile)) for profile in profiles]
+
+    # Listes inversées : caractéristique → profils candidats
+    postings: dict[str, list[int]] = {}
+    for index, profile in enumerate(profiles):
+        for feature in profile:
+            postings.setdefault(feature, []).append(index)
+
+    ranked_by_profile: dict[frozenset, list[tuple[int, float]]] = {}
+    suggestions = {}
+    for row, features in enumerate(rows):
+        if levels[row] not in (2, 3) or not features:
+            continue
+        if features not in ranked_by_profile:
+            norm = math.sqrt(sum(weights[feature] ** 2 for feature in features))
+            scores: dict[int, float] = {}
+            for feature in features:
+                weight = weights[feature] ** 2
+                for index in postings.get(feature, ()):
+                    scores[index] = scores.get(index, 0.0) + weight
+            cosines = ((index, score / (norm * norms[index])) for index, score in scores.items())
+            ranked = []
+            # Profils par score décroissant, jusqu'à `top` lignes en gardant tous les ex aequo du
+            # dernier score retenu (une cible de niveau 2-3 n'est jamais candidate)
+            for index, cosine in sorted(cosines, key=lambda entry: -entry[1]):
+                if len(ranked) >= top and cosine < ranked[-1][1]:
+                    break
+                ranked.extend((candidate, cosine) for candidate in candidates[profiles[index]][:top])
+            # À score égal, ordre du catalogue
+            ranked.sort(key=lambda entry: (-entry[1], entry[0]))
+            ranked_by_profile[features] = [(candidate, round(cosine, 4)) for candidate, cosine in ranked[:top]]
+        suggestions[items[row]["id"]] = [(items[candidate]["id"], score)
+                                         for candidate, score in ranked_by_profile[features]]
+    return suggestions
+
+
+def has_alternatives(item: dict) -> bool:
+    """Vrai si la relation `alternatives` de l'item pointe vers au moins un logiciel."""
+    return any(ref.get("alternative_id") for ref in item.get("alternatives") or [])
+
+
+def push_suggestions(client, items: list[dict], suggestions: dict, dry_run: bool = False,
+                     batch_size: int = 100) -> tuple[int, list]:
+    """Enregistre les suggestions dans Directus pour les logiciels sans alternatives.
+
+    Le miroir peut dater : la relation `alternatives` de chaque lot est relue
+    dans Directus juste avant le PATCH, et une liste remplie à la main entre-temps
+    n'est pas écrasée. Retourne (logiciels complétés, ids des lots en échec).
+    """
+    targets = [item["id"] for item in items if suggestions.get(item["id"]) and not has_alternatives(item)]
+    pushed, failed = 0, []
+    for start in range(0, len(targets), batch_size):
+        batch = targets[start:start + batch_size]
+        try:
+            current = client.read_items("software", ["id", "alternatives.alternative_id.id"],
+                                        filter={"id": {"_in": batch}}, page_size=batch_size)
+            filled = {item["id"] for item in current if has_alternatives(item)}
+            updates = [
+                {"id": id, "alternatives": [{"alternative_id": alternative} for alternative, _ in suggestions[id]]}
+                for id in batch if id not in filled
+            ]
+            for id in batch:
+                if id in filled:
+                    print(f"  ⚠️  {id}: alternatives saisies entre-temps, ignoré")
+            if dry_run:
+                for update in updates:
+                    print(f"  [DRY] {update['id']}: {len(update['alternatives'])} alternatives")
+            elif updates:
+                client.update_items("software", updates)
+        except DirectusError as error:
+            failed.extend(batch)
+            print(f"❌ Lot de {len(batch)} logiciels en échec: {error}", file=sys.stderr)
+            print(f"   ids: {', '.join(str(id) for id in batch)}", file=sys.stderr)
+            continue
+        pushed += len(updates)
+    return pushed, failed
+
+
+def run(args) -> None:
+    """Calcule les suggestions, les écrit et les pousse éventuellement dans Directus."""
+    with PROFILER.phase("lecture du miroir"):
+        items = list(iter_mirror_items(args.mirror))
+    with PROFILER.phase("produit creux et top-k"):
+        suggestions = suggest(items, args.top)
+    PROFILER.count("logiciels", len(items))
+    PROFILER.count("logiciels avec suggestions", sum(1 for found in suggestions.values() if found))
+
+    names = {item["id"]: item["name"] for item in items}
+    output = {
+        id: {"name": names[id], "alternatives": [{"id": alternative, "name": names[alternative], "score": score}
+                                                 for alternative, score in found]}
+        for id, found in sorted(suggestions.items(), key=lambda entry: names[entry[0]].lower())
+    }
+    args.output.write_text(json.dumps(output, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(f"✅ {sum(1 for found in suggestions.values() if found)}/{len(suggestions)} logiciels de niveau 2-3 "
+          f"avec alternatives → {args.output}")
+
+    if args.push:
+        client = client_from_env(args.url)
+        try:
+            count, failed = push_suggestions(client, items, suggestions, args.dry_run)
+        finally:
+            client.close()
+        print(f"{'(DRY RUN) ' if args.dry_run else ''}{count} logiciels sans alternatives complétés dans Directus")
+        if failed:
+            print(f"❌ {len(failed)} logiciels en échec")
+            sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suggère des alternatives de niveau 1 aux logiciels de niveau 2-3")
+    parser.add_argument("--mirror", type=Path, default=MIRROR_PATH, help="miroir SQLite (défaut: scripts/lgpd-mirror.sqlite)")
+    parser.add_argument("--top", type=int, default=3, help="nombre d'alternatives par logiciel (défaut: 3)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH,
+                        help="fichier JSON des suggestions (défaut: scripts/alternatives-suggestions.json)")
+    parser.add_argument("--push", action="store_true", help="enregistre les suggestions dans Directus (listes vides seulement)")
+    parser.add_argument("--url", help="URL Directus (défaut: DIRECTUS_URL de l'environnement ou de .env)")
+    parser.add_argument("--dry-run", action="store_true", help="avec --push : affiche sans écrire")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if not args.mirror.exists():
+        print(f"Erreur: miroir introuvable: {args.mirror} (lancer d'abord lgpd_mirror.py sync)")
+        sys.exit(1)
+    try:
+        run_profiled(args, run, args)
+    except DirectusError as error:
+        print(f"Erreur: {error}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
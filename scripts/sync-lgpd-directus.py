@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Synchronise les classifications LGPD vers la collection Directus `software`.
+
+Lit les classifications (lgpd-classifications.json ou NDJSON produit par
+classify-lgpd.py --ndjson/--csv), récupère les valeurs actuelles dans
+Directus, calcule le diff localement et n'envoie que les items modifiés,
+par lots PATCH en parallèle borné sur des connexions keep-alive.
+
+Mapping (même stratégie que scripts/migrate-from-xlsx.ts) :
+- certificationLevel → lgpd_hosting, lgpd_rgpd, lgpd_data_collection
+  (ou les scores par axe `lgpdScores` de scripts/lgpd_scoring.py --ndjson s'ils sont présents)
+- dataLocation → data_location (catégorie Directus, table exacte de
+  scripts/data-location-mapping.ts), seulement si la valeur est dans la table
+- usageNotes → notes, seulement si l'enregistrement l'a
+
+Les colonnes Directus recopiées telles quelles dans un enregistrement
+(`data_location`, `notes`, `lgpd` d'un export du miroir ou d'une source)
+ne sont jamais renvoyées : ce sont des valeurs lues, pas des classifications.
+
+Usage:
+    python3 scripts/sync-lgpd-directus.py --dry-run
+    python3 scripts/classify-lgpd.py --csv | python3 scripts/sync-lgpd-directus.py --input -
+    python3 scripts/sync-lgpd-directus.py --url http://localhost:8055   # serveur local / stub
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from lgpd_directus import DirectusError, client_from_env
+from lgpd_profile import PROFILER, add_profile_arguments, run_profiled
+from lgpd_sources import map_data_location
+
+CLASSIFICATIONS_PATH = Path(__file__).parent / "lgpd-classifications.json"
+SYNC_FIELDS = ["lgpd_hosting", "lgpd_rgpd", "lgpd_data_collection", "data_location", "notes"]
+
+
+def read_classifications(source: str):
+    """Itère sur les classifications d'un fichier JSON (clé `modifications`) ou NDJSON (`-` = stdin)."""
+    if source != "-" and source.endswith(".json"):
+        yield from json.loads(Path(source).read_text(encoding="utf-8"))["modifications"]
+        return
+    input_file = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        for line in input_file:
+            if line.strip():
+                yield json.loads(line)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+
+
+def directus_values(classification: dict) -> dict | None:
+    """Valeurs Directus cibles d'une classification (None si non classifiée), limitées aux champs présents."""
+    level = classification.get("certificationLevel")
+    if level is None:
+        return None
+    axes = classification.get("lgpdScores") or {"hosting": level, "rgpd": level, "dataCollection": level}
+    values = {
+        "lgpd_hosting": axes["hosting"],
+        "lgpd_rgpd": axes["rgpd"],
+        "lgpd_data_collection": axes["dataCollection"],
+    }
+    # Champ absent de l'enregistrement ou localisation hors table : la valeur Directus est conservée
+    data_location = map_data_location(classification.get("dataLocation"))
+    if data_location is not None:
+        values["data_location"] = data_location
+    if "usageNotes" in classification:
+        values["notes"] = classification["usageNotes"]
+    return values
+
+
+def compute_updates(current_items, classifications) -> tuple[list[dict], list[str]]:
+    """Diff local : retourne (items à modifier avec seulement les champs changés, noms introuvables)."""
+    by_name = {}
+    for item in current_items:
+        by_name.setdefault(item["name"].casefold(), item)
+
+    updates = []
+    missing = []
+    for classification in classifications:
+        target = directus_values(classification)
+        if target is None:
+            continue
+        item = by_name.get(classification["name"].casefold())
+        if item is None:
+            missing.append(classification["name"])
+            continue
+        changed = {field: value for field, value in target.items() if item.get(field) != value}
+        if changed:
+            updates.append({"id": item["id"], **changed})
+    return updates, missing
+
+
+def sync(args) -> None:
+    """Récupère, compare et pousse les classifications modifiées."""
+    client = client_from_env(args.url, pool_size=args.concurrency, retries=args.retries)
+    try:
+        with PROFILER.phase("lecture des classifications"):
+            classifications = list(read_classifications(args.input))
+        with PROFILER.phase("lecture Directus (paginée)"):
+            current_items = list(client.read_items("software", ["id", "name", *SYNC_FIELDS]))
+        with PROFILER.phase("diff local"):
+            updates, missing = compute_updates(current_items, classifications)
+
+        for name in missing:
+            print(f"⚠️  Non trouvé dans Directus: {name}")
+        print(f"{len(classifications)} classifications, {len(current_items)} items Directus, "
+              f"{len(updates)} items à modifier")
+        PROFILER.count("items modifiés", len(updates))
+
+        if args.dry_run:
+            for update in updates:
+                print(f"  [DRY] {update['id']}: {', '.join(field for field in update if field != 'id')}")
+            print("\n(DRY RUN — aucune écriture)")
+            return
+
+        batches = [updates[i:i + args.batch_size] for i in range(0, len(updates), args.batch_size)]
+        with PROFILER.phase("écriture Directus (PATCH par lots)"), \
+                ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            futures = [executor.submit(client.update_items, "software", batch) for batch in batches]
+            failures = 0
+            for batch, future in zip(batches, futures):
+                try:
+                    future.result()
+                except DirectusError as error:
+                    failures += len(batch)
+                    print(f"❌ Lot de {len(batch)} items en échec: {error}", file=sys.stderr)
+        PROFILER.count("requêtes PATCH", len(batches))
+
+        print(f"\n✅ {len(updates) - failures} items mis à jour en {len(batches)} requêtes")
+        if failures:
+            print(f"❌ {failures} items en échec")
+            sys.exit(1)
+    finally:
+        client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synchronise les classifications LGPD vers Directus")
+    parser.add_argument("--input", default=str(CLASSIFICATIONS_PATH),
+                        help="classifications : fichier .json, NDJSON, ou - pour stdin "
+                             "(défaut: scripts/lgpd-classifications.json)")
+    parser.add_argument("--url", help="URL Directus (défaut: DIRECTUS_URL de l'environnement ou de .env)")
+    parser.add_argument("--batch-size", type=int, default=100, help="items par requête PATCH")
+    parser.add_argument("--concurrency", type=int, default=4, help="requêtes simultanées (taille du pool)")
+    parser.add_argument("--retries", type=int, default=3, help="nouvelles tentatives par requête")
+    parser.add_argument("--dry-run", action="store_true", help="affiche le diff sans écrire")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        run_profiled(args, sync, args)
+    except DirectusError as error:
+        print(f"Erreur: {error}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,100 +1,156 @@
+#!/usr/bin/env python3
+"""
+Ajoute ou met à jour le champ `description` de chaque logiciel de software-list.ts.
+
+Les descriptions connues viennent de la base de connaissances
+(knowledge-base/descriptions.json) ou d'un fichier passé par
+`--descriptions` ; à défaut, une description générique est construite à
+partir de `shortDescription`, sauf si le logiciel en a déjà une.
+
+Le catalogue est lu ligne à ligne et réécrit dans un fichier temporaire du
+même dossier, renommé atomiquement à la fin (droits du fichier conservés) :
+mémoire constante, et jamais de fichier à moitié écrit. Relancer le script
+ne change plus rien.
+
+Usage:
+    python3 scripts/update_descriptions.py
+    python3 scripts/update_descriptions.py --descriptions descriptions.json
+"""
+
+import argparse
+import json
+import os
 import re
+import shutil
+import sys
+from pathlib import Path
 
-file_path = "app/data/software-list.ts"
-
-# Dictionary of known descriptions
-descriptions = {
-    "ADOBE ACROBAT": "Adobe Acrobat est la référence mondiale pour la création, l'édition et la gestion de documents PDF. Il permet aux enseignants de créer des supports de cours inaltérables, de corriger des copies numérisées avec des outils d'annotation avancés, et de sécuriser des documents administratifs. Ses fonctionnalités incluent la conversion de fichiers, la signature électronique et la reconnaissance de texte (OCR).",
-    "ATLASSIAN (JIRA, CONFLUENCE, TRELLO)": "La suite Atlassian offre des outils puissants pour la gestion de projet et la collaboration. Trello est idéal pour organiser des tâches visuellement (Kanban), Jira pour le suivi de projets complexes, et Confluence pour créer une base de connaissances collaborative. Ces outils favorisent le travail d'équipe et l'organisation pédagogique.",
-    "CANVA": "Canva est un outil de design graphique en ligne extrêmement intuitif. Il permet aux enseignants et aux élèves de créer facilement des présentations, des affiches, des infographies et des vidéos éducatives. Avec sa vaste bibliothèque de modèles et d'images, il stimule la créativité sans nécessiter de compétences techniques avancées.",
-    "ANTIGRAVITY": "Antigravity est un assistant IA de nouvelle génération conçu pour le développement logiciel. Il agit comme un binôme virtuel, capable de comprendre le contexte du projet, de générer du code, de refactoriser et d'expliquer des concepts complexes. C'est un outil précieux pour l'apprentissage de la programmation et la productivité des développeurs.",
-    "MICROSOFT COPILOT": "Microsoft Copilot est un assistant d'intelligence artificielle intégré à l'écosystème Microsoft 365. Il aide à rédiger des documents Word, analyser des données Excel, créer des présentations PowerPoint et gérer les emails Outlook. Pour les enseignants, c'est un gain de temps considérable pour la préparation de cours et l'administration.",
-    "CODE.ORG": "Code.org est une plateforme éducative dédiée à l'apprentissage de l'informatique pour tous les âges. Elle propose des cours interactifs, des activités ludiques (comme l'Heure de Code) et des ressources pour les enseignants. C'est l'outil idéal pour initier les élèves à la logique de programmation de manière engageante.",
-    "KAHOOT!": "Kahoot! est une plateforme d'apprentissage ludique basée sur le jeu. Elle permet de créer des quiz interactifs, des sondages et des défis pour dynamiser la classe. Les élèves participent en temps réel via leur smartphone ou ordinateur, ce qui favorise l'engagement et permet une évaluation formative instantanée.",
-    "QUIZLET": "Quizlet est un outil d'étude mondialement connu pour ses cartes mémo (flashcards). Il permet aux élèves de mémoriser du vocabulaire, des dates ou des concepts clés grâce à divers modes d'apprentissage (jeux, tests, écriture). Les enseignants peuvent créer leurs propres listes ou utiliser celles partagées par la communauté.",
-    "PADLET": "Padlet est un mur virtuel collaboratif où l'on peut épingler des textes, images, vidéos et liens. C'est un outil polyvalent pour le brainstorming, la collecte de ressources, la présentation de travaux d'élèves ou la création de portfolios numériques. Sa simplicité d'utilisation en fait un incontournable de la classe numérique.",
-    "GENIALLY": "Genially permet de créer des contenus interactifs et animés : présentations, infographies, dossiers, jeux d'évasion (escape games), etc. Contrairement à un diaporama classique, Genially encourage l'exploration active du contenu par l'élève, rendant l'apprentissage plus dynamique et visuel."
-}
-
-with open(file_path, "r") as f:
-    content = f.read()
-
-# Function to replace/add description
-def replace_description(match):
-    full_match = match.group(0)
-    name_match = re.search(r'name:\s*"([^"]+)"', full_match)
-    short_desc_match = re.search(r'shortDescription:\s*"([^"]+)"', full_match)
-    
-    if not name_match:
-        return full_match
-        
-    name = name_match.group(1)
-    short_desc = short_desc_match.group(1) if short_desc_match else ""
-    
-    # Determine description
-    description = descriptions.get(name)
-    if not description:
-        # Generate generic description
-        description = f"{short_desc}. Cet outil est conçu pour faciliter les tâches pédagogiques et administratives, offrant des fonctionnalités adaptées au contexte éducatif."
-
-    # Check if description field already exists
-    if "description:" in full_match:
-        return re.sub(r'description:\s*(null|"[^"]*")', f'description: "{description}"', full_match)
-    else:
-        # Add description after shortDescription
-        return full_match.replace(f'shortDescription: "{short_desc}"', f'shortDescription: "{short_desc}",\n    description: "{description}"')
-
-# Regex to match each software object
-# This is tricky because of nested objects. We'll iterate line by line or use a simpler approach.
-# Let's try line by line with state.
-
-lines = content.split('\n')
-new_lines = []
-current_software = {}
-in_software = False
-buffer = []
-
-for i, line in enumerate(lines):
-    if "id:" in line:
-        in_software = True
-        
-    if "name:" in line:
-        match = re.search(r'name:\s*"([^"]+)"', line)
-        if match:
-            current_software['name'] = match.group(1)
-            
-    if "shortDescription:" in line:
-        match = re.search(r'shortDescription:\s*"([^"]+)"', line)
-        if match:
-            current_software['shortDesc'] = match.group(1)
-            new_lines.append(line)
-            
-            # Decide description
-            name = current_software.get('name', '')
-            short_desc = current_software.get('shortDesc', '')
-            
-            desc = descriptions.get(name)
-            if not desc:
-                 desc = f"{short_desc}. Cet outil est conçu pour faciliter les tâches pédagogiques et administratives, offrant des fonctionnalités adaptées au contexte éducatif."
-            
-            # Check if next line is description (to avoid duplicate if re-running)
-            if i + 1 < len(lines) and "description:" in lines[i+1]:
-                continue # Skip next line as we will overwrite it or it's already there
-            else:
-                # Add description
+from lgpd_knowledge import lazy_attributes, load_section
+from lgpd_profile import PROFILER, add_profile_arguments, run_profiled
+
+CATALOG_PATH = Path(__file__).parent.parent / "app" / "data" / "software-list.ts"
+
+NAME_PATTERN = re.compile(r'name:\s*"([^"]+)"')
+SHORT_DESCRIPTION_PATTERN = re.compile(r'shortDescription:\s*"([^"]+)"')
+GENERIC_DESCRIPTION = ("{}. Cet outil est conçu pour faciliter les tâches pédagogiques et administratives, "
+                       "offrant des fonctionnalités adaptées au contexte éducatif.")
+
+# Descriptions connues (nom → texte) : scripts/knowledge-base/descriptions.json, chargée à la demande
+__getattr__ = lazy_attributes(descriptions=lambda: load_section("DESCRIPTIONS"))
+
+
+def load_descriptions(path: Path | None = None) -> dict[str, str]:
+    """Table des descriptions : fichier JSON (objet nom → texte, versionné ou non), sinon la base de connaissances."""
+    if path is None:
+        return load_section("DESCRIPTIONS")
+    document = json.loads(path.read_text(encoding="utf-8"))
+    return document["data"] if "version" in document else document
+
+
+def rewrite_lines(lines, descriptions: dict[str, str], stats: dict[str, int]):
+    """Générateur : réémet les lignes du catalogue avec la description placée après `shortDescription`.
+
+    Une ligne `description:` suivant directement `shortDescription` est
+    remplacée (ou conservée pour un logiciel sans description connue) ; les
+    autres lignes `description:` d'un bloc logiciel sont retirées.
+    `stats` compte les lignes ajoutées, remplacées et retirées.
+    """
+    in_software = False
+    name = ""
+    pending = None  # (indentation, description connue ou None, description générique)
+
+    for line in lines:
+        if pending is not None:
+            indent, known, generic = pending
+            pending = None
+            if "description:" in line:
+                if known is None or line.strip() == f'description: "{known}",':
+                    yield line
+                else:
+                    stats["remplacées"] += 1
+                    yield f'{indent}description: "{known}",\n'
+                continue
+            stats["ajoutées"] += 1
+            yield f'{indent}description: "{known or generic}",\n'
+
+        if "id:" in line:
+            in_software = True
+
+        if "name:" in line:
+            PROFILER.count("regex.appels.name")
+            match = NAME_PATTERN.search(line)
+            if match:
+                PROFILER.count("regex.correspondances.name")
+                name = match.group(1)
+
+        if "shortDescription:" in line:
+            PROFILER.count("regex.appels.shortDescription")
+            match = SHORT_DESCRIPTION_PATTERN.search(line)
+            if match:
+                PROFILER.count("regex.correspondances.shortDescription")
                 indent = line[:line.find("shortDescription")]
-                new_lines.append(f'{indent}description: "{desc}",')
+                pending = (indent, descriptions.get(name), GENERIC_DESCRIPTION.format(match.group(1)))
+            yield line
+        elif "description:" in line and in_software:
+            stats["retirées"] += 1
         else:
-             new_lines.append(line)
-             
-    elif "description:" in line and in_software:
-        # Skip existing description line as we handled it above (or will handle it)
-        # Wait, if we didn't handle it above (because shortDescription was processed), we should skip it here.
-        # But if shortDescription was processed, we added the new description.
-        # So we just skip this line.
-        pass
+            yield line
+
+    if pending is not None:  # `shortDescription` en dernière ligne
+        indent, known, generic = pending
+        stats["ajoutées"] += 1
+        separator = "" if line.endswith("\n") else "\n"
+        yield f'{separator}{indent}description: "{known or generic}",'
+
+
+def update_descriptions(file_path: Path = CATALOG_PATH, descriptions: dict[str, str] | None = None) -> dict[str, int]:
+    """Réécrit le catalogue en flux vers un fichier temporaire, puis le renomme ; retourne les compteurs."""
+    if descriptions is None:
+        descriptions = load_descriptions()
+    stats = {"ajoutées": 0, "remplacées": 0, "retirées": 0}
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+
+    try:
+        with PROFILER.phase("réécriture en flux"), \
+                open(file_path, encoding="utf-8", newline="") as source, \
+                open(tmp_path, "w", encoding="utf-8", newline="") as target:
+            target.writelines(rewrite_lines(source, descriptions, stats))
+        if PROFILER.enabled:
+            PROFILER.count("octets scannés", file_path.stat().st_size)
+
+        if any(stats.values()):
+            with PROFILER.phase("renommage atomique"):
+                # Le fichier temporaire est créé avec le umask : on reprend les droits du catalogue
+                shutil.copymode(file_path, tmp_path)
+                os.replace(tmp_path, file_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ajoute ou met à jour les descriptions de software-list.ts")
+    parser.add_argument("--descriptions", type=Path, metavar="FICHIER",
+                        help="table JSON nom → description (défaut: scripts/knowledge-base/descriptions.json)")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if not CATALOG_PATH.exists():
+        print(f"Erreur: Fichier non trouvé: {CATALOG_PATH}")
+        sys.exit(1)
+    try:
+        descriptions = load_descriptions(args.descriptions)
+    except (OSError, ValueError, KeyError) as error:
+        print(f"Erreur: descriptions illisibles: {error}")
+        sys.exit(1)
+
+    stats = run_profiled(args, update_descriptions, CATALOG_PATH, descriptions)
+    if any(stats.values()):
+        print(f"✅ Descriptions: {stats['ajoutées']} ajoutées, {stats['remplacées']} remplacées, "
+              f"{stats['retirées']} retirées → {CATALOG_PATH}")
     else:
-        new_lines.append(line)
+        print("⚠️  Aucune modification effectuée")
+
 
-with open(file_path, "w") as f:
-    f.write('\n'.join(new_lines))
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Serveur Directus factice (http.server, bibliothèque standard) pour les tests des scripts Python.
+
+Sous-ensemble de l'API REST utilisé par scripts/lgpd_directus.py :
+- GET /items/<collection>?limit=&page=&filter= : lecture paginée, filtre
+  `_eq` / `_in` sur les champs de premier niveau
+- PATCH /items/<collection> : mise à jour par lots (liste d'objets avec `id`)
+
+Le serveur parle HTTP/1.1 (keep-alive) et journalise chaque requête avec la
+connexion qui l'a portée. `fail_next` fait échouer les prochaines requêtes
+(d'une méthode donnée, ou de toutes) avec les statuts donnés (429, 503...)
+pour tester les nouvelles tentatives.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+def _matches(item: dict, filter: dict) -> bool:
+    """Vrai si l'item satisfait un filtre Directus `{champ: {"_eq" | "_in": valeur}}`."""
+    for field, condition in filter.items():
+        for operator, value in condition.items():
+            if operator == "_eq" and item.get(field) != value:
+                return False
+            if operator == "_in" and item.get(field) not in value:
+                return False
+            if operator not in ("_eq", "_in"):
+                raise ValueError(f"opérateur non supporté par le stub: {operator}")
+    return True
+
+
+class StubRequest:
+    """Requête reçue : méthode, chemin, paramètres, corps JSON et connexion (adresse client)."""
+
+    def __init__(self, method: str, path: str, params: dict, body, connection: tuple):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.body = body
+        self.connection = connection
+
+
+class DirectusStub:
+    """Serveur Directus en mémoire, démarré dans un thread sur un port libre."""
+
+    def __init__(self, collections: dict[str, list[dict]]):
+        self.collections = {name: [dict(item) for item in items] for name, items in collections.items()}
+        self.requests: list[StubRequest] = []
+        self.failures: list[tuple[int, str | None]] = []
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "DirectusStub":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def fail_next(self, *statuses: int, method: str | None = None) -> None:
+        """Les prochaines requêtes (de `method` si donnée) reçoivent ces statuts d'erreur, dans l'ordre."""
+        with self.lock:
+            self.failures.extend((status, method) for status in statuses)
+
+    def _next_failure(self, method: str) -> int | None:
+        for index, (status, only) in enumerate(self.failures):
+            if only in (None, method):
+                del self.failures[index]
+                return status
+        return None
+
+    def requests_for(self, method: str) -> list[StubRequest]:
+        """Requêtes reçues pour une méthode HTTP, dans l'ordre d'arrivée."""
+        return [request for request in self.requests if request.method == method]
+
+    def item(self, collection: str, id) -> dict:
+        """Item courant d'une collection."""
+        return next(item for item in self.collections[collection] if item["id"] == id)
+
+    def _handle(self, method: str, path: str, params: dict, body) -> tuple[int, dict]:
+        collection = path.removeprefix("/items/")
+        if not path.startswith("/items/") or collection not in self.collections:
+            return 404, {"errors": [{"message": f"Route {path} doesn't exist."}]}
+        items = self.collections[collection]
+        if method == "GET":
+            if "filter" in params:
+                items = [item for item in items if _matches(item, json.loads(params["filter"][0]))]
+            limit = int(params.get("limit", ["100"])[0])
+            page = int(params.get("page", ["1"])[0])
+            return 200, {"data": items[(page - 1) * limit:page * limit]}
+        if method == "PATCH":
+            by_id = {item["id"]: item for item in items}
+            for update in body:
+                by_id[update["id"]].update(update)
+            return 200, {"data": [by_id[update["id"]] for update in body]}
+        return 405, {"errors": [{"message": f"{method} non supporté"}]}
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self):
+                parts = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                with stub.lock:
+                    stub.requests.append(StubRequest(self.command, parts.path, parse_qs(parts.query), body,
+                                                     self.client_address))
+                    failure = stub._next_failure(self.command)
+                    if failure is None:
+                        status, payload = stub._handle(self.command, parts.path, parse_qs(parts.query), body)
+                    else:
+                        status, payload = failure, {"errors": [{"message": "erreur simulée"}]}
+                raw = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            do_GET = do_PATCH = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
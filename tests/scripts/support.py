@@ -0,0 +1,13 @@
+"""
+Accès aux modules de scripts/ depuis les tests.
+
+Les scripts s'importent entre eux par leur nom de module : le dossier
+scripts/ est ajouté à sys.path à l'import de ce module.
+"""
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
@@ -0,0 +1,202 @@
+"""
+Tests du classifieur scripts/classify-lgpd.py (automate de noms, index éditeurs, cache de build).
+
+    python3 -m unittest discover -s tests/scripts
+"""
+
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+import support  # noqa: F401  (scripts/ dans sys.path)
+
+from lgpd_knowledge import SECTIONS, load_section
+from lgpd_scripts import load_script
+
+classify = load_script("classify-lgpd.py")
+
+
+def matcher(*patterns: str):
+    """Automate dont chaque motif a pour valeur lui-même."""
+    built = classify.NameMatcher()
+    for pattern in patterns:
+        built.add(pattern, pattern)
+    return built.build()
+
+
+class NameMatcherTest(unittest.TestCase):
+    def test_longest_match_wins_over_insertion_order(self):
+        # « Mine » est inséré d'abord et apparaît au même endroit
+        self.assertEqual(matcher("Mine", "Minecraft").best("Minecraft Education"), "Minecraft")
+        self.assertEqual(matcher("Spark", "Adobe Spark").best("Adobe Spark Video"), "Adobe Spark")
+
+    def test_equal_length_prefers_the_earliest_match(self):
+        self.assertEqual(matcher("Notes", "Zoom!").best("Zoom! Notes"), "Zoom!")
+
+    def test_equal_length_and_position_keeps_insertion_order(self):
+        built = classify.NameMatcher()
+        built.add("Teams", "premier")
+        built.add("TEAMS", "doublon")
+        self.assertEqual(built.build().best("Microsoft Teams"), "premier")
+
+    def test_matches_at_word_boundaries(self):
+        built = matcher("Kahoot", "Samsung Notes")
+        for name in ("Kahoot", "kahoot!", "Quiz (Kahoot)", "Kahoot - version élève", "Mon Kahoot"):
+            with self.subTest(name=name):
+                self.assertEqual(built.best(name), "Kahoot")
+        # Motif de plusieurs mots : l'espace fait partie du motif
+        self.assertEqual(built.best("Samsung Notes Pro"), "Samsung Notes")
+        self.assertIsNone(built.best("Samsung Galaxy Notes"))
+
+    def test_matches_inside_a_word_like_the_substring_test(self):
+        # Comportement historique de `pattern in name` : pas d'exigence de frontière de mot
+        self.assertEqual(matcher("Mine").best("Examine"), "Mine")
+
+    def test_overlapping_patterns_are_all_found(self):
+        found = sorted((start, pattern) for start, _, pattern in matcher("he", "she", "his", "hers").find_all("ushers"))
+        self.assertEqual(found, [(1, "she"), (2, "he"), (2, "hers")])
+
+    def test_agrees_with_a_brute_force_scan_of_the_knowledge_base(self):
+        patterns = [(product, "Microsoft") for product in load_section("MICROSOFT_PRODUCTS")]
+        patterns += [(pattern, key) for pattern, key in load_section("NAME_PATTERNS").items()
+                     if key in classify.build_vendor_index()]
+        names = [pattern for pattern, _ in patterns]
+        names += [f"{first} {second}" for first, second in zip(names, reversed(names))]
+        names += ["Minecraft Education", "Samsung Notes", "Logiciel inconnu"]
+        for name in names:
+            hits = [(-len(pattern), name.lower().find(pattern.lower()), order, key)
+                    for order, (pattern, key) in enumerate(patterns) if pattern.lower() in name.lower()]
+            expected = min(hits)[3] if hits else None
+            with self.subTest(name=name):
+                self.assertEqual(classify.build_name_matcher().best(name), expected)
+
+    def test_find_software_key_uses_the_longest_pattern(self):
+        self.assertEqual(classify.find_software_key("Minecraft Education"),
+                         ("Minecraft Education", classify.build_vendor_index()["Minecraft Education"].level))
+        self.assertEqual(classify.find_software_key("Microsoft Teams")[0], "Microsoft")
+        self.assertIsNone(classify.find_software_key("Logiciel inconnu"))
+
+
+class VendorIndexTest(unittest.TestCase):
+    MICROSOFT = {"country": "USA", "location": "Suisse", "reason": "Contrat cantonal"}
+
+    def build(self, database: dict):
+        """Index construit sur une COMPANY_DATABASE donnée (cache vidé avant et après)."""
+        sections = {"COMPANY_DATABASE": database, "MICROSOFT_ENTRY": self.MICROSOFT}
+        classify.build_vendor_index.cache_clear()
+        self.addCleanup(classify.build_vendor_index.cache_clear)
+        with mock.patch.object(classify, "load_section", sections.__getitem__):
+            return classify.build_vendor_index()
+
+    @staticmethod
+    def vendor(reason: str) -> dict:
+        return {"country": "Suisse", "location": "Suisse", "reason": reason}
+
+    def test_flattens_every_tier(self):
+        index = self.build({"level_1": {"Infomaniak": self.vendor("CH")}, "level_3": {"TikTok": self.vendor("Chine")}})
+        self.assertEqual(index["Infomaniak"], classify.VendorEntry(1, "Suisse", "Suisse", "CH"))
+        self.assertEqual(index["TikTok"].level, 3)
+        self.assertEqual(index["Microsoft"], classify.VendorEntry(1, **self.MICROSOFT))
+
+    def test_vendor_in_several_tiers_raises(self):
+        database = {"level_1": {"Canva": self.vendor("a")}, "level_2": {"Canva": self.vendor("b")},
+                    "level_3": {"Microsoft": self.vendor("c")}}
+        with self.assertRaisesRegex(ValueError, r"Canva \(level_1 / level_2\), Microsoft \(MICROSOFT_ENTRY / level_3\)"):
+            self.build(database)
+
+    def test_index_is_read_only(self):
+        index = self.build({"level_1": {"Infomaniak": self.vendor("CH")}})
+        with self.assertRaises(TypeError):
+            index["Canva"] = classify.VendorEntry(1, "Suisse", "Suisse", "ajout")
+        with self.assertRaises(AttributeError):
+            index["Infomaniak"].level = 3
+        self.assertEqual(index["Infomaniak"].level, 1)
+
+    def test_knowledge_base_has_no_duplicate_tier(self):
+        index = classify.build_vendor_index()
+        self.assertEqual(index["Microsoft"].level, 1)
+        self.assertGreater(len(index), 1)
+
+
+def catalog(*names: str) -> str:
+    """Catalogue software-list.ts minimal (seuls les `name:` sont lus)."""
+    return "export const softwareList = [\n" + "".join(f'  {{ name: "{name}" }},\n' for name in names) + "]\n"
+
+
+class BuildCacheTest(unittest.TestCase):
+    NAMES = ("Kahoot", "Canva", "CapCut", "Logiciel inconnu")
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.catalog = self.dir / "software-list.ts"
+        self.output = self.dir / "lgpd-classifications.json"
+        self.catalog.write_text(catalog(*self.NAMES), encoding="utf-8")
+        # Copie de la base de connaissances : l'empreinte du cache est calculée sur ces fichiers
+        self.knowledge = self.dir / "knowledge-base"
+        self.knowledge.mkdir()
+        for section in classify.CACHE_SECTIONS:
+            shutil.copy(classify.source_path(section), self.knowledge)
+        patcher = mock.patch.object(classify, "source_path",
+                                    lambda section: self.knowledge / SECTIONS[section])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_classify(self) -> tuple[list[str], str]:
+        """Lance process_software_file ; retourne les noms effectivement classifiés et la sortie console."""
+        output = io.StringIO()
+        with mock.patch.object(classify, "get_classification", wraps=classify.get_classification) as spy, \
+                redirect_stdout(output):
+            classify.process_software_file(self.catalog, self.output)
+        return [call.args[0] for call in spy.call_args_list], output.getvalue()
+
+    def test_unchanged_inputs_reuse_the_output(self):
+        classified, _ = self.run_classify()
+        self.assertEqual(classified, list(self.NAMES))
+        first = self.output.read_bytes()
+
+        classified, output = self.run_classify()
+        self.assertEqual(classified, [])
+        self.assertIn("✅ Cache: catalogue et base de connaissances inchangés", output)
+        self.assertEqual(self.output.read_bytes(), first)
+
+    def test_new_name_is_the_only_one_classified(self):
+        self.run_classify()
+        self.catalog.write_text(catalog(*self.NAMES, "Calendly"), encoding="utf-8")
+
+        classified, _ = self.run_classify()
+        self.assertEqual(classified, ["Calendly"])
+        result = json.loads(self.output.read_text(encoding="utf-8"))
+        self.assertEqual(result["total"], 5)
+        self.assertEqual(sorted(entry["name"] for entry in result["modifications"]),
+                         ["Calendly", "Canva", "CapCut", "Kahoot"])
+
+    def test_edited_knowledge_base_invalidates_the_cache(self):
+        self.run_classify()
+        path = self.knowledge / SECTIONS["NAME_PATTERNS"]
+        patterns = json.loads(path.read_text(encoding="utf-8"))
+        path.write_text(json.dumps(patterns, ensure_ascii=False, indent=4), encoding="utf-8")
+
+        classified, output = self.run_classify()
+        self.assertEqual(classified, list(self.NAMES))
+        self.assertNotIn("✅ Cache", output)
+
+    def test_output_edited_by_hand_is_regenerated(self):
+        self.run_classify()
+        self.output.write_text("{}", encoding="utf-8")
+
+        classified, output = self.run_classify()
+        # Sortie différente de celle du cache : régénérée, sans reclassifier
+        self.assertEqual(classified, [])
+        self.assertNotIn("✅ Cache", output)
+        self.assertEqual(json.loads(self.output.read_text(encoding="utf-8"))["total"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
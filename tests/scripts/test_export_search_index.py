@@ -0,0 +1,88 @@
+"""
+Tests de l'index de recherche statique scripts/export_search_index.py.
+
+    python3 -m unittest discover -s tests/scripts
+"""
+
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import support  # noqa: F401  (scripts/ dans sys.path)
+
+from export_search_index import FIELDS, build_search_index, content_hash, export_search_index, tokenize
+
+RECORDS = [
+    {"id": "a", "name": "Mind Mapper", "short_description": "Créer des cartes mentales", "description": None,
+     "lgpd_hosting": 1, "lgpd_rgpd": 1, "lgpd_data_collection": 1,
+     "categories": ["Cartes mentales"], "pedagogical_activities": ["Créer"]},
+    {"id": "b", "name": "Quiz Éclair", "short_description": "Quiz en classe", "description": "Évaluer les élèves",
+     "lgpd_hosting": 2, "lgpd_rgpd": 1, "lgpd_data_collection": None,
+     "categories": ["Quiz"], "pedagogical_activities": ["Évaluer", "Créer"]},
+]
+
+
+class TokenizeTest(unittest.TestCase):
+    def test_accents_case_and_stop_words(self):
+        self.assertEqual(tokenize("Créer des Cartes mentales à l'École"), {"creer", "cartes", "mentales", "ecole"})
+        self.assertEqual(tokenize("Quiz Éclair 2.0"), {"quiz", "eclair"})
+        self.assertEqual(tokenize(None), set())
+
+
+class BuildSearchIndexTest(unittest.TestCase):
+    def test_postings_carry_the_source_fields(self):
+        index = build_search_index(RECORDS)
+        self.assertEqual(index["documents"], [["a", "Mind Mapper", 1], ["b", "Quiz Éclair", 0]])
+        self.assertEqual(index["postings"]["quiz"], [1, FIELDS["name"] | FIELDS["description"] | FIELDS["category"]])
+        self.assertEqual(index["postings"]["creer"], [0, FIELDS["description"] | FIELDS["activity"],
+                                                      1, FIELDS["activity"]])
+        self.assertEqual(index["postings"]["evaluer"], [1, FIELDS["description"] | FIELDS["activity"]])
+
+    def test_postings_agree_with_a_scan(self):
+        index = build_search_index(RECORDS)
+        for term, postings in index["postings"].items():
+            documents = postings[::2]
+            expected = [document for document, record in enumerate(RECORDS)
+                        if term in tokenize(" ".join(filter(None, [
+                            record["name"], record["short_description"], record["description"],
+                            *record["categories"], *record["pedagogical_activities"]])))]
+            with self.subTest(term=term):
+                self.assertEqual(documents, expected)
+
+
+class ExportTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def test_hashed_file_and_gzip_variant(self):
+        manifest = export_search_index(RECORDS, self.dir)
+        data = (self.dir / manifest["index"]).read_bytes()
+
+        self.assertEqual(manifest["index"], f"index.{content_hash(data)}.json")
+        self.assertEqual(json.loads(data), build_search_index(RECORDS))
+        self.assertEqual(gzip.decompress((self.dir / manifest["encodings"]["gz"]["file"]).read_bytes()), data)
+        self.assertEqual(json.loads((self.dir / "manifest.json").read_text(encoding="utf-8")), manifest)
+
+    def test_unchanged_catalog_rewrites_nothing(self):
+        export_search_index(RECORDS, self.dir)
+        stamps = {path.name: path.stat().st_mtime_ns for path in self.dir.iterdir()}
+
+        export_search_index(RECORDS, self.dir)
+        self.assertEqual({path.name: path.stat().st_mtime_ns for path in self.dir.iterdir()}, stamps)
+
+    def test_changed_catalog_replaces_the_previous_version(self):
+        first = export_search_index(RECORDS, self.dir)
+        second = export_search_index(RECORDS[:1], self.dir)
+
+        self.assertNotEqual(first["index"], second["index"])
+        names = sorted(path.name for path in self.dir.iterdir())
+        self.assertEqual(names, sorted(["manifest.json", second["index"],
+                                        *(variant["file"] for variant in second["encodings"].values())]))
+
+
+if __name__ == "__main__":
+    unittest.main()
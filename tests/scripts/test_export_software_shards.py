@@ -0,0 +1,130 @@
+"""
+Tests des fiches précalculées scripts/export_software_shards.py.
+
+    python3 -m unittest discover -s tests/scripts
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import support  # noqa: F401  (scripts/ dans sys.path)
+
+from export_software_shards import MANIFEST_NAME, export_shards
+
+
+def directus_software(id: str, **overrides) -> dict:
+    """Item Directus publié, comme makeDirectusSoftware() (tests/unit/server-directus-utils.test.ts)."""
+    return {
+        "id": id, "status": "published", "name": "Test Software", "icon": None,
+        "short_description": "Description courte", "description": None,
+        "lgpd_hosting": 1, "lgpd_rgpd": 1, "lgpd_data_collection": 1, "data_location": "switzerland",
+        "cost": "Gratuit", "funded_by_sfp": False, "funded_by_sen": False, "target_audience": None,
+        "tool_url": "https://example.com", "doc_url": None, "notes": None, "requires_parental_consent": False,
+        "requires_edu_account": False, "requires_edulog": False, "approved_by_sen": False, "approved_by_sfp": False,
+        "contractual_safeguards": None, "date_created": None, "date_updated": None,
+        "categories": [], "pedagogical_activities": [], "alternatives": [],
+        **overrides,
+    }
+
+
+SAMPLE = directus_software(
+    "uuid-1",
+    name="Quiz Éclair",
+    lgpd_hosting=2, lgpd_rgpd=None, lgpd_data_collection=3,
+    data_location="us_dpf",
+    cost=None,
+    contractual_safeguards=["dpa", "inconnu", "scc"],
+    notes="Usage avec précautions",
+    date_created="2025-01-15T10:30:00.000Z",
+    categories=[{"category_id": {"id": "c1", "name": "Quiz", "icon": "i-quiz"}}, {"category_id": None}],
+    pedagogical_activities=[{"pedagogical_activity_id": {"id": "p1", "name": "Évaluer", "icon": None}}],
+    alternatives=[{"alternative_id": {"id": "uuid-2"}}, {"alternative_id": {"id": "brouillon"}},
+                  {"alternative_id": None}],
+)
+
+# mapSoftware(SAMPLE) (server/utils/directus.ts), alternatives limitées aux logiciels publiés
+SAMPLE_SOFTWARE = {
+    "id": "uuid-1",
+    "name": "Quiz Éclair",
+    "icon": None,
+    "shortDescription": "Description courte",
+    "description": None,
+    "lgpd": {"hosting": 2, "rgpd": 0, "dataCollection": 3},
+    "certificationLevel": 0,
+    "dataLocation": "États-Unis",
+    "requiresEduAccount": False,
+    "requiresEdulog": False,
+    "approvedBySEN": False,
+    "approvedBySFP": False,
+    "cost": "Gratuit",
+    "fundedBySFP": False,
+    "fundedBySEN": False,
+    "contractualSafeguards": ["dpa", "scc"],
+    "toolUrl": "https://example.com",
+    "documentation": None,
+    "targetAudience": None,
+    "requiresParentalConsent": False,
+    "usageNotes": "Usage avec précautions",
+    "categories": [{"name": "Quiz", "icon": "i-quiz"}],
+    "pedagogicalActivities": [{"name": "Évaluer", "icon": None}],
+    "alternatives": ["uuid-2"],
+    "createdAt": 1736937000000,
+}
+
+
+class ExportShardsTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.items = [SAMPLE, directus_software("uuid-2", name="Mind Mapper")]
+
+    def manifest(self) -> dict[str, str]:
+        return json.loads((self.dir / MANIFEST_NAME).read_text(encoding="utf-8"))["shards"]
+
+    def shard(self, id: str) -> dict:
+        return json.loads((self.dir / self.manifest()[id]).read_text(encoding="utf-8"))
+
+    def test_shard_matches_map_software(self):
+        stats = export_shards(self.items, self.dir)
+        self.assertEqual(stats, {"écrites": 2, "inchangées": 0, "supprimées": 0})
+        self.assertEqual(self.shard("uuid-1"), SAMPLE_SOFTWARE)
+        # Champs `undefined` en TS : absents du JSON
+        self.assertNotIn("updatedAt", self.shard("uuid-1"))
+        self.assertNotIn("createdAt", self.shard("uuid-2"))
+
+    def test_unchanged_shards_are_not_rewritten(self):
+        export_shards(self.items, self.dir)
+        stamps = {path.name: path.stat().st_mtime_ns for path in self.dir.iterdir()}
+
+        self.assertEqual(export_shards(self.items, self.dir), {"écrites": 0, "inchangées": 2, "supprimées": 0})
+        self.assertEqual({path.name: path.stat().st_mtime_ns for path in self.dir.iterdir()}, stamps)
+
+    def test_changed_shard_gets_a_new_name_and_the_old_one_is_removed(self):
+        export_shards(self.items, self.dir)
+        before = self.manifest()
+        changed = [SAMPLE, directus_software("uuid-2", name="Mind Mapper", notes="Nouveau")]
+
+        self.assertEqual(export_shards(changed, self.dir), {"écrites": 1, "inchangées": 1, "supprimées": 1})
+        after = self.manifest()
+        self.assertEqual(after["uuid-1"], before["uuid-1"])
+        self.assertNotEqual(after["uuid-2"], before["uuid-2"])
+        self.assertFalse((self.dir / before["uuid-2"]).exists())
+        self.assertEqual(self.shard("uuid-2")["usageNotes"], "Nouveau")
+
+    def test_unpublished_software_is_removed(self):
+        export_shards(self.items, self.dir)
+        removed = list(self.manifest().values())
+
+        # La fiche uuid-1 change aussi (alternative retirée) : les deux anciennes fiches sont supprimées
+        self.assertEqual(export_shards([SAMPLE], self.dir), {"écrites": 1, "inchangées": 0, "supprimées": 2})
+        self.assertEqual(list(self.manifest()), ["uuid-1"])
+        self.assertFalse(any((self.dir / file_name).exists() for file_name in removed))
+        # uuid-2 n'est plus publié : retiré des alternatives
+        self.assertEqual(self.shard("uuid-1")["alternatives"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
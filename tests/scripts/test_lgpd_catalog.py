@@ -0,0 +1,257 @@
+"""
+Tests du moteur de patch scripts/lgpd_catalog.py (table de morceaux, application incrémentale et état persistant).
+
+    python3 -m unittest discover -s tests/scripts
+"""
+
+import io
+import json
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+import support  # noqa: F401  (scripts/ dans sys.path)
+
+import lgpd_catalog
+from lgpd_catalog import Classification, Edit, PieceTable, apply_classifications, load_state, splice, state_path_for
+
+HEADER = 'import type { Software } from "~/types/software"\n\nexport const softwareList: Software[] = [\n'
+
+
+def block(id: int, name: str, level: int = 0, location: str = "Inconnu") -> str:
+    """Bloc logiciel au format de software-list.ts."""
+    return (f'  {{\n    id: "{id}",\n    name: "{name}",\n    shortDescription: "{name}",\n'
+            f'    certificationLevel: {level},\n    dataLocation: "{location}",\n    personalData: false,\n'
+            f'    usageNotes: null,\n  }},\n')
+
+
+CATALOG = HEADER + "".join(block(id, name) for id, name in enumerate(["Alpha", "Beta", "Gamma", "Delta"], 1)) + "]\n"
+
+
+def classification(level: int, location: str = "Suisse", to_validate: bool = False) -> Classification:
+    return Classification(level=level, data_location=location, personal_data=True,
+                          usage_notes=f"Niveau {level}", remarque=f"Remarque {level}", to_validate=to_validate)
+
+
+def random_edits(rng: random.Random, size: int, count: int) -> list[Edit]:
+    """Remplacements, insertions et suppressions non chevauchants dans un texte de `size` caractères."""
+    bounds = sorted(rng.sample(range(size + 1), min(2 * count, size + 1)))
+    edits = []
+    for start, end in zip(bounds[::2], bounds[1::2]):
+        kind = rng.choice(("remplacement", "insertion", "suppression"))
+        if kind == "insertion":
+            end = start
+        text = "" if kind == "suppression" else rng.choice(("x", "«é»", "\n", "remarque: \"Niveau 1\""))
+        edits.append(Edit(start, end, text, kind))
+    rng.shuffle(edits)
+    return edits
+
+
+class PieceTableTest(unittest.TestCase):
+    def test_apply_matches_splice(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            text = CATALOG[:rng.randrange(len(CATALOG) + 1)]
+            buffer, expected = PieceTable(text), text
+            # Plusieurs lots : positions exprimées dans le texte courant
+            for _ in range(rng.randrange(1, 5)):
+                edits = random_edits(rng, len(expected), rng.randrange(0, 8))
+                buffer.apply(edits)
+                expected = splice(expected, edits)
+                self.assertEqual(len(buffer), len(expected))
+            self.assertEqual(buffer.slice(0, len(buffer)), expected)
+
+    def test_insertions_at_the_same_position_keep_their_order(self):
+        buffer = PieceTable("usageNotes: null,\n")
+        edits = [Edit(16, 16, ',\n    remarque: "R"', "remarque"),
+                 Edit(16, 16, ",\n    toValidate: true", "toValidate")]
+        buffer.apply(edits)
+        self.assertEqual(buffer.slice(0, len(buffer)), splice("usageNotes: null,\n", edits))
+        self.assertEqual(buffer.slice(0, len(buffer)), 'usageNotes: null,\n    remarque: "R",\n    toValidate: true,\n')
+
+    def test_empty_text(self):
+        buffer = PieceTable("")
+        self.assertEqual((len(buffer), buffer.slice(0, 0)), (0, ""))
+        buffer.apply([Edit(0, 0, "abc", "insertion")])
+        self.assertEqual(buffer.slice(0, 3), "abc")
+
+    def test_undo_restores_the_text_before_the_last_batch(self):
+        rng = random.Random(4)
+        buffer = PieceTable(CATALOG)
+        buffer.apply(random_edits(rng, len(CATALOG), 10))
+        before = buffer.slice(0, len(buffer))
+
+        buffer.apply(random_edits(rng, len(buffer), 10))
+        self.assertNotEqual(buffer.slice(0, len(buffer)), before)
+        self.assertTrue(buffer.undo())
+        self.assertEqual(len(buffer), len(before))
+        self.assertEqual(buffer.slice(0, len(buffer)), before)
+        # Un seul niveau : le premier lot reste appliqué
+        self.assertFalse(buffer.undo())
+        self.assertEqual(buffer.slice(0, len(buffer)), before)
+
+    def test_undo_without_batch(self):
+        buffer = PieceTable(CATALOG)
+        self.assertFalse(buffer.undo())
+        self.assertEqual(buffer.slice(0, len(buffer)), CATALOG)
+
+    def test_slice_matches_string_slicing(self):
+        rng = random.Random(2)
+        buffer = PieceTable(CATALOG)
+        buffer.apply(random_edits(rng, len(CATALOG), 30))
+        text = buffer.slice(0, len(buffer))
+        for _ in range(500):
+            start = rng.randrange(len(text) + 1)
+            end = rng.randrange(start, len(text) + 1)
+            self.assertEqual(buffer.slice(start, end), text[start:end])
+
+    def test_write_matches_splice(self):
+        rng = random.Random(3)
+        edits = random_edits(rng, len(CATALOG), 20)
+        buffer = PieceTable(CATALOG)
+        buffer.apply(edits)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "software-list.ts"
+            path.write_text("ancien contenu", encoding="utf-8")
+            # Petites tranches : un morceau est écrit en plusieurs fois
+            with mock.patch.object(lgpd_catalog, "WRITE_CHUNK", 7):
+                buffer.write(path)
+            self.assertEqual(path.read_text(encoding="utf-8"), splice(CATALOG, edits))
+            self.assertEqual([child.name for child in Path(tmp).iterdir()], ["software-list.ts"])
+
+    def test_write_keeps_the_file_mode(self):
+        buffer = PieceTable(CATALOG)
+        buffer.apply([Edit(0, 0, "// en-tête\n", "insertion")])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "software-list.ts"
+            path.write_text(CATALOG, encoding="utf-8")
+            path.chmod(0o640)
+            buffer.write(path)
+            self.assertEqual(path.stat().st_mode & 0o777, 0o640)
+            self.assertTrue(path.read_text(encoding="utf-8").startswith("// en-tête\n"))
+
+
+class IncrementalApplyTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.catalog = self.dir / "software-list.ts"
+        self.catalog.write_text(CATALOG, encoding="utf-8")
+
+    def apply(self, classifications: dict, path: Path | None = None, **options) -> str:
+        output = io.StringIO()
+        with redirect_stdout(output):
+            apply_classifications(classifications, path or self.catalog, **options)
+        return output.getvalue()
+
+    def full_result(self, classifications: dict, content: str) -> str:
+        """Contenu obtenu par une application complète (--full) sur une copie."""
+        copy = self.dir / "full" / "software-list.ts"
+        copy.parent.mkdir(exist_ok=True)
+        copy.write_text(content, encoding="utf-8")
+        self.apply(classifications, copy, full=True)
+        return copy.read_text(encoding="utf-8")
+
+    def test_first_run_applies_and_records_state(self):
+        classifications = {"Alpha": classification(1), "Gamma": classification(3, "USA", to_validate=True)}
+        self.apply(classifications)
+
+        content = self.catalog.read_text(encoding="utf-8")
+        self.assertIn('name: "Alpha",\n    shortDescription: "Alpha",\n    certificationLevel: 1,\n'
+                      '    dataLocation: "Suisse",\n    personalData: true,\n    usageNotes: "Niveau 1",\n'
+                      '    remarque: "Remarque 1",\n  },', content)
+        self.assertIn('remarque: "Remarque 3",\n    toValidate: true,\n  },', content)
+        state = load_state(state_path_for(self.catalog))
+        self.assertEqual(sorted(state["records"]), ["Alpha", "Gamma"])
+        self.assertEqual(len(state["blocks"]["Alpha"]), 1)
+
+    def test_noop_rerun_does_not_rewrite(self):
+        classifications = {"Alpha": classification(1), "Beta": classification(2)}
+        self.apply(classifications)
+        content = self.catalog.read_text(encoding="utf-8")
+        stamp = self.catalog.stat().st_mtime_ns
+
+        output = self.apply(classifications)
+        self.assertIn("2 classifications inchangées", output)
+        self.assertEqual(self.catalog.read_text(encoding="utf-8"), content)
+        self.assertEqual(self.catalog.stat().st_mtime_ns, stamp)
+
+    def test_noop_rerun_still_writes_the_edit_log(self):
+        classifications = {"Alpha": classification(1)}
+        self.apply(classifications)
+        log_path = self.dir / "modifications.json"
+
+        self.apply(classifications, edit_log_path=log_path)
+        log = json.loads(log_path.read_text(encoding="utf-8"))
+        self.assertEqual((log["software"], log["edits"]), (0, []))
+
+    def test_only_changed_classifications_are_reapplied(self):
+        self.apply({"Alpha": classification(1), "Beta": classification(2)})
+        output = self.apply({"Alpha": classification(1), "Beta": classification(3)})
+
+        self.assertIn("✅ Beta: Niveau 3", output)
+        self.assertNotIn("Alpha: Niveau", output)
+        self.assertIn("1 classifications inchangées", output)
+
+    def test_edit_outside_any_block_keeps_state(self):
+        classifications = {"Alpha": classification(1), "Delta": classification(2)}
+        self.apply(classifications)
+        # Modification hors des blocs : les positions bougent, pas le contenu des blocs
+        edited = "// Catalogue des logiciels\n" + self.catalog.read_text(encoding="utf-8")
+        self.catalog.write_text(edited, encoding="utf-8")
+
+        output = self.apply(classifications)
+        self.assertIn("Aucune modification effectuée", output)
+        self.assertEqual(self.catalog.read_text(encoding="utf-8"), edited)
+
+        # Les positions rafraîchies servent à la modification suivante
+        changed = {"Alpha": classification(1), "Delta": classification(3, "Chine")}
+        self.apply(changed)
+        self.assertEqual(self.catalog.read_text(encoding="utf-8"), self.full_result(changed, edited))
+
+    def test_changed_block_hash_reapplies_that_block(self):
+        classifications = {"Alpha": classification(1), "Beta": classification(2)}
+        self.apply(classifications)
+        applied = self.catalog.read_text(encoding="utf-8")
+        # Bloc Beta modifié à la main (niveau et localisation)
+        edited = applied.replace('certificationLevel: 2,\n    dataLocation: "Suisse"',
+                                 'certificationLevel: 3,\n    dataLocation: "États-Unis"')
+        self.assertNotEqual(edited, applied)
+        self.catalog.write_text(edited, encoding="utf-8")
+
+        output = self.apply(classifications)
+        self.assertIn("✅ Beta: Niveau 2", output)
+        self.assertNotIn("Alpha: Niveau", output)
+        self.assertEqual(self.catalog.read_text(encoding="utf-8"), applied)
+
+    def test_incremental_runs_agree_with_full(self):
+        runs = [
+            {"Alpha": classification(1), "Beta": classification(2), "Inconnu": classification(1)},
+            {"Alpha": classification(1), "Beta": classification(3, "USA", to_validate=True)},
+            {"Alpha": classification(2), "Beta": classification(3, "USA", to_validate=True),
+             "Gamma": classification(1), "Delta": classification(3, "Chine")},
+        ]
+        for classifications in runs:
+            self.apply(classifications)
+        self.assertEqual(self.catalog.read_text(encoding="utf-8"), self.full_result(runs[-1], CATALOG))
+
+    def test_missing_names_are_reported_on_every_run(self):
+        classifications = {"Alpha": classification(1), "Inconnu": classification(1)}
+        self.assertIn("⚠️  Non trouvé: Inconnu", self.apply(classifications))
+        self.assertIn("⚠️  Non trouvé: Inconnu", self.apply(classifications))
+
+    def test_dry_run_writes_nothing(self):
+        output = self.apply({"Alpha": classification(1)}, dry_run=True)
+
+        self.assertIn("\n-    certificationLevel: 0,\n", output)
+        self.assertIn("\n+    certificationLevel: 1,\n", output)
+        self.assertEqual(self.catalog.read_text(encoding="utf-8"), CATALOG)
+        self.assertFalse(state_path_for(self.catalog).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
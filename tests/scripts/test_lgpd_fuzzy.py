@@ -0,0 +1,61 @@
+"""
+Tests de la résolution approximative scripts/lgpd_fuzzy.py (index de trigrammes).
+
+    python3 -m unittest discover -s tests/scripts
+"""
+
+import unittest
+
+import support  # noqa: F401  (scripts/ dans sys.path)
+
+from lgpd_fuzzy import TrigramIndex, resolve, trigrams
+
+
+class TrigramsTest(unittest.TestCase):
+    def test_words_are_padded_like_pg_trgm(self):
+        self.assertEqual(trigrams("Zed"), {"  z", " ze", "zed", "ed "})
+
+    def test_case_and_accents_are_ignored(self):
+        self.assertEqual(trigrams("Éditeur"), trigrams("editeur"))
+
+
+class TrigramIndexTest(unittest.TestCase):
+    def test_best_label_per_target(self):
+        index = TrigramIndex()
+        index.add("Kahoot", "Kahoot", "éditeur")
+        index.add("Kahoot!", "Kahoot", "alias")
+        index.add("Quizlet", "Quizlet", "éditeur")
+        candidates = index.search("Kahot")
+        self.assertEqual([candidate.target for candidate in candidates], ["Kahoot"])
+        self.assertEqual(candidates[0].source, "éditeur")
+
+
+class ResolveTest(unittest.TestCase):
+    def test_typo_resolves_to_the_vendor(self):
+        best = resolve("ORTHOHPHORE")[0]
+        self.assertEqual((best.target, best.source), ("Orthophore", "éditeur"))
+        self.assertGreaterEqual(best.score, 0.6)
+
+    def test_google_chrome_is_a_company_hint_without_product(self):
+        best = resolve("Google Chrome")[0]
+        self.assertEqual((best.label, best.target, best.source), ("Google", None, "société"))
+        self.assertNotIn("NotebookLM", [candidate.target for candidate in resolve("Google Docs")])
+
+    def test_company_cited_by_another_product_has_no_target(self):
+        for company in ("Spotify", "ByteDance", "Readdle"):
+            with self.subTest(company=company):
+                best = resolve(company)[0]
+                self.assertEqual((best.label, best.target), (company, None))
+
+    def test_company_naming_its_own_vendor_keeps_the_target(self):
+        best = resolve("Canva Pty Ltd")[0]
+        self.assertEqual((best.label, best.target), ("Canva Pty Ltd", "Canva"))
+
+    def test_unclassified_names_do_not_match_themselves(self):
+        # Les tables de classification ne sont pas indexées
+        for candidate in resolve("Google Chrome") + resolve("ORTHOHPHORE"):
+            self.assertNotIn(candidate.source, ("classification", "complément"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests des masques de juridictions scripts/lgpd_jurisdictions.py.
+
+    python3 -m unittest discover -s tests/scripts
+"""
+
+import unittest
+
+import support  # noqa: F401  (scripts/ dans sys.path)
+
+from lgpd_jurisdictions import Jurisdictions as J, flag_names, parse_flags, parse_location, select
+
+# Localisation → masque attendu
+LOCATIONS = [
+    ("Suisse", J.CH),
+    ("Union Européenne", J.EU),
+    ("Union Européenne (AWS)", J.EU),
+    ("États-Unis", J.US),
+    ("USA", J.US),
+    ("États-Unis (option UE)", J.US | J.OPTION_EU),
+    ("États-Unis (option UE/CH)", J.US | J.OPTION_EU),
+    ("Union Européenne (option)", J.EU | J.OPTION_EU),
+    ("Australie/États-Unis", J.US | J.OTHER),
+    ("Royaume-Uni/États-Unis", J.UK | J.US),
+    ("Suisse/Luxembourg", J.CH | J.EU),
+    ("Canada/Chine", J.CA | J.CN),
+    ("Local", J.LOCAL),
+    ("Local/États-Unis", J.LOCAL | J.US),
+    ("Chine", J.CN),
+    ("Corée du Sud", J.OTHER),
+    ("Hors UE", J.OTHER),
+    ("Global", J.US | J.OTHER),
+    ("Inconnu", J.UNKNOWN),
+    ("", J.UNKNOWN),
+    (None, J.UNKNOWN),
+    ("(option)", J.OPTION_EU | J.UNKNOWN),
+    ("Mars", J.UNKNOWN),
+    # Catégories data_location de Directus
+    ("switzerland", J.CH),
+    ("us_dpf", J.US),
+    ("multi_or_partial", J.US | J.OTHER),
+    ("other", J.UNKNOWN),
+]
+
+# Noms de drapeaux → masque attendu
+FLAGS = [
+    ([], 0),
+    (["US"], J.US),
+    (["us", "ch"], J.US | J.CH),
+    (["option_eu"], J.OPTION_EU),
+    (["option-eu", "Local"], J.OPTION_EU | J.LOCAL),
+    (["UNKNOWN", "unknown"], J.UNKNOWN),
+]
+
+
+class ParseLocationTest(unittest.TestCase):
+    def test_locations(self):
+        for location, expected in LOCATIONS:
+            with self.subTest(location=location):
+                self.assertEqual(parse_location(location), expected)
+                self.assertIsInstance(parse_location(location), int)
+
+    def test_case_and_spacing_are_ignored(self):
+        self.assertEqual(parse_location("  ÉTATS-UNIS (Option UE) "), parse_location("États-Unis (option UE)"))
+
+
+class ParseFlagsTest(unittest.TestCase):
+    def test_flags(self):
+        for names, expected in FLAGS:
+            with self.subTest(names=names):
+                self.assertEqual(parse_flags(names), expected)
+
+    def test_unknown_flag_raises(self):
+        for names in (["Mars"], ["US", "EEE"], [""]):
+            with self.subTest(names=names), self.assertRaisesRegex(ValueError, "Juridiction inconnue"):
+                parse_flags(names)
+
+    def test_round_trip_with_flag_names(self):
+        for location, expected in LOCATIONS:
+            with self.subTest(location=location):
+                self.assertEqual(parse_flags(flag_names(expected)), expected)
+
+
+class SelectTest(unittest.TestCase):
+    def test_any_of_and_none_of(self):
+        masks = [parse_location(location) for location in ("Suisse", "États-Unis (option UE)", "Local/États-Unis",
+                                                           "Chine")]
+        self.assertEqual(select(masks, any_of=J.US), [1, 2])
+        self.assertEqual(select(masks, any_of=J.US, none_of=J.LOCAL), [1])
+        self.assertEqual(select(masks, none_of=J.US | J.CN), [0])
+        self.assertEqual(select(masks), [0, 1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
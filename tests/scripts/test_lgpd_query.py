@@ -0,0 +1,137 @@
+"""
+Tests des index bitmap scripts/lgpd_query.py (filtres composés, lignes, sauvegarde).
+
+    python3 -m unittest discover -s tests/scripts
+"""
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+import support  # noqa: F401  (scripts/ dans sys.path)
+
+from lgpd_jurisdictions import Jurisdictions, parse_location
+from lgpd_query import BitmapIndex, query
+
+LOCATIONS = ["Suisse", "Union Européenne", "États-Unis", "États-Unis (option UE)", "Chine", "Local/États-Unis", None]
+CATEGORIES = ["Quiz", "Bureautique", "Dessin", "Langues"]
+ACTIVITIES = ["Évaluer", "Créer", "Collaborer"]
+
+
+def random_records(rng: random.Random, count: int) -> list[dict]:
+    """Enregistrements NDJSON classifiés (niveau 0 = non évalué)."""
+    records = []
+    for row in range(count):
+        record = {
+            "name": f"Logiciel {row}",
+            "certificationLevel": rng.choice([0, 1, 2, 3, None]),
+            "dataLocation": rng.choice(LOCATIONS),
+            "categories": rng.sample(CATEGORIES, rng.randrange(3)),
+            "pedagogicalActivities": [{"name": name} for name in rng.sample(ACTIVITIES, rng.randrange(3))],
+        }
+        if rng.random() < 0.8:
+            record["personalData"] = rng.random() < 0.5
+        if rng.random() < 0.8:
+            record["toValidate"] = rng.random() < 0.3
+        records.append(record)
+    return records
+
+
+def brute_force(records: list[dict], levels=None, max_level=None, personal_data=None, to_validate=None,
+                jurisdictions=0, exclude_jurisdictions=0, categories=None, activities=None) -> list[int]:
+    """Mêmes filtres que query(), évalués ligne par ligne."""
+    rows = []
+    for row, record in enumerate(records):
+        level = record["certificationLevel"]
+        mask = parse_location(record["dataLocation"])
+        record_categories = {category.casefold() for category in record["categories"]}
+        record_activities = {activity["name"].casefold() for activity in record["pedagogicalActivities"]}
+        if levels and level not in levels:
+            continue
+        if max_level is not None and not (level is not None and 1 <= level <= max_level):
+            continue
+        if personal_data is not None and record.get("personalData") is not personal_data:
+            continue
+        if to_validate is not None and record.get("toValidate", level is None) is not to_validate:
+            continue
+        if jurisdictions and not mask & jurisdictions:
+            continue
+        if mask & exclude_jurisdictions:
+            continue
+        if categories and not record_categories & {category.casefold() for category in categories}:
+            continue
+        if activities and not record_activities & {activity.casefold() for activity in activities}:
+            continue
+        rows.append(row)
+    return rows
+
+
+class QueryTest(unittest.TestCase):
+    def setUp(self):
+        self.records = random_records(random.Random(1), 300)
+        self.index = BitmapIndex.build(self.records)
+
+    def test_compound_filter(self):
+        # « niveau ≤ 2 ET sans données personnelles ET catégorie quiz »
+        result = query(self.index, max_level=2, personal_data=False, categories=["quiz"])
+        expected = brute_force(self.records, max_level=2, personal_data=False, categories=["Quiz"])
+        self.assertTrue(expected)
+        self.assertEqual(self.index.rows(result), expected)
+
+    def test_max_level_excludes_unrated_software(self):
+        records = [{"name": "Non évalué", "certificationLevel": 0}, {"name": "Vert", "certificationLevel": 1},
+                   {"name": "Sans niveau", "certificationLevel": None}, {"name": "Rouge", "certificationLevel": 3}]
+        index = BitmapIndex.build(records)
+        for max_level, expected in ((1, ["Vert"]), (3, ["Vert", "Rouge"])):
+            with self.subTest(max_level=max_level):
+                self.assertEqual([index.names[row] for row in index.rows(query(index, max_level=max_level))], expected)
+        # Le niveau 0 reste accessible explicitement
+        self.assertEqual(index.rows(query(index, levels=[0])), [0])
+
+    def test_random_filters_agree_with_a_brute_force_scan(self):
+        rng = random.Random(2)
+        flags = list(Jurisdictions)
+        for _ in range(300):
+            filters = {
+                "levels": rng.choice([None, rng.sample([0, 1, 2, 3], rng.randrange(1, 3))]),
+                "max_level": rng.choice([None, 1, 2, 3]),
+                "personal_data": rng.choice([None, True, False]),
+                "to_validate": rng.choice([None, True, False]),
+                "jurisdictions": rng.choice([0, int(rng.choice(flags)) | int(rng.choice(flags))]),
+                "exclude_jurisdictions": rng.choice([0, int(rng.choice(flags))]),
+                "categories": rng.choice([None, rng.sample(CATEGORIES, rng.randrange(1, 3))]),
+                "activities": rng.choice([None, [rng.choice(ACTIVITIES).upper()]]),
+            }
+            with self.subTest(filters=filters):
+                self.assertEqual(self.index.rows(query(self.index, **filters)), brute_force(self.records, **filters))
+
+    def test_rows_match_the_set_bits(self):
+        rng = random.Random(3)
+        for size in (0, 1, 7, 64, 65, 1000):
+            bitmap = rng.getrandbits(size) if size else 0
+            with self.subTest(size=size):
+                self.assertEqual(self.index.rows(bitmap), [row for row in range(size) if bitmap >> row & 1])
+
+
+class SaveLoadTest(unittest.TestCase):
+    def test_reloaded_only_for_the_same_source_stamp(self):
+        records = random_records(random.Random(4), 50)
+        index = BitmapIndex.build(records)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "index.marshal"
+            stamp = ("/tmp/classifications.ndjson", 1234, 1_700_000_000_000_000_000)
+            index.save(path, stamp)
+
+            loaded = BitmapIndex.load(path, stamp)
+            self.assertEqual((loaded.names, loaded.bitmaps, loaded.all), (index.names, index.bitmaps, index.all))
+            # Taille ou date de modification de la source différentes : index périmé
+            self.assertIsNone(BitmapIndex.load(path, (stamp[0], 1235, stamp[2])))
+            self.assertIsNone(BitmapIndex.load(path, (stamp[0], stamp[1], stamp[2] + 1)))
+            self.assertIsNone(BitmapIndex.load(Path(tmp) / "absent.marshal", stamp))
+            path.write_bytes(b"corrompu")
+            self.assertIsNone(BitmapIndex.load(path, stamp))
+
+
+if __name__ == "__main__":
+    unittest.main()
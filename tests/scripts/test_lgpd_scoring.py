@@ -0,0 +1,114 @@
+"""
+Tests du score à trois axes scripts/lgpd_scoring.py (règles, niveau global, flux NDJSON).
+
+    python3 -m unittest discover -s tests/scripts
+"""
+
+import io
+import itertools
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import support  # noqa: F401  (scripts/ dans sys.path)
+
+from lgpd_scoring import AXES, ScoringColumns, VendorAttributes, score_records, score_vendors
+from lgpd_scripts import load_script
+from lgpd_sources import normalize_row
+
+classify = load_script("classify-lgpd.py")
+
+
+def scores(*keys: str) -> dict[str, tuple[int, int, int, int]]:
+    """(hébergement, RGPD, collecte, niveau) calculés pour des éditeurs de la base de connaissances."""
+    index = classify.build_vendor_index()
+    scored = score_vendors({key: index[key] for key in keys})
+    return {key: tuple(scored[key][axis] for axis in (*AXES, "level")) for key in keys}
+
+
+class VendorAxesTest(unittest.TestCase):
+    def test_swiss_and_eu_hosting(self):
+        self.assertEqual(scores("Drive Infomaniak", "GeoGebra", "Exam.net"), {
+            "Drive Infomaniak": (1, 1, 1, 1),
+            "GeoGebra": (1, 1, 1, 1),
+            "Exam.net": (1, 1, 1, 1),
+        })
+
+    def test_eu_hosting_with_cloud_act_or_trackers(self):
+        self.assertEqual(scores("Genially", "Educaplay"), {
+            "Genially": (2, 1, 1, 2),  # AWS : Cloud Act
+            "Educaplay": (1, 1, 2, 2),  # analytics tiers
+        })
+
+    def test_united_states_with_dpf(self):
+        self.assertEqual(scores("Calendly", "Quizlet"), {"Calendly": (2, 2, 1, 2), "Quizlet": (2, 2, 1, 2)})
+
+    def test_united_states_without_dpf(self):
+        self.assertEqual(scores("Prezi", "BlueMail"), {"Prezi": (2, 3, 3, 3), "BlueMail": (2, 3, 3, 3)})
+
+    def test_china(self):
+        self.assertEqual(scores("CapCut", "LingoDeer"), {"CapCut": (3, 3, 1, 3), "LingoDeer": (3, 3, 1, 3)})
+
+    def test_non_adequate_country_with_dpf(self):
+        self.assertEqual(scores("Canva"), {"Canva": (3, 2, 1, 3)})
+
+    def test_institutional_dpa_overrides_jurisdiction(self):
+        self.assertEqual(scores("Microsoft"), {"Microsoft": (1, 1, 1, 1)})
+
+
+class LevelTest(unittest.TestCase):
+    def test_level_is_the_max_of_the_axes_for_every_vendor(self):
+        for key, score in score_vendors(classify.build_vendor_index()).items():
+            with self.subTest(vendor=key):
+                self.assertEqual(score["level"], max(score[axis] for axis in AXES))
+
+    def test_level_is_the_max_for_every_attribute_combination(self):
+        locations = ["Suisse", "Union Européenne", "Canada", "États-Unis", "Chine", "Inconnu"]
+        attributes = [VendorAttributes(country, location, *flags)
+                      for country, location in itertools.product(locations, repeat=2)
+                      for flags in itertools.product((False, True), repeat=6)]
+        columns = ScoringColumns(attributes).score()
+        self.assertEqual(len(columns["level"]), len(attributes))
+        for row in range(len(attributes)):
+            self.assertEqual(columns["level"][row], max(columns[axis][row] for axis in AXES))
+        self.assertEqual(set(columns["level"]), {1, 2, 3})
+
+    def test_empty_catalog(self):
+        self.assertEqual(ScoringColumns([]).score(), {"hosting": b"", "rgpd": b"", "dataCollection": b"", "level": b""})
+
+
+class ScoreRecordsTest(unittest.TestCase):
+    def score(self, records: list) -> list[dict]:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "logiciels.ndjson"
+            path.write_text("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records),
+                            encoding="utf-8")
+            output = io.StringIO()
+            with redirect_stdout(output):
+                score_records(classify, str(path))
+        return [json.loads(line) for line in output.getvalue().splitlines()]
+
+    def test_csv_signal_axes_are_never_read_as_scores(self):
+        # Ligne CSV : signal R → lgpd {3, 3, 3} pour un éditeur suisse
+        csv_record = normalize_row({"name": "Drive Infomaniak", "signal": "R", "location": "Suisse"})
+        self.assertEqual(csv_record["lgpd"], {"hosting": 3, "rgpd": 3, "dataCollection": 3})
+        unknown = normalize_row({"name": "Logiciel inconnu", "signal": "V", "location": "Suisse"})
+
+        scored, unscored = self.score([csv_record, unknown])
+        self.assertEqual(scored["lgpdScores"], {"hosting": 1, "rgpd": 1, "dataCollection": 1})
+        self.assertEqual(scored["certificationLevel"], 1)
+        self.assertEqual((unscored["lgpdScores"], unscored["certificationLevel"]), (None, None))
+        # Les champs du CSV sont conservés tels quels
+        self.assertEqual(scored["lgpd"], csv_record["lgpd"])
+
+    def test_names_and_objects(self):
+        records = self.score(["CapCut", {"name": "Calendly", "id": 7}])
+        self.assertEqual([(record["name"], record["certificationLevel"]) for record in records],
+                         [("CapCut", 3), ("Calendly", 2)])
+        self.assertEqual(records[1]["id"], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests de l'écriture des suggestions scripts/suggest_alternatives.py contre un Directus factice.
+
+    python3 -m unittest discover -s tests/scripts
+"""
+
+import io
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+import support  # noqa: F401  (scripts/ dans sys.path)
+from directus_stub import DirectusStub
+
+from lgpd_directus import DirectusClient
+from suggest_alternatives import push_suggestions
+
+
+def software(id: int, alternatives: list[int] = ()) -> dict:
+    """Item `software` avec sa relation `alternatives` (format lu par SOFTWARE_FIELDS)."""
+    return {"id": id, "alternatives": [{"alternative_id": {"id": alternative}} for alternative in alternatives]}
+
+
+SUGGESTIONS = {id: [(100 + id, 0.9), (200 + id, 0.5)] for id in range(1, 6)}
+
+
+class PushSuggestionsTest(unittest.TestCase):
+    def push(self, stub: DirectusStub, mirror: list[dict], **options) -> tuple[int, list, str]:
+        client = DirectusClient(stub.url, retries=0, backoff=0)
+        output = io.StringIO()
+        try:
+            with redirect_stdout(output), redirect_stderr(output):
+                count, failed = push_suggestions(client, mirror, SUGGESTIONS, **options)
+        finally:
+            client.close()
+        return count, failed, output.getvalue()
+
+    def test_fills_empty_lists_only(self):
+        mirror = [software(1), software(2, [7]), software(3)]
+        with DirectusStub({"software": mirror}) as stub:
+            count, failed, _ = self.push(stub, mirror)
+            self.assertEqual((count, failed), (2, []))
+            self.assertEqual([update["id"] for update in stub.requests_for("PATCH")[0].body], [1, 3])
+            self.assertEqual(stub.item("software", 1)["alternatives"], [{"alternative_id": 101}, {"alternative_id": 201}])
+
+    def test_lists_filled_since_the_mirror_are_not_overwritten(self):
+        # Miroir : listes vides ; Directus : l'item 2 a reçu une alternative à la main depuis
+        mirror = [software(1), software(2), software(3)]
+        current = [software(1), software(2, [42]), software(3)]
+        with DirectusStub({"software": current}) as stub:
+            count, _, output = self.push(stub, mirror)
+            self.assertEqual(count, 2)
+            self.assertEqual([update["id"] for update in stub.requests_for("PATCH")[0].body], [1, 3])
+            self.assertEqual(stub.item("software", 2)["alternatives"], [{"alternative_id": {"id": 42}}])
+            # Relecture limitée aux ids du lot
+            self.assertEqual(stub.requests_for("GET")[0].params["filter"], ['{"id": {"_in": [1, 2, 3]}}'])
+        self.assertIn("2: alternatives saisies entre-temps", output)
+
+    def test_failed_batch_is_reported_and_the_others_are_written(self):
+        mirror = [software(id) for id in range(1, 6)]
+        with DirectusStub({"software": mirror}) as stub:
+            # Lots [1, 2], [3, 4], [5] : le PATCH du premier lot échoue, les suivants passent
+            stub.fail_next(500, method="PATCH")
+            count, failed, output = self.push(stub, mirror, batch_size=2)
+
+            self.assertEqual((count, failed), (3, [1, 2]))
+            self.assertEqual([[update["id"] for update in request.body] for request in stub.requests_for("PATCH")],
+                             [[1, 2], [3, 4], [5]])
+            self.assertEqual(stub.item("software", 1)["alternatives"], [])
+            self.assertEqual(stub.item("software", 5)["alternatives"], [{"alternative_id": 105}, {"alternative_id": 205}])
+        self.assertIn("❌ Lot de 2 logiciels en échec", output)
+        self.assertIn("ids: 1, 2", output)
+
+    def test_dry_run_reads_but_does_not_write(self):
+        mirror = [software(1), software(2)]
+        with DirectusStub({"software": [software(1), software(2, [9])]}) as stub:
+            count, failed, output = self.push(stub, mirror, dry_run=True)
+            self.assertEqual((count, failed), (1, []))
+            self.assertEqual(stub.requests_for("PATCH"), [])
+        self.assertIn("[DRY] 1: 2 alternatives", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
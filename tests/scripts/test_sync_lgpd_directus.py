@@ -0,0 +1,238 @@
+"""
+Tests de scripts/sync-lgpd-directus.py et du client scripts/lgpd_directus.py contre un Directus factice.
+
+    python3 -m unittest discover -s tests/scripts
+"""
+
+import io
+import json
+import tempfile
+import unittest
+from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+import support  # noqa: F401  (scripts/ dans sys.path)
+from directus_stub import DirectusStub
+
+from lgpd_directus import DirectusClient, DirectusError
+from lgpd_scripts import load_script
+
+sync_script = load_script("sync-lgpd-directus.py")
+
+
+def software(id: int, name: str, level: int, data_location: str = "switzerland", notes: str | None = None) -> dict:
+    """Item Directus `software` avec les champs synchronisés."""
+    return {"id": id, "name": name, "lgpd_hosting": level, "lgpd_rgpd": level, "lgpd_data_collection": level,
+            "data_location": data_location, "notes": notes}
+
+
+class SyncTestCase(unittest.TestCase):
+    """Lance sync() sur un flux NDJSON écrit dans un dossier temporaire."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def run_sync(self, stub: DirectusStub, records: list[dict], batch_size: int = 100, concurrency: int = 2) -> str:
+        path = Path(self.tmp.name) / "classifications.ndjson"
+        path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+        args = Namespace(input=str(path), url=stub.url, batch_size=batch_size, concurrency=concurrency,
+                         retries=3, dry_run=False)
+        output = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(io.StringIO()):
+            sync_script.sync(args)
+        return output.getvalue()
+
+
+class ReadItemsTest(unittest.TestCase):
+    def test_reads_every_page(self):
+        items = [software(id, f"Logiciel {id}", 1) for id in range(1, 1204)]
+        with DirectusStub({"software": items}) as stub:
+            client = DirectusClient(stub.url)
+            try:
+                read = list(client.read_items("software", ["id", "name"], page_size=500))
+            finally:
+                client.close()
+            requests = stub.requests_for("GET")
+
+        self.assertEqual([item["id"] for item in read], list(range(1, 1204)))
+        self.assertEqual([request.params["page"] for request in requests], [["1"], ["2"], ["3"]])
+        self.assertTrue(all(request.params["limit"] == ["500"] for request in requests))
+
+    def test_stops_after_a_full_last_page(self):
+        items = [software(id, f"Logiciel {id}", 1) for id in range(1, 11)]
+        with DirectusStub({"software": items}) as stub:
+            client = DirectusClient(stub.url)
+            try:
+                read = list(client.read_items("software", ["id"], page_size=5))
+            finally:
+                client.close()
+            # Une page pleine ne dit pas que c'est la dernière : une page vide de plus
+            self.assertEqual(len(stub.requests_for("GET")), 3)
+        self.assertEqual(len(read), 10)
+
+
+class ChangedOnlyTest(SyncTestCase):
+    def test_patches_only_changed_items_and_fields(self):
+        items = [
+            software(1, "Canva", 3, "united_states", "INTERDIT"),
+            software(2, "Kahoot", 2, "eu_eea", "Usage avec précautions"),
+            software(3, "GeoGebra", 1, "eu_eea", "Usage autorisé"),
+        ]
+        records = [
+            # Inchangé
+            {"name": "Canva", "certificationLevel": 3, "dataLocation": "États-Unis", "usageNotes": "INTERDIT"},
+            # Niveau seulement
+            {"name": "kahoot", "certificationLevel": 1, "dataLocation": "Union Européenne",
+             "usageNotes": "Usage avec précautions"},
+            # Notes seulement
+            {"name": "GeoGebra", "certificationLevel": 1, "dataLocation": "Union Européenne", "usageNotes": "Nouveau"},
+            {"name": "Absent", "certificationLevel": 2},
+            {"name": "Non classifié", "certificationLevel": None},
+        ]
+        with DirectusStub({"software": items}) as stub:
+            output = self.run_sync(stub, records)
+            patches = [update for request in stub.requests_for("PATCH") for update in request.body]
+
+            self.assertEqual(sorted(patches, key=lambda update: update["id"]), [
+                {"id": 2, "lgpd_hosting": 1, "lgpd_rgpd": 1, "lgpd_data_collection": 1},
+                {"id": 3, "notes": "Nouveau"},
+            ])
+            self.assertIn("Non trouvé dans Directus: Absent", output)
+
+            # Deuxième passe : Directus est à jour, aucune écriture
+            self.run_sync(stub, records)
+            self.assertEqual(len(stub.requests_for("PATCH")), 1)
+
+    def test_fields_absent_from_the_record_are_not_sent(self):
+        items = [software(1, "Canva", 3, "switzerland", "Notes de production")]
+        records = [{"name": "Canva", "data_location": "united_states", "notes": None,
+                    "lgpdScores": {"hosting": 2, "rgpd": 2, "dataCollection": 1}, "certificationLevel": 2}]
+        with DirectusStub({"software": items}) as stub:
+            self.run_sync(stub, records)
+            self.assertEqual(stub.requests_for("PATCH")[0].body,
+                             [{"id": 1, "lgpd_hosting": 2, "lgpd_rgpd": 2, "lgpd_data_collection": 1}])
+            self.assertEqual(stub.item("software", 1)["data_location"], "switzerland")
+            self.assertEqual(stub.item("software", 1)["notes"], "Notes de production")
+
+    def test_source_axes_do_not_override_the_classification(self):
+        items = [software(1, "ZAPIER", 3)]
+        # Axes V/O/R du CSV (lgpd_sources.normalize_row), niveau du classifieur
+        records = [{"name": "ZAPIER", "lgpd": {"hosting": 3, "rgpd": 3, "dataCollection": 3},
+                    "certificationLevel": 1}]
+        with DirectusStub({"software": items}) as stub:
+            self.run_sync(stub, records)
+            self.assertEqual(stub.item("software", 1)["lgpd_hosting"], 1)
+
+
+class DataLocationTest(SyncTestCase):
+    # Valeurs du classifieur → catégorie attendue (scripts/data-location-mapping.ts)
+    EXPECTED = {
+        "Canada/Chine": "other",
+        "Local": "switzerland",
+        "Local/États-Unis": "multi_or_partial",
+        "Union Européenne/États-Unis": "multi_or_partial",
+        "Royaume-Uni/États-Unis": "multi_or_partial",
+        "États-Unis/Australie": "multi_or_partial",
+        "Union Européenne/Global": "multi_or_partial",
+        "États-Unis (option UE)": "united_states",
+        "Suisse/Luxembourg": "switzerland",
+        "Israël": "adequate",
+    }
+
+    def test_classifier_locations_reach_directus_exactly(self):
+        names = list(self.EXPECTED)
+        items = [software(id, name, 1, "eu_eea") for id, name in enumerate(names, 1)]
+        records = [{"name": name, "certificationLevel": 1, "dataLocation": name} for name in names]
+        with DirectusStub({"software": items}) as stub:
+            self.run_sync(stub, records)
+            pushed = {stub.item("software", id)["name"]: stub.item("software", id)["data_location"]
+                      for id in range(1, len(names) + 1)}
+        self.assertEqual(pushed, self.EXPECTED)
+
+    def test_unknown_location_is_not_sent(self):
+        items = [software(1, "Canva", 2, "switzerland")]
+        records = [{"name": "Canva", "certificationLevel": 3, "dataLocation": "États-Unis/Union Européenne"}]
+        with DirectusStub({"software": items}) as stub:
+            self.run_sync(stub, records)
+            self.assertNotIn("data_location", stub.requests_for("PATCH")[0].body[0])
+            self.assertEqual(stub.item("software", 1)["data_location"], "switzerland")
+
+
+class BatchTest(SyncTestCase):
+    def test_patches_in_batches(self):
+        items = [software(id, f"Logiciel {id}", 3) for id in range(1, 6)]
+        records = [{"name": f"Logiciel {id}", "certificationLevel": 1} for id in range(1, 6)]
+        with DirectusStub({"software": items}) as stub:
+            output = self.run_sync(stub, records, batch_size=2)
+            batches = [request.body for request in stub.requests_for("PATCH")]
+
+            self.assertEqual(sorted(len(batch) for batch in batches), [1, 2, 2])
+            self.assertEqual(sorted(update["id"] for batch in batches for update in batch), [1, 2, 3, 4, 5])
+            self.assertTrue(all(stub.item("software", id)["lgpd_rgpd"] == 1 for id in range(1, 6)))
+        self.assertIn("5 items mis à jour en 3 requêtes", output)
+
+
+class RetryTest(unittest.TestCase):
+    def test_retries_on_5xx_and_429(self):
+        with DirectusStub({"software": [software(1, "Canva", 3)]}) as stub:
+            client = DirectusClient(stub.url, retries=3, backoff=0)
+            try:
+                stub.fail_next(503, 429)
+                client.update_items("software", [{"id": 1, "lgpd_hosting": 1}])
+            finally:
+                client.close()
+            self.assertEqual(len(stub.requests_for("PATCH")), 3)
+            self.assertEqual(stub.item("software", 1)["lgpd_hosting"], 1)
+
+    def test_gives_up_after_the_last_retry(self):
+        with DirectusStub({"software": [software(1, "Canva", 3)]}) as stub:
+            client = DirectusClient(stub.url, retries=1, backoff=0)
+            try:
+                stub.fail_next(500, 502)
+                with self.assertRaisesRegex(DirectusError, "502"):
+                    client.update_items("software", [{"id": 1, "lgpd_hosting": 1}])
+            finally:
+                client.close()
+            self.assertEqual(len(stub.requests_for("PATCH")), 2)
+
+    def test_client_errors_are_not_retried(self):
+        with DirectusStub({"software": []}) as stub:
+            client = DirectusClient(stub.url, retries=3, backoff=0)
+            try:
+                with self.assertRaisesRegex(DirectusError, "404"):
+                    client.update_items("inconnue", [{"id": 1}])
+            finally:
+                client.close()
+            self.assertEqual(len(stub.requests), 1)
+
+
+class PoolTest(unittest.TestCase):
+    def test_sequential_requests_share_one_connection(self):
+        with DirectusStub({"software": [software(1, "Canva", 3)]}) as stub:
+            client = DirectusClient(stub.url, pool_size=4)
+            try:
+                for level in range(10):
+                    client.update_items("software", [{"id": 1, "notes": str(level)}])
+            finally:
+                client.close()
+            self.assertEqual(len({request.connection for request in stub.requests}), 1)
+
+    def test_concurrent_requests_stay_within_the_pool(self):
+        items = [software(id, f"Logiciel {id}", 3) for id in range(1, 41)]
+        with DirectusStub({"software": items}) as stub:
+            client = DirectusClient(stub.url, pool_size=2)
+            try:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    list(executor.map(lambda id: client.update_items("software", [{"id": id, "lgpd_rgpd": 1}]),
+                                      range(1, 41)))
+            finally:
+                client.close()
+            self.assertEqual(len(stub.requests_for("PATCH")), 40)
+            self.assertLessEqual(len({request.connection for request in stub.requests}), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
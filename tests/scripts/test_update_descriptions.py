@@ -0,0 +1,80 @@
+"""
+Tests de la réécriture en flux scripts/update_descriptions.py.
+
+    python3 -m unittest discover -s tests/scripts
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import support  # noqa: F401  (scripts/ dans sys.path)
+
+from update_descriptions import GENERIC_DESCRIPTION, update_descriptions
+
+CATALOG = '''export const softwareList: Software[] = [
+  {
+    id: "1",
+    name: "Alpha",
+    shortDescription: "Outil Alpha",
+    certificationLevel: 1,
+  },
+  {
+    id: "2",
+    name: "Beta",
+    shortDescription: "Outil Beta",
+    description: "Ancienne description",
+    certificationLevel: 2,
+    description: "Doublon",
+  },
+  {
+    id: "3",
+    name: "Gamma",
+    shortDescription: "Outil Gamma",
+    description: "Description saisie à la main",
+  },
+]
+'''
+
+DESCRIPTIONS = {"Beta": "Beta, l'outil de référence."}
+
+
+class UpdateDescriptionsTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.catalog = self.dir / "software-list.ts"
+        self.catalog.write_text(CATALOG, encoding="utf-8")
+
+    def test_first_run(self):
+        stats = update_descriptions(self.catalog, DESCRIPTIONS)
+        content = self.catalog.read_text(encoding="utf-8")
+
+        self.assertEqual(stats, {"ajoutées": 1, "remplacées": 1, "retirées": 1})
+        self.assertIn(f'shortDescription: "Outil Alpha",\n    description: "{GENERIC_DESCRIPTION.format("Outil Alpha")}",\n',
+                      content)
+        self.assertIn('description: "Beta, l\'outil de référence.",\n    certificationLevel: 2,\n  },', content)
+        self.assertIn('description: "Description saisie à la main",', content)
+        self.assertNotIn("Doublon", content)
+
+    def test_second_run_is_byte_identical(self):
+        update_descriptions(self.catalog, DESCRIPTIONS)
+        first = self.catalog.read_bytes()
+        stamp = self.catalog.stat().st_mtime_ns
+
+        stats = update_descriptions(self.catalog, DESCRIPTIONS)
+        self.assertEqual(stats, {"ajoutées": 0, "remplacées": 0, "retirées": 0})
+        self.assertEqual(self.catalog.read_bytes(), first)
+        # Rien à changer : le catalogue n'est pas remplacé
+        self.assertEqual(self.catalog.stat().st_mtime_ns, stamp)
+        self.assertEqual([child.name for child in self.dir.iterdir()], ["software-list.ts"])
+
+    def test_file_mode_is_kept(self):
+        self.catalog.chmod(0o640)
+        update_descriptions(self.catalog, DESCRIPTIONS)
+        self.assertEqual(self.catalog.stat().st_mode & 0o777, 0o640)
+
+
+if __name__ == "__main__":
+    unittest.main()